@@ -27,6 +27,13 @@ public class Interview : BaseDbModel
     [MaxLength(500)]
     public string? TranscriptUrl { get; set; }
 
+    /// <summary>
+    /// Conversation id taken from TranscriptUrl (.../conversations/conv_{id}).
+    /// Persisted computed column, indexed for transcript webhook lookups.
+    /// </summary>
+    [MaxLength(128)]
+    public string? ConversationId { get; set; }
+
     public DateTimeOffset? StartedAt { get; set; }
     
     public DateTimeOffset? CompletedAt { get; set; }
@@ -0,0 +1,110 @@
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Recruiter.Infrastructure.Migrations
+{
+    /// <inheritdoc />
+    public partial class Add_Filtered_Active_Indexes_For_Profile_Data : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Profile reads only touch live rows; soft-deleted history from earlier CV runs
+            // stays out of these indexes
+            migrationBuilder.CreateIndex(
+                name: "IX_KeyStrengths_UserProfileId_Active",
+                table: "KeyStrengths",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Skills_UserProfileId_Active",
+                table: "Skills",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Experiences_UserProfileId_Active",
+                table: "Experiences",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Educations_UserProfileId_Active",
+                table: "Educations",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_AwardsAchievements_UserProfileId_Active",
+                table: "AwardsAchievements",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_CertificationsLicenses_UserProfileId_Active",
+                table: "CertificationsLicenses",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Summaries_UserProfileId_Active",
+                table: "Summaries",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_VolunteerExtracurricular_UserProfileId_Active",
+                table: "VolunteerExtracurricular",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_ProjectsResearch_UserProfileId_Active",
+                table: "ProjectsResearch",
+                column: "UserProfileId",
+                filter: "[IsDeleted] = 0");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_KeyStrengths_UserProfileId_Active",
+                table: "KeyStrengths");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Skills_UserProfileId_Active",
+                table: "Skills");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Experiences_UserProfileId_Active",
+                table: "Experiences");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Educations_UserProfileId_Active",
+                table: "Educations");
+
+            migrationBuilder.DropIndex(
+                name: "IX_AwardsAchievements_UserProfileId_Active",
+                table: "AwardsAchievements");
+
+            migrationBuilder.DropIndex(
+                name: "IX_CertificationsLicenses_UserProfileId_Active",
+                table: "CertificationsLicenses");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Summaries_UserProfileId_Active",
+                table: "Summaries");
+
+            migrationBuilder.DropIndex(
+                name: "IX_VolunteerExtracurricular_UserProfileId_Active",
+                table: "VolunteerExtracurricular");
+
+            migrationBuilder.DropIndex(
+                name: "IX_ProjectsResearch_UserProfileId_Active",
+                table: "ProjectsResearch");
+        }
+    }
+}
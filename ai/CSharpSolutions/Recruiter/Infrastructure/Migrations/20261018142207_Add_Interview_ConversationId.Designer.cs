@@ -0,0 +1,7143 @@
+﻿// <auto-generated />
+using System;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Metadata;
+using Microsoft.EntityFrameworkCore.Migrations;
+using Microsoft.EntityFrameworkCore.Storage.ValueConversion;
+using Recruiter.Infrastructure.Repository;
+
+#nullable disable
+
+namespace Recruiter.Infrastructure.Migrations
+{
+    [DbContext(typeof(RecruiterDbContext))]
+    [Migration("20261018142207_Add_Interview_ConversationId")]
+    partial class Add_Interview_ConversationId
+    {
+        /// <inheritdoc />
+        protected override void BuildTargetModel(ModelBuilder modelBuilder)
+        {
+#pragma warning disable 612, 618
+            modelBuilder
+                .HasAnnotation("ProductVersion", "10.0.1")
+                .HasAnnotation("Relational:MaxIdentifierLength", 128);
+
+            SqlServerModelBuilderExtensions.UseIdentityColumns(modelBuilder);
+
+            modelBuilder.Entity("Recruiter.Domain.Models.AwardAchievement", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("Issuer")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Title")
+                        .IsRequired()
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<int?>("Year")
+                        .HasColumnType("int");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Title");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_AwardsAchievements_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("AwardsAchievements");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Candidate", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<string>("CandidateId")
+                        .IsRequired()
+                        .HasMaxLength(20)
+                        .HasColumnType("nvarchar(20)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid?>("CvFileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("CvFileId");
+
+                    b.HasIndex("UserId")
+                        .IsUnique();
+
+                    b.ToTable("Candidates");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CertificationLicense", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<DateTime?>("DateIssued")
+                        .HasColumnType("datetime2");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("Issuer")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Name")
+                        .IsRequired()
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTime?>("ValidUntil")
+                        .HasColumnType("datetime2");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Name");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_CertificationsLicenses_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("CertificationsLicenses");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Comment", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<string>("Content")
+                        .IsRequired()
+                        .HasMaxLength(1000)
+                        .HasColumnType("nvarchar(1000)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid>("EntityId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("EntityType")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("ParentCommentId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("ParentCommentId");
+
+                    b.HasIndex("EntityId", "EntityType");
+
+                    b.ToTable("Comments");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Country", b =>
+                {
+                    b.Property<string>("CountryCode")
+                        .HasMaxLength(2)
+                        .HasColumnType("nchar(2)")
+                        .IsFixedLength();
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataCenterRegion")
+                        .IsRequired()
+                        .HasMaxLength(60)
+                        .HasColumnType("nvarchar(60)");
+
+                    b.Property<bool>("IsActive")
+                        .HasColumnType("bit");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool>("IsEuMember")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("Name")
+                        .IsRequired()
+                        .HasMaxLength(60)
+                        .HasColumnType("nvarchar(60)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("CountryCode");
+
+                    b.ToTable("Country");
+
+                    b.HasData(
+                        new
+                        {
+                            CountryCode = "AF",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Afghanistan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Albania",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "DZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Algeria",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Andorra",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Angola",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Antigua and Barbuda",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Argentina",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Armenia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Australia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Austria",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Azerbaijan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Bahamas",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Bahrain",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Bangladesh",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BB",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Barbados",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Belarus",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Belgium",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Belize",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BJ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Benin",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Bhutan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Bolivia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Bosnia and Herzegovina",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Botswana",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Brazil",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Brunei Darussalam",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Bulgaria",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BF",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Burkina Faso",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "BI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Burundi",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CV",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Cabo Verde",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Cambodia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Cameroon",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Canada",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CF",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Central African Republic",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Chad",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Chile",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "China",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Colombia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Comoros",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Congo",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Democratic Republic of the Congo",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Costa Rica",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Côte d'Ivoire",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "HR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Croatia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Cuba",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Cyprus",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Czechia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "DK",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Denmark",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "DJ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Djibouti",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "DM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Dominica",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "DO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Dominican Republic",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "EC",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Ecuador",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "EG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Egypt",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SV",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "El Salvador",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GQ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Equatorial Guinea",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ER",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Eritrea",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "EE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Estonia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Eswatini",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ET",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Ethiopia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "FJ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Fiji",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "FI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Finland",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "FR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "France",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Gabon",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Gambia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Georgia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "DE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Germany",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Ghana",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Greece",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Grenada",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Guatemala",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Guinea",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Guinea-Bissau",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Guyana",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "HT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Haiti",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "HN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Honduras",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "HK",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Hong Kong",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "HU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Hungary",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Iceland",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "India",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ID",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Indonesia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Iran",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IQ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Iraq",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Ireland",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Israel",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "IT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Italy",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "JM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Jamaica",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "JP",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Japan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "JO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Jordan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Kazakhstan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Kenya",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Kiribati",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KP",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "North Korea",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "South Korea",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Kuwait",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Kyrgyzstan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Lao People's Democratic Republic",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LV",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Latvia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LB",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Lebanon",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Lesotho",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Liberia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Libya",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Liechtenstein",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Lithuania",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Luxembourg",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Macao",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Madagascar",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Malawi",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Malaysia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MV",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Maldives",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ML",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Mali",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Malta",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Marshall Islands",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Mauritania",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Mauritius",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MX",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Mexico",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "FM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Micronesia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Moldova",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MC",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Monaco",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Mongolia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ME",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Montenegro",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Morocco",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Mozambique",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Myanmar",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Namibia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Nauru",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NP",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Nepal",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Netherlands",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "New Zealand",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Nicaragua",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Niger",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Nigeria",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "MK",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "North Macedonia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "NO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Norway",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "OM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Oman",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PK",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Pakistan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Palau",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Palestine",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Panama",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Papua New Guinea",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Paraguay",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Peru",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Philippines",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Poland",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Portugal",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "PR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Puerto Rico",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "QA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Qatar",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "RO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Romania",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "RU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Russian Federation",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "RW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Rwanda",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "KN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Saint Kitts and Nevis",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LC",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Saint Lucia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "VC",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Saint Vincent and the Grenadines",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "WS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Samoa",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "San Marino",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ST",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Sao Tome and Principe",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Saudi Arabia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Senegal",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "RS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Serbia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SC",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Seychelles",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Sierra Leone",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Singapore",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SK",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Slovakia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SI",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Slovenia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SB",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Solomon Islands",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Somalia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ZA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "South Africa",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SS",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "South Sudan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ES",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Spain",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "LK",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Sri Lanka",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SD",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Sudan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Suriname",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = true,
+                            Name = "Sweden",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "CH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Switzerland",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "SY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Syrian Arab Republic",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Taiwan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TJ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Tajikistan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Tanzania",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TH",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Thailand",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TL",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Timor-Leste",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Togo",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TO",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Tonga",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TT",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Trinidad and Tobago",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Tunisia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TR",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Turkey",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Turkmenistan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "TV",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Tuvalu",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "UG",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Uganda",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "UA",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Ukraine",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "AE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "United Arab Emirates",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "GB",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Europe",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "United Kingdom",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "US",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "United States of America",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "UY",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Uruguay",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "UZ",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Uzbekistan",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "VU",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Oceania",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Vanuatu",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "VE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Americas",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Venezuela",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "VN",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Viet Nam",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "YE",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Asia",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Yemen",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ZM",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Zambia",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        },
+                        new
+                        {
+                            CountryCode = "ZW",
+                            CreatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            CreatedBy = "System",
+                            DataCenterRegion = "Africa",
+                            IsActive = true,
+                            IsDeleted = false,
+                            IsEuMember = false,
+                            Name = "Zimbabwe",
+                            UpdatedAt = new DateTimeOffset(new DateTime(2026, 2, 6, 0, 0, 0, 0, DateTimeKind.Unspecified), new TimeSpan(0, 0, 0, 0, 0)),
+                            UpdatedBy = "System"
+                        });
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CountryExposureSet", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("Canonical")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(450)");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("Canonical")
+                        .IsUnique();
+
+                    b.ToTable("CountryExposureSets", (string)null);
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CountryExposureSetCountry", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("CountryCode")
+                        .IsRequired()
+                        .HasMaxLength(2)
+                        .HasColumnType("nchar(2)")
+                        .IsFixedLength();
+
+                    b.Property<Guid>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryCode");
+
+                    b.HasIndex("CountryExposureSetId", "CountryCode")
+                        .IsUnique();
+
+                    b.ToTable("CountryExposureSetCountries", (string)null);
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CvEvaluation", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid>("FileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("ModelUsed")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("PromptCategory")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("PromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("ResponseJson")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("FileId");
+
+                    b.HasIndex("PromptCategory");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex("UserProfileId", "FileId");
+
+                    b.ToTable("CvEvaluations");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Education", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Degree")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<DateTime?>("EndDate")
+                        .HasColumnType("datetime2");
+
+                    b.Property<string>("FieldOfStudy")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("Institution")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Location")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTime?>("StartDate")
+                        .HasColumnType("datetime2");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Degree");
+
+                    b.HasIndex("Institution");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Educations_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("Educations");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.EntitySyncConfiguration", b =>
+                {
+                    b.Property<string>("EntityTypeName")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<bool>("AllowSanitizationOverrideConsent")
+                        .HasColumnType("bit");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataClassification")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DependsOnEntities")
+                        .HasMaxLength(512)
+                        .HasColumnType("nvarchar(512)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool>("IsEnabled")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LegalBasis")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("LegalBasisRef")
+                        .HasMaxLength(256)
+                        .HasColumnType("nvarchar(256)");
+
+                    b.Property<string>("Notes")
+                        .HasMaxLength(1024)
+                        .HasColumnType("nvarchar(1024)");
+
+                    b.Property<string>("ProcessingPurpose")
+                        .IsRequired()
+                        .HasMaxLength(256)
+                        .HasColumnType("nvarchar(256)");
+
+                    b.Property<bool>("RequiresSanitizationForGlobalSync")
+                        .HasColumnType("bit");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<string>("SyncScope")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("TableName")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("EntityTypeName");
+
+                    b.HasIndex("IsEnabled");
+
+                    b.ToTable("EntitySyncConfigurations");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Experience", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<DateTime?>("EndDate")
+                        .HasColumnType("datetime2");
+
+                    b.Property<string>("Industry")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Location")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("Organization")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTime?>("StartDate")
+                        .HasColumnType("datetime2");
+
+                    b.Property<string>("Title")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Organization");
+
+                    b.HasIndex("StartDate");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Experiences_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("Experiences");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Feedback", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Detailed")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid>("InterviewId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Strengths")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Summary")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("Weaknesses")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("InterviewId")
+                        .IsUnique();
+
+                    b.ToTable("Feedbacks");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.File", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<string>("Container")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Extension")
+                        .IsRequired()
+                        .HasMaxLength(10)
+                        .HasColumnType("nvarchar(10)");
+
+                    b.Property<string>("FilePath")
+                        .IsRequired()
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<string>("FolderPath")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<int>("MbSize")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("StorageAccountName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("Container");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Extension");
+
+                    b.HasIndex("FolderPath");
+
+                    b.HasIndex("Container", "FolderPath");
+
+                    b.ToTable("Files");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Interview", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<DateTimeOffset?>("CompletedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("ConversationId")
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)")
+                        .HasComputedColumnSql("CAST(SUBSTRING(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), 1, PATINDEX('%[/?#]%', CONCAT(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), '/')) - 1) AS nvarchar(128))", true);
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<long?>("Duration")
+                        .HasColumnType("bigint");
+
+                    b.Property<string>("InstructionPromptName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("InstructionPromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("InterviewAudioUrl")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<string>("InterviewConfigurationName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("InterviewConfigurationVersion")
+                        .HasColumnType("int");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<Guid>("JobApplicationStepId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("PersonalityPromptName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("PersonalityPromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("QuestionsPromptName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("QuestionsPromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("StartedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("TranscriptUrl")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("ConversationId")
+                        .HasFilter("[ConversationId] IS NOT NULL");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("InstructionPromptName");
+
+                    b.HasIndex("JobApplicationStepId")
+                        .IsUnique();
+
+                    b.HasIndex("PersonalityPromptName");
+
+                    b.HasIndex("QuestionsPromptName");
+
+                    b.HasIndex("InstructionPromptName", "InstructionPromptVersion");
+
+                    b.HasIndex("InterviewConfigurationName", "InterviewConfigurationVersion");
+
+                    b.HasIndex("PersonalityPromptName", "PersonalityPromptVersion");
+
+                    b.HasIndex("QuestionsPromptName", "QuestionsPromptVersion");
+
+                    b.ToTable("Interviews");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.InterviewConfiguration", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<bool>("Active")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(true);
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<int?>("Duration")
+                        .HasColumnType("int");
+
+                    b.Property<string>("FocusArea")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("InstructionPromptName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("InstructionPromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("Language")
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Modality")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<string>("PersonalityPromptName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("PersonalityPromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("ProbingDepth")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("QuestionsPromptName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("QuestionsPromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Tone")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("Active");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("InstructionPromptName");
+
+                    b.HasIndex("Modality");
+
+                    b.HasIndex("PersonalityPromptName");
+
+                    b.HasIndex("QuestionsPromptName");
+
+                    b.HasIndex("InstructionPromptName", "InstructionPromptVersion");
+
+                    b.HasIndex("PersonalityPromptName", "PersonalityPromptVersion");
+
+                    b.HasIndex("QuestionsPromptName", "QuestionsPromptVersion");
+
+                    b.ToTable("InterviewConfigurations");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplication", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid>("CandidateId")
+                        .HasMaxLength(255)
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset?>("CompletedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("JobPostName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("JobPostVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("StartedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CandidateId");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("JobPostName", "JobPostVersion");
+
+                    b.ToTable("JobApplications");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplicationStep", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<DateTimeOffset?>("CompletedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("Data")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<Guid>("JobApplicationId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("JobPostStepName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("JobPostStepVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("StartedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Status")
+                        .IsRequired()
+                        .ValueGeneratedOnAdd()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)")
+                        .HasDefaultValue("Pending");
+
+                    b.Property<int>("StepNumber")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("JobApplicationId");
+
+                    b.HasIndex("Status");
+
+                    b.HasIndex("JobPostStepName", "JobPostStepVersion");
+
+                    b.ToTable("JobApplicationSteps");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplicationStepFiles", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid>("FileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<Guid>("JobApplicationStepId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("FileId");
+
+                    b.HasIndex("JobApplicationStepId");
+
+                    b.HasIndex("FileId", "JobApplicationStepId")
+                        .IsUnique();
+
+                    b.ToTable("JobApplicationStepFiles");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPost", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("ExperienceLevel")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("JobDescription")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("JobTitle")
+                        .IsRequired()
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("JobType")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<int>("MaxAmountOfCandidatesRestriction")
+                        .HasColumnType("int");
+
+                    b.Property<string>("MinimumRequirements")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("OriginCountryCode")
+                        .HasMaxLength(2)
+                        .HasColumnType("nchar(2)")
+                        .IsFixedLength();
+
+                    b.Property<bool?>("PoliceReportRequired")
+                        .HasColumnType("bit");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Status")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("ExperienceLevel");
+
+                    b.HasIndex("JobType");
+
+                    b.HasIndex("OriginCountryCode");
+
+                    b.HasIndex("Name", "Version");
+
+                    b.ToTable("JobPosts");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPostStep", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DisplayContent")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DisplayTitle")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<string>("InterviewConfigurationName")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("InterviewConfigurationVersion")
+                        .HasColumnType("int");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool>("IsInterview")
+                        .HasColumnType("bit");
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Participant")
+                        .IsRequired()
+                        .ValueGeneratedOnAdd()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)")
+                        .HasDefaultValue("Candidate");
+
+                    b.Property<string>("PromptName")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("PromptVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("QuestionnaireTemplateName")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("QuestionnaireTemplateVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<bool>("ShowSpinner")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool>("ShowStepForCandidate")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(true);
+
+                    b.Property<string>("StepType")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("IsInterview");
+
+                    b.HasIndex("Participant");
+
+                    b.HasIndex("StepType");
+
+                    b.HasIndex("InterviewConfigurationName", "InterviewConfigurationVersion");
+
+                    b.HasIndex("PromptName", "PromptVersion");
+
+                    b.HasIndex("QuestionnaireTemplateName", "QuestionnaireTemplateVersion");
+
+                    b.ToTable("JobPostSteps");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPostStepAssignment", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("JobPostName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<string>("JobPostStepName")
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("JobPostStepVersion")
+                        .HasColumnType("int");
+
+                    b.Property<int>("JobPostVersion")
+                        .HasColumnType("int");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Status")
+                        .IsRequired()
+                        .ValueGeneratedOnAdd()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)")
+                        .HasDefaultValue("pending");
+
+                    b.Property<string>("StepName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("StepNumber")
+                        .HasColumnType("int");
+
+                    b.Property<int?>("StepVersion")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Status");
+
+                    b.HasIndex("JobPostName", "JobPostVersion");
+
+                    b.HasIndex("JobPostStepName", "JobPostStepVersion");
+
+                    b.HasIndex("StepName", "StepVersion");
+
+                    b.HasIndex("JobPostName", "JobPostVersion", "StepNumber");
+
+                    b.HasIndex("JobPostName", "JobPostVersion", "StepName", "StepVersion")
+                        .IsUnique()
+                        .HasFilter("[StepVersion] IS NOT NULL");
+
+                    b.ToTable("JobPostStepAssignments");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.KeyStrength", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("StrengthName")
+                        .IsRequired()
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("StrengthName");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_KeyStrengths_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("KeyStrengths");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.ProjectResearch", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Link")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<string>("Role")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("TechnologiesUsed")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<string>("Title")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Role");
+
+                    b.HasIndex("Title");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_ProjectsResearch_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("ProjectsResearch");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Prompt", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<string>("Category")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("Content")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Locale")
+                        .HasMaxLength(10)
+                        .HasColumnType("nvarchar(10)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Tags")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("Category");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Locale");
+
+                    b.ToTable("Prompts");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmission", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<Guid>("JobApplicationStepId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset?>("LastSavedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<decimal?>("MaxScore")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.Property<string>("PersonalityResultJson")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("QuestionnaireTemplateName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("QuestionnaireTemplateVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("StartedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Status")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<DateTimeOffset?>("SubmittedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("TemplateType")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<decimal?>("TotalScore")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("JobApplicationStepId")
+                        .IsUnique();
+
+                    b.HasIndex("QuestionnaireTemplateName", "QuestionnaireTemplateVersion");
+
+                    b.ToTable("QuestionnaireCandidateSubmissions");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmissionAnswer", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<string>("AnswerText")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<DateTimeOffset?>("AnsweredAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<int>("QuestionOrder")
+                        .HasColumnType("int");
+
+                    b.Property<string>("QuestionType")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<Guid>("QuestionnaireCandidateSubmissionId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("QuestionnaireQuestionName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("QuestionnaireQuestionVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<decimal?>("ScoreAwarded")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<decimal?>("WaSum")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("QuestionnaireQuestionName", "QuestionnaireQuestionVersion")
+                        .HasDatabaseName("IX_QCSAns_QQName_QQVer");
+
+                    b.HasIndex("QuestionnaireCandidateSubmissionId", "QuestionnaireQuestionName", "QuestionnaireQuestionVersion")
+                        .IsUnique()
+                        .HasDatabaseName("UX_QCSAns_Sub_QQName_QQVer");
+
+                    b.ToTable("QuestionnaireCandidateSubmissionAnswers");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmissionAnswerOption", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool?>("IsCorrect")
+                        .HasColumnType("bit");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid>("QuestionnaireCandidateSubmissionAnswerId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("QuestionnaireQuestionOptionName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("QuestionnaireQuestionOptionVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<decimal?>("Score")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<decimal?>("Wa")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("QuestionnaireQuestionOptionName", "QuestionnaireQuestionOptionVersion")
+                        .HasDatabaseName("IX_QCSAnsOpt_OptName_OptVer");
+
+                    b.HasIndex("QuestionnaireCandidateSubmissionAnswerId", "QuestionnaireQuestionOptionName", "QuestionnaireQuestionOptionVersion")
+                        .IsUnique()
+                        .HasDatabaseName("UX_QCSAnsOpt_Ans_OptName_OptVer");
+
+                    b.ToTable("QuestionnaireCandidateSubmissionAnswerOptions");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireQuestion", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsActive")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(true);
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool>("IsRequired")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("MediaFileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("MediaUrl")
+                        .HasMaxLength(1000)
+                        .HasColumnType("nvarchar(1000)");
+
+                    b.Property<int>("Order")
+                        .HasColumnType("int");
+
+                    b.Property<string>("QuestionText")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("QuestionType")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<Guid>("QuestionnaireSectionId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("TraitKey")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<decimal?>("Ws")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("MediaFileId")
+                        .IsUnique()
+                        .HasFilter("[MediaFileId] IS NOT NULL");
+
+                    b.HasIndex("QuestionnaireSectionId", "Order")
+                        .IsUnique()
+                        .HasFilter("[IsActive] = 1");
+
+                    b.ToTable("QuestionnaireQuestions");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireQuestionOption", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool?>("IsCorrect")
+                        .HasColumnType("bit");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("Label")
+                        .IsRequired()
+                        .HasMaxLength(1000)
+                        .HasColumnType("nvarchar(1000)");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<Guid?>("MediaFileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("MediaUrl")
+                        .HasMaxLength(1000)
+                        .HasColumnType("nvarchar(1000)");
+
+                    b.Property<int>("Order")
+                        .HasColumnType("int");
+
+                    b.Property<string>("QuestionnaireQuestionName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int?>("QuestionnaireQuestionVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<decimal?>("Score")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<decimal?>("Wa")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.Property<decimal?>("Weight")
+                        .HasPrecision(18, 4)
+                        .HasColumnType("decimal(18,4)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("MediaFileId")
+                        .IsUnique()
+                        .HasFilter("[MediaFileId] IS NOT NULL");
+
+                    b.HasIndex("QuestionnaireQuestionName", "QuestionnaireQuestionVersion", "Order")
+                        .IsUnique()
+                        .HasDatabaseName("UX_QQOpt_QQName_QQVer_Order")
+                        .HasFilter("[QuestionnaireQuestionVersion] IS NOT NULL");
+
+                    b.ToTable("QuestionnaireQuestionOptions");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireSection", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<int>("Order")
+                        .HasColumnType("int");
+
+                    b.Property<string>("QuestionnaireTemplateName")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("QuestionnaireTemplateVersion")
+                        .HasColumnType("int");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Title")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("QuestionnaireTemplateName", "QuestionnaireTemplateVersion", "Order")
+                        .IsUnique();
+
+                    b.ToTable("QuestionnaireSections");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireTemplate", b =>
+                {
+                    b.Property<string>("Name")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<int>("Version")
+                        .HasColumnType("int");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("PublishedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Status")
+                        .IsRequired()
+                        .ValueGeneratedOnAdd()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)")
+                        .HasDefaultValue("Draft");
+
+                    b.Property<string>("TemplateType")
+                        .IsRequired()
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<int?>("TimeLimitSeconds")
+                        .HasColumnType("int");
+
+                    b.Property<string>("Title")
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Name", "Version");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Status");
+
+                    b.HasIndex("TemplateType");
+
+                    b.ToTable("QuestionnaireTemplates");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Score", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<double>("Average")
+                        .HasColumnType("float");
+
+                    b.Property<double>("Communication")
+                        .HasColumnType("float");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<double>("English")
+                        .HasColumnType("float");
+
+                    b.Property<Guid>("InterviewId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<double>("ProblemSolving")
+                        .HasColumnType("float");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<double>("Technical")
+                        .HasColumnType("float");
+
+                    b.Property<Guid?>("TenantId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("InterviewId")
+                        .IsUnique();
+
+                    b.ToTable("Scores");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Scoring", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<string>("Category")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("CvEvaluationId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("FixedCategory")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Level")
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<int?>("Score")
+                        .HasColumnType("int");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<int?>("Years")
+                        .HasColumnType("int");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("Category");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("CvEvaluationId");
+
+                    b.ToTable("Scorings");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Skill", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<string>("Category")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Proficiency")
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("SkillName")
+                        .IsRequired()
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("Unit")
+                        .HasMaxLength(50)
+                        .HasColumnType("nvarchar(50)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<int?>("YearsExperience")
+                        .HasColumnType("int");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("Category");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("SkillName");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Skills_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("Skills");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Summary", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Text")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Type")
+                        .IsRequired()
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Summaries_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("Summaries");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.UserProfile", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<int?>("Age")
+                        .HasColumnType("int");
+
+                    b.Property<string>("Bio")
+                        .HasMaxLength(1000)
+                        .HasColumnType("nvarchar(1000)");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Email")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("JobTypePreferences")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("nvarchar(max)")
+                        .HasDefaultValueSql("''");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Name")
+                        .IsRequired()
+                        .HasMaxLength(255)
+                        .HasColumnType("nvarchar(255)");
+
+                    b.Property<string>("Nationality")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<bool?>("OpenToRelocation")
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<string>("PhoneNumber")
+                        .HasMaxLength(20)
+                        .HasColumnType("nvarchar(20)");
+
+                    b.Property<string>("ProfilePictureUrl")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<string>("RemotePreferences")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("nvarchar(max)")
+                        .HasDefaultValueSql("''");
+
+                    b.Property<string>("ResumeUrl")
+                        .HasMaxLength(500)
+                        .HasColumnType("nvarchar(500)");
+
+                    b.Property<string>("Roles")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("nvarchar(max)")
+                        .HasDefaultValueSql("''");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Email")
+                        .IsUnique();
+
+                    b.HasIndex("Name");
+
+                    b.ToTable("UserProfiles");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.VolunteerExtracurricular", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uniqueidentifier")
+                        .HasDefaultValueSql("NEWID()");
+
+                    b.Property<Guid?>("CountryExposureSetId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.Property<DateTimeOffset>("CreatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("CreatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<string>("DataOriginRegion")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("DataResidency")
+                        .IsRequired()
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<string>("Description")
+                        .HasColumnType("nvarchar(max)");
+
+                    b.Property<DateTime?>("EndDate")
+                        .HasColumnType("datetime2");
+
+                    b.Property<bool>("IsDeleted")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("bit")
+                        .HasDefaultValue(false);
+
+                    b.Property<bool?>("IsSanitized")
+                        .HasColumnType("bit");
+
+                    b.Property<string>("LastSyncEventId")
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)");
+
+                    b.Property<DateTimeOffset?>("LastSyncedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<string>("Organization")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<string>("Role")
+                        .HasMaxLength(200)
+                        .HasColumnType("nvarchar(200)");
+
+                    b.Property<byte[]>("RowVersion")
+                        .IsConcurrencyToken()
+                        .IsRequired()
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasColumnType("rowversion");
+
+                    b.Property<DateTimeOffset?>("SanitizationOverrideConsentAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTimeOffset?>("SanitizedAt")
+                        .HasColumnType("datetimeoffset");
+
+                    b.Property<DateTime?>("StartDate")
+                        .HasColumnType("datetime2");
+
+                    b.Property<DateTimeOffset>("UpdatedAt")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("datetimeoffset")
+                        .HasDefaultValueSql("GETUTCDATE()");
+
+                    b.Property<string>("UpdatedBy")
+                        .HasMaxLength(100)
+                        .HasColumnType("nvarchar(100)");
+
+                    b.Property<Guid>("UserProfileId")
+                        .HasColumnType("uniqueidentifier");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("CountryExposureSetId");
+
+                    b.HasIndex("Organization");
+
+                    b.HasIndex("StartDate");
+
+                    b.HasIndex("UserProfileId");
+
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_VolunteerExtracurricular_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
+                    b.ToTable("VolunteerExtracurricular");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.AwardAchievement", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("AwardAchievements")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Candidate", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.File", "CvFile")
+                        .WithMany()
+                        .HasForeignKey("CvFileId")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithOne("Candidate")
+                        .HasForeignKey("Recruiter.Domain.Models.Candidate", "UserId")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("CvFile");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CertificationLicense", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("CertificationLicenses")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Comment", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.Navigation("CountryExposureSet");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CountryExposureSetCountry", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.Country", "Country")
+                        .WithMany()
+                        .HasForeignKey("CountryCode")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany("Countries")
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("Country");
+
+                    b.Navigation("CountryExposureSet");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CvEvaluation", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.File", "File")
+                        .WithMany()
+                        .HasForeignKey("FileId")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("CvEvaluations")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("File");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Education", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("Educations")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Experience", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("Experiences")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Feedback", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.Interview", "Interview")
+                        .WithOne("Feedback")
+                        .HasForeignKey("Recruiter.Domain.Models.Feedback", "InterviewId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("Interview");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.File", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.Navigation("CountryExposureSet");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Interview", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.JobApplicationStep", "JobApplicationStep")
+                        .WithOne("Interview")
+                        .HasForeignKey("Recruiter.Domain.Models.Interview", "JobApplicationStepId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "InstructionPrompt")
+                        .WithMany()
+                        .HasForeignKey("InstructionPromptName", "InstructionPromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.InterviewConfiguration", "InterviewConfiguration")
+                        .WithMany()
+                        .HasForeignKey("InterviewConfigurationName", "InterviewConfigurationVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "PersonalityPrompt")
+                        .WithMany()
+                        .HasForeignKey("PersonalityPromptName", "PersonalityPromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "QuestionsPrompt")
+                        .WithMany()
+                        .HasForeignKey("QuestionsPromptName", "QuestionsPromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("InstructionPrompt");
+
+                    b.Navigation("InterviewConfiguration");
+
+                    b.Navigation("JobApplicationStep");
+
+                    b.Navigation("PersonalityPrompt");
+
+                    b.Navigation("QuestionsPrompt");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.InterviewConfiguration", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "InstructionPrompt")
+                        .WithMany()
+                        .HasForeignKey("InstructionPromptName", "InstructionPromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "PersonalityPrompt")
+                        .WithMany()
+                        .HasForeignKey("PersonalityPromptName", "PersonalityPromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "QuestionsPrompt")
+                        .WithMany()
+                        .HasForeignKey("QuestionsPromptName", "QuestionsPromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("InstructionPrompt");
+
+                    b.Navigation("PersonalityPrompt");
+
+                    b.Navigation("QuestionsPrompt");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplication", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.Candidate", "Candidate")
+                        .WithMany()
+                        .HasForeignKey("CandidateId")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.JobPost", "JobPost")
+                        .WithMany()
+                        .HasForeignKey("JobPostName", "JobPostVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("Candidate");
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("JobPost");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplicationStep", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.JobApplication", "JobApplication")
+                        .WithMany("Steps")
+                        .HasForeignKey("JobApplicationId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.JobPostStep", "JobPostStep")
+                        .WithMany()
+                        .HasForeignKey("JobPostStepName", "JobPostStepVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("JobApplication");
+
+                    b.Navigation("JobPostStep");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplicationStepFiles", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.File", "File")
+                        .WithMany()
+                        .HasForeignKey("FileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.JobApplicationStep", "JobApplicationStep")
+                        .WithMany("JobApplicationStepFiles")
+                        .HasForeignKey("JobApplicationStepId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("File");
+
+                    b.Navigation("JobApplicationStep");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPost", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.Country", "OriginCountry")
+                        .WithMany()
+                        .HasForeignKey("OriginCountryCode")
+                        .OnDelete(DeleteBehavior.NoAction);
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("OriginCountry");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPostStep", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.InterviewConfiguration", "InterviewConfiguration")
+                        .WithMany()
+                        .HasForeignKey("InterviewConfigurationName", "InterviewConfigurationVersion")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.Prompt", "Prompt")
+                        .WithMany()
+                        .HasForeignKey("PromptName", "PromptVersion")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireTemplate", "QuestionnaireTemplate")
+                        .WithMany()
+                        .HasForeignKey("QuestionnaireTemplateName", "QuestionnaireTemplateVersion")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("InterviewConfiguration");
+
+                    b.Navigation("Prompt");
+
+                    b.Navigation("QuestionnaireTemplate");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPostStepAssignment", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.JobPost", "JobPost")
+                        .WithMany("StepAssignments")
+                        .HasForeignKey("JobPostName", "JobPostVersion")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.JobPostStep", "JobPostStep")
+                        .WithMany("StepAssignments")
+                        .HasForeignKey("JobPostStepName", "JobPostStepVersion");
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("JobPost");
+
+                    b.Navigation("JobPostStep");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.KeyStrength", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("KeyStrengths")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.ProjectResearch", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("ProjectResearches")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Prompt", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.Navigation("CountryExposureSet");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmission", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.JobApplicationStep", "JobApplicationStep")
+                        .WithOne("QuestionnaireCandidateSubmission")
+                        .HasForeignKey("Recruiter.Domain.Models.QuestionnaireCandidateSubmission", "JobApplicationStepId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireTemplate", "QuestionnaireTemplate")
+                        .WithMany()
+                        .HasForeignKey("QuestionnaireTemplateName", "QuestionnaireTemplateVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("JobApplicationStep");
+
+                    b.Navigation("QuestionnaireTemplate");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmissionAnswer", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireCandidateSubmission", "QuestionnaireCandidateSubmission")
+                        .WithMany("Answers")
+                        .HasForeignKey("QuestionnaireCandidateSubmissionId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireQuestion", "QuestionnaireQuestion")
+                        .WithMany()
+                        .HasForeignKey("QuestionnaireQuestionName", "QuestionnaireQuestionVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("QuestionnaireCandidateSubmission");
+
+                    b.Navigation("QuestionnaireQuestion");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmissionAnswerOption", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireCandidateSubmissionAnswer", "QuestionnaireCandidateSubmissionAnswer")
+                        .WithMany("SelectedOptions")
+                        .HasForeignKey("QuestionnaireCandidateSubmissionAnswerId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireQuestionOption", "QuestionnaireQuestionOption")
+                        .WithMany()
+                        .HasForeignKey("QuestionnaireQuestionOptionName", "QuestionnaireQuestionOptionVersion")
+                        .OnDelete(DeleteBehavior.Restrict)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("QuestionnaireCandidateSubmissionAnswer");
+
+                    b.Navigation("QuestionnaireQuestionOption");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireQuestion", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.File", "MediaFile")
+                        .WithMany()
+                        .HasForeignKey("MediaFileId")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireSection", null)
+                        .WithMany("Questions")
+                        .HasForeignKey("QuestionnaireSectionId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("MediaFile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireQuestionOption", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.File", "MediaFile")
+                        .WithMany()
+                        .HasForeignKey("MediaFileId")
+                        .OnDelete(DeleteBehavior.Restrict);
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireQuestion", "QuestionnaireQuestion")
+                        .WithMany("Options")
+                        .HasForeignKey("QuestionnaireQuestionName", "QuestionnaireQuestionVersion")
+                        .OnDelete(DeleteBehavior.Cascade);
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("MediaFile");
+
+                    b.Navigation("QuestionnaireQuestion");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireSection", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.QuestionnaireTemplate", "QuestionnaireTemplate")
+                        .WithMany("Sections")
+                        .HasForeignKey("QuestionnaireTemplateName", "QuestionnaireTemplateVersion")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("QuestionnaireTemplate");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireTemplate", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.Navigation("CountryExposureSet");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Score", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.Interview", "Interview")
+                        .WithOne("Score")
+                        .HasForeignKey("Recruiter.Domain.Models.Score", "InterviewId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("Interview");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Scoring", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.CvEvaluation", "CvEvaluation")
+                        .WithMany("Scorings")
+                        .HasForeignKey("CvEvaluationId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("CvEvaluation");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Skill", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("Skills")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Summary", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("Summaries")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.UserProfile", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.Navigation("CountryExposureSet");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.VolunteerExtracurricular", b =>
+                {
+                    b.HasOne("Recruiter.Domain.Models.CountryExposureSet", "CountryExposureSet")
+                        .WithMany()
+                        .HasForeignKey("CountryExposureSetId")
+                        .OnDelete(DeleteBehavior.SetNull);
+
+                    b.HasOne("Recruiter.Domain.Models.UserProfile", "UserProfile")
+                        .WithMany("VolunteerExtracurriculars")
+                        .HasForeignKey("UserProfileId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("CountryExposureSet");
+
+                    b.Navigation("UserProfile");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CountryExposureSet", b =>
+                {
+                    b.Navigation("Countries");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.CvEvaluation", b =>
+                {
+                    b.Navigation("Scorings");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.Interview", b =>
+                {
+                    b.Navigation("Feedback");
+
+                    b.Navigation("Score");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplication", b =>
+                {
+                    b.Navigation("Steps");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobApplicationStep", b =>
+                {
+                    b.Navigation("Interview");
+
+                    b.Navigation("JobApplicationStepFiles");
+
+                    b.Navigation("QuestionnaireCandidateSubmission");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPost", b =>
+                {
+                    b.Navigation("StepAssignments");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.JobPostStep", b =>
+                {
+                    b.Navigation("StepAssignments");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmission", b =>
+                {
+                    b.Navigation("Answers");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireCandidateSubmissionAnswer", b =>
+                {
+                    b.Navigation("SelectedOptions");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireQuestion", b =>
+                {
+                    b.Navigation("Options");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireSection", b =>
+                {
+                    b.Navigation("Questions");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.QuestionnaireTemplate", b =>
+                {
+                    b.Navigation("Sections");
+                });
+
+            modelBuilder.Entity("Recruiter.Domain.Models.UserProfile", b =>
+                {
+                    b.Navigation("AwardAchievements");
+
+                    b.Navigation("Candidate");
+
+                    b.Navigation("CertificationLicenses");
+
+                    b.Navigation("CvEvaluations");
+
+                    b.Navigation("Educations");
+
+                    b.Navigation("Experiences");
+
+                    b.Navigation("KeyStrengths");
+
+                    b.Navigation("ProjectResearches");
+
+                    b.Navigation("Skills");
+
+                    b.Navigation("Summaries");
+
+                    b.Navigation("VolunteerExtracurriculars");
+                });
+#pragma warning restore 612, 618
+        }
+    }
+}
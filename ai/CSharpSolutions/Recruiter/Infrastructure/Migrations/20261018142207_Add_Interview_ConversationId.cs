@@ -0,0 +1,42 @@
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace Recruiter.Infrastructure.Migrations
+{
+    /// <inheritdoc />
+    public partial class Add_Interview_ConversationId : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Persisted computed column: existing rows are backfilled from TranscriptUrl when it is added
+            migrationBuilder.AddColumn<string>(
+                name: "ConversationId",
+                table: "Interviews",
+                type: "nvarchar(128)",
+                maxLength: 128,
+                nullable: true,
+                computedColumnSql: "CAST(SUBSTRING(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), 1, PATINDEX('%[/?#]%', CONCAT(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), '/')) - 1) AS nvarchar(128))",
+                stored: true);
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Interviews_ConversationId",
+                table: "Interviews",
+                column: "ConversationId",
+                filter: "[ConversationId] IS NOT NULL");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Interviews_ConversationId",
+                table: "Interviews");
+
+            migrationBuilder.DropColumn(
+                name: "ConversationId",
+                table: "Interviews");
+        }
+    }
+}
@@ -111,6 +111,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_AwardsAchievements_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("AwardsAchievements");
                 });
 
@@ -289,6 +292,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_CertificationsLicenses_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("CertificationsLicenses");
                 });
 
@@ -3318,6 +3324,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Educations_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("Educations");
                 });
 
@@ -3506,6 +3515,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Experiences_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("Experiences");
                 });
 
@@ -3722,6 +3734,12 @@ namespace Recruiter.Infrastructure.Migrations
                     b.Property<DateTimeOffset?>("CompletedAt")
                         .HasColumnType("datetimeoffset");
 
+                    b.Property<string>("ConversationId")
+                        .ValueGeneratedOnAddOrUpdate()
+                        .HasMaxLength(128)
+                        .HasColumnType("nvarchar(128)")
+                        .HasComputedColumnSql("CAST(SUBSTRING(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), 1, PATINDEX('%[/?#]%', CONCAT(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), '/')) - 1) AS nvarchar(128))", true);
+
                     b.Property<Guid?>("CountryExposureSetId")
                         .HasColumnType("uniqueidentifier");
 
@@ -3832,6 +3850,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasKey("Id");
 
+                    b.HasIndex("ConversationId")
+                        .HasFilter("[ConversationId] IS NOT NULL");
+
                     b.HasIndex("CountryExposureSetId");
 
                     b.HasIndex("InstructionPromptName");
@@ -4748,6 +4769,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_KeyStrengths_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("KeyStrengths");
                 });
 
@@ -4846,6 +4870,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_ProjectsResearch_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("ProjectsResearch");
                 });
 
@@ -5989,6 +6016,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Skills_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("Skills");
                 });
 
@@ -6072,6 +6102,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_Summaries_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("Summaries");
                 });
 
@@ -6295,6 +6328,9 @@ namespace Recruiter.Infrastructure.Migrations
 
                     b.HasIndex("UserProfileId");
 
+                    b.HasIndex(new[] { "UserProfileId" }, "IX_VolunteerExtracurricular_UserProfileId_Active")
+                        .HasFilter("[IsDeleted] = 0");
+
                     b.ToTable("VolunteerExtracurricular");
                 });
 
@@ -11,6 +11,14 @@ namespace Recruiter.Infrastructure.Repository;
 
 public class RecruiterDbContext : DbContext
 {
+    // Interview.ConversationId: the part of TranscriptUrl after "/conversations/conv_" up to the next
+    // '/', '?' or '#' (NULL without one), i.e. the conversation id TranscriptPathResolver looks up
+    private const string InterviewConversationIdSql =
+        "CAST(SUBSTRING(" + ConversationIdTailSql + ", 1, PATINDEX('%[/?#]%', CONCAT(" + ConversationIdTailSql + ", '/')) - 1) AS nvarchar(128))";
+
+    private const string ConversationIdTailSql =
+        "SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128)";
+
     public RecruiterDbContext(DbContextOptions<RecruiterDbContext> options) : base(options)
     {
     }
@@ -369,6 +377,9 @@ public class RecruiterDbContext : DbContext
             entity.Property(e => e.InterviewConfigurationName).IsRequired().HasMaxLength(255);
             entity.Property(e => e.InterviewConfigurationVersion).IsRequired();
             entity.Property(e => e.TranscriptUrl).HasMaxLength(500);
+            entity.Property(e => e.ConversationId)
+                .HasMaxLength(128)
+                .HasComputedColumnSql(InterviewConversationIdSql, stored: true);
             entity.Property(e => e.Duration);
 
             // Prompt properties
@@ -420,6 +431,7 @@ public class RecruiterDbContext : DbContext
             entity.HasIndex(e => e.InstructionPromptName);
             entity.HasIndex(e => e.PersonalityPromptName);
             entity.HasIndex(e => e.QuestionsPromptName);
+            entity.HasIndex(e => e.ConversationId).HasFilter("[ConversationId] IS NOT NULL");
         });
 
         // Configure Score entity
@@ -900,6 +912,10 @@ public class RecruiterDbContext : DbContext
             // Create indexes
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.StrengthName);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_KeyStrengths_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<Skill>(entity =>
@@ -922,6 +938,10 @@ public class RecruiterDbContext : DbContext
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Category);
             entity.HasIndex(e => e.SkillName);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_Skills_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<Experience>(entity =>
@@ -946,6 +966,10 @@ public class RecruiterDbContext : DbContext
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Organization);
             entity.HasIndex(e => e.StartDate);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_Experiences_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<Education>(entity =>
@@ -969,6 +993,10 @@ public class RecruiterDbContext : DbContext
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Institution);
             entity.HasIndex(e => e.Degree);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_Educations_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<CvEvaluation>(entity =>
@@ -1018,6 +1046,10 @@ public class RecruiterDbContext : DbContext
             // Create indexes
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Title);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_AwardsAchievements_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<CertificationLicense>(entity =>
@@ -1038,6 +1070,10 @@ public class RecruiterDbContext : DbContext
             // Create indexes
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Name);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_CertificationsLicenses_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<Summary>(entity =>
@@ -1055,6 +1091,10 @@ public class RecruiterDbContext : DbContext
 
             // Create indexes
             entity.HasIndex(e => e.UserProfileId);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_Summaries_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<Scoring>(entity =>
@@ -1098,6 +1138,10 @@ public class RecruiterDbContext : DbContext
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Organization);
             entity.HasIndex(e => e.StartDate);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_VolunteerExtracurricular_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<ProjectResearch>(entity =>
@@ -1120,6 +1164,10 @@ public class RecruiterDbContext : DbContext
             entity.HasIndex(e => e.UserProfileId);
             entity.HasIndex(e => e.Title);
             entity.HasIndex(e => e.Role);
+
+            // Live rows only: soft-deleted history from earlier CV runs stays out of the index
+            entity.HasIndex(e => e.UserProfileId, "IX_ProjectsResearch_UserProfileId_Active")
+                .HasFilter("[IsDeleted] = 0");
         });
 
         modelBuilder.Entity<Comment>(entity =>
@@ -35,23 +35,21 @@ public class TranscriptPathResolver : ITranscriptPathResolver
         }
 
         // TranscriptUrl pattern: <base-url>/api/candidate/ai-interview/conversations/conv_<conversation-id>
-        // We search for records where TranscriptUrl ends with the conversation_id
-        var searchPattern = $"conv_{conversationId}";
-
+        // ConversationId is computed from it and indexed, so this is a seek instead of a suffix scan
         try
         {
             // Query Interview → JobApplicationStep → JobApplication
             var interview = await _dbContext.Interviews
                 .Include(i => i.JobApplicationStep)
                     .ThenInclude(jas => jas!.JobApplication)
-                .Where(i => i.TranscriptUrl != null && i.TranscriptUrl.EndsWith(searchPattern))
+                .Where(i => i.ConversationId == conversationId)
                 .FirstOrDefaultAsync(cancellationToken);
 
             if (interview is null)
             {
                 _logger.LogWarning(
-                    "No interview found for conversation_id: {ConversationId} (searched for TranscriptUrl ending with '{Pattern}')",
-                    conversationId, searchPattern);
+                    "No interview found for conversation_id: {ConversationId}",
+                    conversationId);
                 return null;
             }
 
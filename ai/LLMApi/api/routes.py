@@ -1,12 +1,14 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from database import get_db
+from database import get_db, get_read_db, run_in_db_executor
 from services.azure_storage import azure_storage
 from services.service_bus import service_bus
+from services.openai_rate_limiter import RequestPriority
 from models.pydantic_models import CVUploadResponse, CVProcessingStatus
 from models.database import UserProfile, CVEvaluation, Prompt, Candidate, File as FileModel
 from config import settings
+from core.file_helper import FilePathHelper
 import uuid
 import logging
 from typing import List, Optional
@@ -14,6 +16,37 @@ from typing import List, Optional
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Blocking ORM work of the async routes runs on the DB executor (database.run_in_db_executor);
+# read-only routes are plain `def`, which FastAPI runs in its threadpool, and read through
+# get_read_db (read replica when configured, primary otherwise).
+
+def _ensure_user_profile(db: Session, user_id: str) -> None:
+    user_profile = db.query(UserProfile).filter(UserProfile.Id == user_id).first()
+    if not user_profile:
+        user_profile = UserProfile(Id=user_id, Name="", Email="")
+        db.add(user_profile)
+        db.flush()
+
+def _save_upload_records(db: Session, user_id: str, file_id: str, file_extension: str, file_size_mb: float, blob_path) -> None:
+    file_record = FileModel(
+        Id=file_id,
+        Container="cvs",
+        FilePath=blob_path,
+        Extension=file_extension,
+        MbSize=int(file_size_mb),
+        StorageAccountName=["default"]
+    )
+    db.add(file_record)
+    
+    candidate = Candidate(
+        Id=str(uuid.uuid4()),
+        UserId=user_id,
+        CandidateId="",  # Will be set by C# backend if needed
+        CvFileId=file_id
+    )
+    db.add(candidate)
+    db.commit()
+
 @router.post("/upload-cv", response_model=CVUploadResponse)
 async def upload_cv(
     file: UploadFile = File(...),
@@ -56,38 +89,20 @@ async def upload_cv(
             user_id = str(uuid.uuid4())
         
         # Check if user exists, create if not (without Email - unique constraint)
-        user_profile = db.query(UserProfile).filter(UserProfile.Id == user_id).first()
-        if not user_profile:
-            user_profile = UserProfile(Id=user_id, Name="", Email="")
-            db.add(user_profile)
-            db.flush()
+        await run_in_db_executor(_ensure_user_profile, db, user_id)
         
         # Generate file ID
         file_id = str(uuid.uuid4())
         
         # Upload to blob storage
-        blob_path = await azure_storage.upload_file(
+        folder_path, file_name, upload_success = await azure_storage.upload_file_async(
             file_content, user_id, file_id, file_extension
         )
+        if not upload_success:
+            raise HTTPException(status_code=500, detail="Failed to upload file to storage")
+        blob_path = FilePathHelper.get_full_path(folder_path, file_name)
         
-        file_record = FileModel(
-            Id=file_id,
-            Container="cvs",
-            FilePath=blob_path,
-            Extension=file_extension,
-            MbSize=int(file_size_mb),
-            StorageAccountName=["default"]
-        )
-        db.add(file_record)
-        
-        candidate = Candidate(
-            Id=str(uuid.uuid4()),
-            UserId=user_id,
-            CandidateId="",  # Will be set by C# backend if needed
-            CvFileId=file_id
-        )
-        db.add(candidate)
-        db.commit()
+        await run_in_db_executor(_save_upload_records, db, user_id, file_id, file_extension, file_size_mb, blob_path)
         
         message_data = {
             "userId": user_id,
@@ -96,7 +111,8 @@ async def upload_cv(
             "promptName": prompt_name,
             "promptCategory": prompt_category,
             "promptVersion": prompt_version,
-            "blobPath": blob_path
+            "blobPath": blob_path,
+            "priority": RequestPriority.INTERACTIVE.name.lower()  # a user is waiting on this upload
         }
         
         queue_success = await service_bus.send_cv_processing_message(message_data)
@@ -123,7 +139,7 @@ async def upload_cv(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/cv-status/{file_id}")
-async def get_cv_status(file_id: str, db: Session = Depends(get_db)):
+def get_cv_status(file_id: str, db: Session = Depends(get_read_db)):
     """Get CV processing status"""
     candidate = db.query(Candidate).filter(Candidate.CvFileId == file_id).first()
     
@@ -146,7 +162,7 @@ async def get_cv_status(file_id: str, db: Session = Depends(get_db)):
     }
 
 @router.get("/user-cvs/{user_id}")
-async def get_user_cvs(user_id: str, db: Session = Depends(get_db)):
+def get_user_cvs(user_id: str, db: Session = Depends(get_read_db)):
     """Get all CV evaluations for a user"""
     candidates = db.query(Candidate).filter(
         Candidate.UserId == user_id
@@ -178,27 +194,31 @@ async def get_user_cvs(user_id: str, db: Session = Depends(get_db)):
     return {"user_id": user_id, "cvs": results}
 
 @router.get("/user-profile/{user_id}")
-async def get_user_profile(user_id: str, db: Session = Depends(get_db)):
+def get_user_profile(user_id: str, db: Session = Depends(get_read_db)):
     """Get complete user profile with all extracted data"""
     user_profile = db.query(UserProfile).filter(UserProfile.Id == user_id).first()
     
     if not user_profile:
         raise HTTPException(status_code=404, detail="User profile not found")
     
-    # Get all related data
-    from models.database import (Experience, Education, Skills, ProjectsResearch, 
-                                CertificationsLicenses, AwardsAchievements, 
-                                VolunteerExtracurricular, Summaries, KeyStrengths)
-    
-    experiences = db.query(Experience).filter(Experience.UserProfileId == user_id).all()
-    educations = db.query(Education).filter(Education.UserProfileId == user_id).all()
-    skills = db.query(Skills).filter(Skills.UserProfileId == user_id).all()
-    projects = db.query(ProjectsResearch).filter(ProjectsResearch.UserProfileId == user_id).all()
-    certifications = db.query(CertificationsLicenses).filter(CertificationsLicenses.UserProfileId == user_id).all()
-    awards = db.query(AwardsAchievements).filter(AwardsAchievements.UserProfileId == user_id).all()
-    volunteer = db.query(VolunteerExtracurricular).filter(VolunteerExtracurricular.UserProfileId == user_id).all()
-    summaries = db.query(Summaries).filter(Summaries.UserProfileId == user_id).all()
-    strengths = db.query(KeyStrengths).filter(KeyStrengths.UserProfileId == user_id).all()
+    # Get all related data: live rows only (earlier CV runs are soft-deleted history), so the
+    # filtered IX_<table>_UserProfileId_Active indexes can serve the lookup
+    from models.database import (Experience, Education, Skill, ProjectsResearch,
+                                CertificationsLicenses, AwardsAchievements,
+                                VolunteerExtracurricular, Summary, KeyStrength)
+
+    def active(model):
+        return db.query(model).filter(model.UserProfileId == user_id, model.IsDeleted == False).all()
+
+    experiences = active(Experience)
+    educations = active(Education)
+    skills = active(Skill)
+    projects = active(ProjectsResearch)
+    certifications = active(CertificationsLicenses)
+    awards = active(AwardsAchievements)
+    volunteer = active(VolunteerExtracurricular)
+    summaries = active(Summary)
+    strengths = active(KeyStrength)
     
     return {
         "user_profile": user_profile,
@@ -1,6 +1,6 @@
 from services.azure_storage import azure_storage
 from services.openai_service import get_openai_service
-from database import get_db, SessionLocal
+from database import get_db, SessionLocal, bulk_insert, normalize_row, run_in_db_executor
 from models.database import (
     CvEvaluation, UserProfile, Candidate, Experience, Education, Skill,
     ProjectsResearch, CertificationsLicenses, AwardsAchievements,
@@ -14,12 +14,19 @@ import logging
 from datetime import datetime
 from typing import Dict, Any
 import uuid
-import asyncio
 from config import settings
-from services.prompt_resolver import PromptRef, prompt_resolver
+from services.prompt_resolver import PromptRef, ResolvedPrompt, prompt_resolver
+from services.extraction_cache import extraction_cache
+from repositories.cv_extraction_repository import cv_extraction_repository
+from core.resilience import PermanentError, sql_resilience
+from services.model_cascade import model_cascade
+from services.openai_rate_limiter import RequestPriority, request_priority
 
 logger = logging.getLogger(__name__)
 
+# Cache entries remember which model of the cascade produced them (for CvEvaluation.ModelUsed)
+_CACHED_MODEL_KEY = "_modelUsed"
+
 class CVProcessor:
     def __init__(self):
         self._openai_service = None
@@ -30,12 +37,58 @@ class CVProcessor:
             self._openai_service = get_openai_service()
         return self._openai_service
     
-    async def process_cv_direct(self, processing_data: Dict[str, Any], db: Session = None, request_id: str | None = None):
-        """Process a CV directly without queue"""
+    def resolve_extraction_prompts(
+        self, db: Session, processing_data: Dict[str, Any], request_id: str
+    ) -> tuple[ResolvedPrompt, ResolvedPrompt]:
+        """Resolve the (system, scoring) prompts for a processing message."""
+        prompt_name = processing_data.get('promptName') or processing_data.get('prompt_name')
+        prompt_category = processing_data.get('promptCategory') or processing_data.get('prompt_category')
+        prompt_version = processing_data.get('promptVersion') or processing_data.get('prompt_version')
+
+        # System prompt: fixed name, latest version
+        system_prompt = prompt_resolver.resolve(
+            db,
+            PromptRef(name="CVExtractionSystemInstructions"),
+            request_id=request_id,
+            default_content="",
+            allow_latest=True,
+        )
+
+        # Scoring prompt: comes from upstream (name/category/version), fallback to empty (OpenAIService has default)
+        scoring_name = prompt_name or "CVExtractionScoringInstructions"
+        scoring_prompt = prompt_resolver.resolve(
+            db,
+            PromptRef(name=scoring_name, category=prompt_category, version=prompt_version),
+            request_id=request_id,
+            default_content="",
+            allow_latest=True,
+        )
+        return system_prompt, scoring_prompt
+
+    @staticmethod
+    def resolve_evaluation_prompt(processing_data: Dict[str, Any], scoring_prompt: ResolvedPrompt) -> tuple[str, int]:
+        """(PromptCategory, PromptVersion) recorded on the CvEvaluation."""
+        prompt_category = processing_data.get('promptCategory') or processing_data.get('prompt_category')
+        prompt_version = processing_data.get('promptVersion') or processing_data.get('prompt_version')
+        resolved_prompt_category = prompt_category or scoring_prompt.category or "cv_extraction"
+        resolved_prompt_version = (
+            int(prompt_version)
+            if isinstance(prompt_version, int) and prompt_version >= 1
+            else (scoring_prompt.version or 1)
+        )
+        return resolved_prompt_category, resolved_prompt_version
+
+    async def process_cv_direct(
+        self,
+        processing_data: Dict[str, Any],
+        db: Session = None,
+        request_id: str | None = None,
+    ):
+        """Process a CV directly without queue."""
         request_id = request_id or str(uuid.uuid4())
         
         if db is None:
-            db = SessionLocal()
+            db = await run_in_db_executor(SessionLocal)  # first call may initialize the engine
             session_created = True
         else:
             session_created = False
@@ -43,16 +96,12 @@ class CVProcessor:
             user_id = processing_data.get('userId')
             file_id = processing_data.get('fileId')
             file_extension = processing_data.get('fileExtension')
-            # prompt selector from upstream (support both camelCase + snake_case)
-            prompt_name = processing_data.get('promptName') or processing_data.get('prompt_name')
-            prompt_category = processing_data.get('promptCategory') or processing_data.get('prompt_category')
-            prompt_version = processing_data.get('promptVersion') or processing_data.get('prompt_version')
             blob_path = processing_data.get('blobPath')
             file_content = processing_data.get('fileContent')
             
             if not file_content and blob_path:
                 logger.info(f"[{request_id}] Downloading CV from blob storage: {blob_path}")
-                file_content = azure_storage.download_file(blob_path)
+                file_content = await azure_storage.download_file_async(blob_path)
                 if not file_content:
                     raise ValueError(f"Failed to download file from blob storage: {blob_path}")
             
@@ -62,110 +111,177 @@ class CVProcessor:
             logger.info(f"[{request_id}] Processing CV for user {user_id}, file {file_id}")
             
             # === 1. Resolve prompts ===
-            # System prompt: fixed name, latest version
-            system_prompt = prompt_resolver.resolve(
-                db,
-                PromptRef(name="CVExtractionSystemInstructions"),
-                request_id=request_id,
-                default_content="",
-                allow_latest=True,
+            # Blocking DB work runs on the DB executor so the event loop keeps serving other requests
+            system_prompt, scoring_prompt = await run_in_db_executor(
+                self.resolve_extraction_prompts, db, processing_data, request_id
             )
-
-            # Scoring prompt: comes from upstream (name/category/version), fallback to empty (OpenAIService has default)
-            scoring_name = prompt_name or "CVExtractionScoringInstructions"
-            scoring_prompt = prompt_resolver.resolve(
-                db,
-                PromptRef(name=scoring_name, category=prompt_category, version=prompt_version),
-                request_id=request_id,
-                default_content="",
-                allow_latest=True,
-            )
-            
-            # === 2. Extract with retry ===
-            max_retries = settings.max_retry_attempts
-            extraction_result = None
+            # End the read transaction so the pooled connection is not held across the LLM call
+            await run_in_db_executor(db.commit)
             
-            for attempt in range(max_retries):
-                try:
-                    extraction_result = await self.openai_service.extract_cv_data(
-                        file_content,
-                        system_prompt.content,
-                        scoring_prompt.content,
-                        file_extension,
-                        request_id=request_id,
-                    )
-                    break
-                except Exception as e:
-                    logger.warning(f"[{request_id}] OpenAI attempt {attempt + 1} failed: {e}")
-                    if attempt == max_retries - 1:
-                        raise
-                    await asyncio.sleep(2 ** attempt)
-            
-            # === 3. Validate with Pydantic ===
-            cv_response = CVExtractionResponse.model_validate(extraction_result)
-            
-            # === 4. Save raw JSON to blob ===
-            json_blob_path = azure_storage.upload_json_response(
-                extraction_result, user_id, file_id
+            # === 2. Extract with retry (short-circuited by the content-addressed cache) ===
+            cache_key = extraction_cache.build_key(
+                file_content, system_prompt, scoring_prompt, model_cascade.cache_model_key
             )
+            model_used = self.openai_service.model
+            extraction_result = extraction_cache.get(cache_key, request_id=request_id)
+            if extraction_result is not None:
+                model_used = extraction_result.pop(_CACHED_MODEL_KEY, model_used)
+
+            if extraction_result is None:
+                # Uploads a user is waiting on are tagged "interactive"; everything else queues as background
+                priority = RequestPriority.parse(processing_data.get('priority'))
+                with request_priority(priority):
+                    extraction_result, model_used = await self._extract_with_cascade(
+                        file_content, file_extension, system_prompt, scoring_prompt, request_id
+                    )
+
+                extraction_cache.put(cache_key, {**extraction_result, _CACHED_MODEL_KEY: model_used}, request_id=request_id)
             
-            # === 5. Save File record ===
-            existing_file = db.query(File).filter(
-                File.Id == file_id,
-                File.IsDeleted == False
-            ).with_for_update().first()
-            
-            if not existing_file:
-                file_record = File(
-                    Id=file_id,
-                    Container=settings.azure_storage_container_name,
-                    FilePath=blob_path,
-                    Extension=file_extension,
-                    MbSize=len(file_content) // (1024 * 1024),
-                    StorageAccountName=json.dumps(["recruitersttest"])
-                )
-                db.add(file_record)
-            else:
-                existing_file.FilePath = blob_path
-                existing_file.MbSize = len(file_content) // (1024 * 1024)
-            
-            # === 6. Save CV Evaluation ===
-            resolved_prompt_category = prompt_category or scoring_prompt.category or "cv_extraction"
-            resolved_prompt_version = (
-                int(prompt_version)
-                if isinstance(prompt_version, int) and prompt_version >= 1
-                else (scoring_prompt.version or 1)
-            )
-            cv_evaluation = CvEvaluation(
-                UserProfileId=user_id,
-                PromptCategory=resolved_prompt_category,
-                PromptVersion=resolved_prompt_version,
-                FileId=file_id,
-                ModelUsed=self.openai_service.model,
-                ResponseJson=json.dumps(extraction_result or []),  # Store raw response
+            # === 3-7. Validate, archive the raw JSON and persist ===
+            prompt_category, prompt_version = self.resolve_evaluation_prompt(processing_data, scoring_prompt)
+            await self.save_extraction(
+                db,
+                processing_data,
+                extraction_result,
+                model_used=model_used,
+                prompt_category=prompt_category,
+                prompt_version=prompt_version,
+                file_size_bytes=len(file_content),
+                request_id=request_id,
             )
-            db.add(cv_evaluation)
-            db.flush()
-            
-            # === 7. Save Structured Data ===
-            await self._save_extracted_data(db, user_id, cv_response, cv_evaluation.Id, request_id)
-            
-            db.commit()
             logger.info(f"[{request_id}] CV processed successfully for user {user_id}")
             
         except Exception as e:
-            db.rollback()
+            await run_in_db_executor(db.rollback)
             logger.error(f"[{request_id}] Error processing CV: {e}")
             raise
         finally:
             if session_created:
-                db.close()
+                await run_in_db_executor(db.close)
     
+    async def save_extraction(
+        self,
+        db: Session,
+        processing_data: Dict[str, Any],
+        extraction_result: Dict[str, Any],
+        *,
+        model_used: str,
+        prompt_category: str,
+        prompt_version: int,
+        file_size_bytes: int,
+        request_id: str,
+    ) -> None:
+        """
+        Validate a normalized extraction, save the raw JSON to blob storage and persist the File,
+        CvEvaluation and extracted rows. Shared by process_cv_direct and Batch API ingestion.
+        """
+        user_id = processing_data.get('userId')
+        file_id = processing_data.get('fileId')
+        file_extension = processing_data.get('fileExtension')
+        blob_path = processing_data.get('blobPath')
+
+        # === 3. Validate with Pydantic ===
+        cv_response = CVExtractionResponse.model_validate(extraction_result)
+
+        # === 4. Save raw JSON to blob ===
+        await azure_storage.upload_json_response_async(extraction_result, user_id, file_id)
+
+        # === 5-7. Persist (one transaction; redone on a fresh connection if the current one went stale) ===
+        def persist(request_id: str) -> None:
+            try:
+                # === 5. Save File record ===
+                existing_file = db.query(File).filter(
+                    File.Id == file_id,
+                    File.IsDeleted == False
+                ).with_for_update().first()
+
+                if not existing_file:
+                    file_record = File(
+                        Id=file_id,
+                        Container=settings.azure_storage_container_name,
+                        FilePath=blob_path,
+                        Extension=file_extension,
+                        MbSize=file_size_bytes // (1024 * 1024),
+                        StorageAccountName=json.dumps(["recruitersttest"])
+                    )
+                    db.add(file_record)
+                else:
+                    existing_file.FilePath = blob_path
+                    existing_file.MbSize = file_size_bytes // (1024 * 1024)
+
+                # === 6. Save CV Evaluation ===
+                cv_evaluation = CvEvaluation(
+                    UserProfileId=user_id,
+                    PromptCategory=prompt_category,
+                    PromptVersion=prompt_version,
+                    FileId=file_id,
+                    ModelUsed=model_used,
+                    ResponseJson=json.dumps(extraction_result or []),  # Store raw response
+                )
+                db.add(cv_evaluation)
+                db.flush()
+
+                # === 7. Save Structured Data ===
+                self._save_extracted_data(db, user_id, cv_response, cv_evaluation.Id, request_id)
+
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        await sql_resilience.call_async(run_in_db_executor, persist, request_id=request_id)
+
+    async def _extract_with_cascade(
+        self,
+        file_content: bytes,
+        file_extension: str,
+        system_prompt: ResolvedPrompt,
+        scoring_prompt: ResolvedPrompt,
+        request_id: str,
+    ) -> tuple[Dict[str, Any], str]:
+        """
+        Extract with the cheap model when the CV looks simple; escalate to the main model when
+        its result fails validation or the quality heuristics. Returns (result, model used).
+        """
+        service = self.openai_service
+        resume_text = await service.prepare_resume_text(file_content, file_extension, request_id)
+
+        first_model = model_cascade.route(resume_text, request_id)
+        if first_model != service.model:
+            try:
+                # Transient OpenAI failures are retried per call inside the service
+                result = await service.extract_cv_data_from_text(
+                    resume_text,
+                    system_prompt.content,
+                    scoring_prompt.content,
+                    request_id=request_id,
+                    model=first_model,
+                    repair=False,
+                )
+                issues = model_cascade.quality_issues(result, resume_text)
+            except PermanentError:
+                raise
+            except Exception as e:
+                issues = [f"{first_model} call failed: {e}"]
+            model_cascade.record_outcome(accepted=not issues)
+            if not issues:
+                return result, first_model
+            logger.info(f"[{request_id}] Escalating to {service.model}: {'; '.join(issues)}")
+
+        result = await service.extract_cv_data_from_text(
+            resume_text,
+            system_prompt.content,
+            scoring_prompt.content,
+            request_id=request_id,
+            model=service.model,
+        )
+        return result, service.model
+
     async def process_cv(self, message: Dict[str, Any]):
         """DEPRECATED: Use process_cv_direct"""
         raise DeprecationWarning("Use process_cv_direct instead")
     
-    async def _save_extracted_data(self, db: Session, user_id: str, cv_data: CVExtractionResponse, cv_evaluation_id: str, request_id: str):
+    def _save_extracted_data(self, db: Session, user_id: str, cv_data: CVExtractionResponse, cv_evaluation_id: str, request_id: str):
         """Save extracted CV data to database tables"""
         
         # === UserProfile ===
@@ -208,50 +324,43 @@ class CVProcessor:
                     if hasattr(candidate, field):
                         setattr(candidate, field, value)
         
-        # === Clear old data (soft-delete style) ===
-        db.query(Experience).filter(
-            Experience.UserProfileId == user_id,
-            Experience.IsDeleted == False
-        ).update({Experience.IsDeleted: True})
-        
-        db.query(Education).filter(Education.UserProfileId == user_id, Education.IsDeleted == False).update({Education.IsDeleted: True})
-        db.query(Skill).filter(Skill.UserProfileId == user_id, Skill.IsDeleted == False).update({Skill.IsDeleted: True})
-        db.query(ProjectsResearch).filter(ProjectsResearch.UserProfileId == user_id, ProjectsResearch.IsDeleted == False).update({ProjectsResearch.IsDeleted: True})
-        db.query(CertificationsLicenses).filter(CertificationsLicenses.UserProfileId == user_id, CertificationsLicenses.IsDeleted == False).update({CertificationsLicenses.IsDeleted: True})
-        db.query(AwardsAchievements).filter(AwardsAchievements.UserProfileId == user_id, AwardsAchievements.IsDeleted == False).update({AwardsAchievements.IsDeleted: True})
-        db.query(VolunteerExtracurricular).filter(VolunteerExtracurricular.UserProfileId == user_id, VolunteerExtracurricular.IsDeleted == False).update({VolunteerExtracurricular.IsDeleted: True})
-        db.query(Scoring).filter(Scoring.CvEvaluationId == cv_evaluation_id).delete()
-        db.query(Summary).filter(Summary.UserProfileId == user_id, Summary.IsDeleted == False).update({Summary.IsDeleted: True})
-        db.query(KeyStrength).filter(KeyStrength.UserProfileId == user_id, KeyStrength.IsDeleted == False).update({KeyStrength.IsDeleted: True})
-
-        # === Save new data ===
-        def safe_save(model_class, items, extra_fields=None):
-            if not items:
-                return
-            for item in items:
+        # === Save new data (one executemany batch per table instead of a round trip per row) ===
+        def build_rows(model_class, items, extra_fields=None) -> list[dict]:
+            # Every row carries the table's full column set (None where nothing was extracted),
+            # so each table is one executemany batch and reconcile can compare every column
+            rows = []
+            for item in items or []:
                 data = item.model_dump(exclude_none=True)
                 if not data:
                     continue
-                try:
-                    kwargs = {"UserProfileId": user_id}
-                    if extra_fields:
-                        kwargs.update(extra_fields)
-                    kwargs.update(data)
-                    obj = model_class(**{k: v for k, v in kwargs.items() if hasattr(model_class, k)})
-                    db.add(obj)
-                except Exception as e:
-                    logger.warning(f"[{request_id}] Error saving {model_class.__name__}: {e}")
-        
-        safe_save(Experience, cv_data.Experience)
-        safe_save(Education, cv_data.Education)
-        safe_save(Skill, cv_data.Skills)
-        safe_save(ProjectsResearch, cv_data.ProjectsResearch)
-        safe_save(CertificationsLicenses, cv_data.CertificationsLicenses)
-        safe_save(AwardsAchievements, cv_data.AwardsAchievements)
-        safe_save(VolunteerExtracurricular, cv_data.VolunteerExtracurricular)
-        safe_save(Scoring, cv_data.Scoring, extra_fields={"CvEvaluationId": cv_evaluation_id})
-        safe_save(Summary, cv_data.Summaries)
-        safe_save(KeyStrength, cv_data.KeyStrengths)
+                rows.append(normalize_row(model_class, {"UserProfileId": user_id, **(extra_fields or {}), **data}))
+            return rows
+
+        rows_by_model = {
+            model_class: build_rows(model_class, items, extra_fields)
+            for model_class, items, extra_fields in (
+                (Experience, cv_data.Experience, None),
+                (Education, cv_data.Education, None),
+                (Skill, cv_data.Skills, None),
+                (ProjectsResearch, cv_data.ProjectsResearch, None),
+                (CertificationsLicenses, cv_data.CertificationsLicenses, None),
+                (AwardsAchievements, cv_data.AwardsAchievements, None),
+                (VolunteerExtracurricular, cv_data.VolunteerExtracurricular, None),
+                (Scoring, cv_data.Scoring, {"CvEvaluationId": cv_evaluation_id}),
+                (Summary, cv_data.Summaries, None),
+                (KeyStrength, cv_data.KeyStrengths, None),
+            )
+        }
+
+        if settings.cv_persistence_mode == "reconcile":
+            # Diff against the active rows: only changed items are written
+            cv_extraction_repository.reconcile_extraction(db, user_id, cv_evaluation_id, rows_by_model, request_id)
+            return
+
+        # Replace: soft-delete everything (one batched round trip), then reinsert
+        cv_extraction_repository.retire_previous_extraction(db, user_id, cv_evaluation_id, request_id)
+        inserted = sum(bulk_insert(db, model_class, rows) for model_class, rows in rows_by_model.items())
+        logger.info(f"[{request_id}] Bulk inserted {inserted} extracted rows")
 
 
 # Singleton
@@ -14,6 +14,32 @@ class Settings(BaseSettings):
     sql_username: str = os.getenv("SQL_USERNAME", "")
     sql_password: str = os.getenv("SQL_PASSWORD", "")
 
+    # Bulk writes (see database.bulk_insert): pyodbc fast_executemany sends a batch in one round trip
+    db_fast_executemany: bool = os.getenv("DB_FAST_EXECUTEMANY", "true").lower() == "true"
+    # Connection pool (see database.py). Size to the worker's CV concurrency; recycle below the
+    # Azure SQL gateway idle timeout (30 min) and pre-ping so idle-killed connections are replaced on checkout
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout_seconds: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+    db_pool_recycle_seconds: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1500"))
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Threads running blocking DB work for async code (database.run_in_db_executor); 0 = pool size + overflow
+    db_executor_max_workers: int = int(os.getenv("DB_EXECUTOR_MAX_WORKERS", "0"))
+    # Managed identity SQL token (see core/access_token.py): refreshed in the background this long before expiry
+    sql_token_refresh_margin_seconds: float = float(os.getenv("SQL_TOKEN_REFRESH_MARGIN_SECONDS", "300"))
+    # Read replica for read-only sessions (see database.ReadReplicaRouter): an explicit secondary, or with
+    # DB_READ_SCALE_OUT the primary string + ApplicationIntent=ReadOnly (Azure SQL read scale-out)
+    database_read_connection_string: str = os.getenv("DATABASE_READ_CONNECTION_STRING_PII", "")
+    db_read_scale_out: bool = os.getenv("DB_READ_SCALE_OUT", "false").lower() == "true"
+    # Reads go to the primary this long after the replica could not be reached
+    db_read_replica_retry_seconds: float = float(os.getenv("DB_READ_REPLICA_RETRY_SECONDS", "30"))
+    # ... and while it lags more than this (0 = lag only reported); lag is re-measured at most this often
+    db_read_replica_max_lag_seconds: float = float(os.getenv("DB_READ_REPLICA_MAX_LAG_SECONDS", "30"))
+    db_read_replica_lag_check_seconds: float = float(os.getenv("DB_READ_REPLICA_LAG_CHECK_SECONDS", "15"))
+    # How a new extraction replaces the profile's child rows (see repositories/cv_extraction_repository.py):
+    # "replace" soft-deletes all and reinserts; "reconcile" (opt-in) diffs by natural key and touches only changed rows
+    cv_persistence_mode: Literal["reconcile", "replace"] = os.getenv("CV_PERSISTENCE_MODE", "replace")
+
     # Azure Storage - No default values for security
     azure_storage_connection_string: str = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "")
     azure_storage_container_name: str = os.getenv("AZURE_STORAGE_CONTAINER_NAME", "cvfiles")
@@ -26,6 +52,75 @@ class Settings(BaseSettings):
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o")
 
+    # CV extraction model cascade: simple resumes try the cheaper model first (see services/model_cascade.py).
+    # Off by default; enable per environment once the cascade accept rate has been checked there
+    cv_cascade_enabled: bool = os.getenv("CV_CASCADE_ENABLED", "false").lower() == "true"
+    cv_cascade_model: str = os.getenv("CV_CASCADE_MODEL", "gpt-4o-mini")
+    cv_cascade_max_chars: int = int(os.getenv("CV_CASCADE_MAX_CHARS", "8000"))
+    cv_cascade_min_headings: int = int(os.getenv("CV_CASCADE_MIN_HEADINGS", "2"))
+
+    # CV extraction output mode: "structured" (strict schema from CVExtractionResponse) or "json_object" (legacy)
+    cv_extraction_output_mode: Literal["structured", "json_object"] = os.getenv("CV_EXTRACTION_OUTPUT_MODE", "structured")
+
+    # OpenAI HTTP connection pool (shared AsyncOpenAI client, see services/openai_client.py)
+    openai_max_connections: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "50"))
+    openai_max_keepalive_connections: int = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    openai_keepalive_expiry_seconds: float = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY_SECONDS", "60"))
+    openai_connect_timeout_seconds: float = float(os.getenv("OPENAI_CONNECT_TIMEOUT_SECONDS", "10"))
+    openai_request_timeout_seconds: float = float(os.getenv("OPENAI_REQUEST_TIMEOUT_SECONDS", "120"))
+
+    # Shared OpenAI rate limiter starting limits (per model); adjusted at runtime from x-ratelimit-* headers
+    openai_requests_per_minute: int = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+    openai_tokens_per_minute: int = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+
+    # Hedged CV extraction requests (see services/request_hedging.py)
+    openai_hedging_enabled: bool = os.getenv("OPENAI_HEDGING_ENABLED", "false").lower() == "true"
+    openai_hedge_percentile: float = float(os.getenv("OPENAI_HEDGE_PERCENTILE", "95"))
+    openai_hedge_min_samples: int = int(os.getenv("OPENAI_HEDGE_MIN_SAMPLES", "20"))
+    openai_hedge_window: int = int(os.getenv("OPENAI_HEDGE_WINDOW", "200"))
+    openai_hedge_max_per_minute: int = int(os.getenv("OPENAI_HEDGE_MAX_PER_MINUTE", "5"))
+
+    # CV extraction result cache (content-addressed, see services/extraction_cache.py). Entries are full
+    # extractions (candidate PII): off by default and only used with an explicit directory
+    extraction_cache_enabled: bool = os.getenv("EXTRACTION_CACHE_ENABLED", "false").lower() == "true"
+    extraction_cache_dir: str = os.getenv("EXTRACTION_CACHE_DIR", "")
+    extraction_cache_max_entries: int = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "5000"))
+    extraction_cache_max_mb: int = int(os.getenv("EXTRACTION_CACHE_MAX_MB", "200"))
+    extraction_cache_ttl_hours: int = int(os.getenv("EXTRACTION_CACHE_TTL_HOURS", "720"))
+
+    # PDF text extraction (see services/pdf_text_extraction.py)
+    pdf_max_pages: int = int(os.getenv("PDF_MAX_PAGES", "0"))  # 0 = no cap
+    pdf_parallel_min_pages: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+    pdf_extraction_workers: int = int(os.getenv("PDF_EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+    # Resume text compaction before prompt building (see services/resume_text_compactor.py)
+    resume_compaction_enabled: bool = os.getenv("RESUME_COMPACTION_ENABLED", "true").lower() == "true"
+    resume_token_budget: int = int(os.getenv("RESUME_TOKEN_BUDGET", "12000"))  # 0 = no budget
+    resume_tokenizer_encoding: str = os.getenv("RESUME_TOKENIZER_ENCODING", "o200k_base")
+    # Encoding files shipped with the app (scripts/fetch_tiktoken_encodings.py); never downloaded at runtime
+    tiktoken_cache_dir: str = os.getenv(
+        "TIKTOKEN_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tiktoken_cache")
+    )
+
+    # Section-parallel extraction for long CVs (see services/openai_service.py)
+    cv_sectioned_extraction_min_chars: int = int(os.getenv("CV_SECTIONED_EXTRACTION_MIN_CHARS", "24000"))  # 0 = always single-shot
+    cv_section_min_chars: int = int(os.getenv("CV_SECTION_MIN_CHARS", "800"))
+
+    # OpenAI Batch API mode for bulk CV (re)processing (see services/cv_batch_service.py)
+    batch_work_dir: str = os.getenv("BATCH_WORK_DIR", "")
+    batch_poll_interval_seconds: int = int(os.getenv("BATCH_POLL_INTERVAL_SECONDS", "60"))
+
+    # Purge of soft-deleted extraction rows (see services/soft_delete_purge.py); the timer is off by default
+    soft_delete_purge_enabled: bool = os.getenv("SOFT_DELETE_PURGE_ENABLED", "false").lower() == "true"
+    soft_delete_purge_schedule: str = os.getenv("SOFT_DELETE_PURGE_SCHEDULE", "0 30 2 * * *")  # NCRONTAB, daily 02:30 UTC
+    soft_delete_purge_retention_days: int = int(os.getenv("SOFT_DELETE_PURGE_RETENTION_DAYS", "90"))
+    soft_delete_purge_mode: Literal["delete", "archive"] = os.getenv("SOFT_DELETE_PURGE_MODE", "delete")
+    soft_delete_purge_archive_prefix: str = os.getenv("SOFT_DELETE_PURGE_ARCHIVE_PREFIX", "archive/soft-deleted")
+    soft_delete_purge_batch_size: int = int(os.getenv("SOFT_DELETE_PURGE_BATCH_SIZE", "500"))
+    soft_delete_purge_pause_ms: int = int(os.getenv("SOFT_DELETE_PURGE_PAUSE_MS", "200"))
+    soft_delete_purge_max_run_seconds: float = float(os.getenv("SOFT_DELETE_PURGE_MAX_RUN_SECONDS", "240"))  # 0 = no limit
+    soft_delete_purge_work_dir: str = os.getenv("SOFT_DELETE_PURGE_WORK_DIR", "")
+
     # Application Settings
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     max_file_size_mb: int = int(os.getenv("MAX_FILE_SIZE_MB", "10"))
@@ -33,9 +128,23 @@ class Settings(BaseSettings):
     worker_poll_interval_seconds: int = int(os.getenv("WORKER_POLL_INTERVAL_SECONDS", "5"))
     max_retry_attempts: int = int(os.getenv("MAX_RETRY_ATTEMPTS", "3"))
 
+    # Retry / circuit breaker for OpenAI, Blob Storage, Service Bus and SQL (see core/resilience.py)
+    retry_base_delay_seconds: float = float(os.getenv("RETRY_BASE_DELAY_SECONDS", "0.5"))
+    retry_max_delay_seconds: float = float(os.getenv("RETRY_MAX_DELAY_SECONDS", "20"))
+    retry_budget_ratio: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+    retry_budget_min_per_minute: float = float(os.getenv("RETRY_BUDGET_MIN_PER_MINUTE", "10"))
+    circuit_failure_threshold: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    circuit_recovery_seconds: float = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30"))
+
     # Backend Base URL
     backend_base_url: str = os.getenv("BACKEND_BASE_URL", "http://localhost:5140")
 
+    # Interview lookup by ElevenLabs conversation id (repositories/interview_repository.py): in-process
+    # LRU of conv_id -> Interview.Id; 0 disables it. Entries expire after the TTL so a soft-deleted or
+    # re-linked interview is picked up again
+    interview_conv_id_cache_size: int = int(os.getenv("INTERVIEW_CONV_ID_CACHE_SIZE", "10000"))
+    interview_conv_id_cache_ttl_seconds: float = float(os.getenv("INTERVIEW_CONV_ID_CACHE_TTL_SECONDS", "300"))
+
     # Responses API uses `max_output_tokens`. We also accept `MAX_TOKENS` for backward compatibility.
     max_output_tokens: int = Field(default=4000, validation_alias=AliasChoices("MAX_OUTPUT_TOKENS", "MAX_TOKENS"))
 
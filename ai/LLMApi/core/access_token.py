@@ -0,0 +1,147 @@
+"""
+Cached Azure AD access tokens for outbound connections (SQL Server via managed identity).
+
+One credential is kept for the process and its token is reused until shortly before expiry:
+- inside the refresh window the cached token is still returned while a single background
+  thread fetches the next one,
+- only when the token is (nearly) expired does a caller block on a fetch.
+The credential and clock are injectable so the provider can be exercised with a fake credential.
+"""
+from __future__ import annotations
+
+import logging
+import struct
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+SQL_SCOPE = "https://database.windows.net/.default"
+# pyodbc connection attribute carrying the token (SQL_COPT_SS_ACCESS_TOKEN)
+SQL_COPT_SS_ACCESS_TOKEN = 1256
+
+
+def _default_credential() -> Any:
+    from azure.identity import DefaultAzureCredential
+    return DefaultAzureCredential()
+
+
+class AccessTokenProvider:
+    def __init__(
+        self,
+        scope: str,
+        credential: Any = None,
+        credential_factory: Callable[[], Any] = _default_credential,
+        refresh_margin_seconds: float = 300.0,
+        min_validity_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        `credential` is anything with `get_token(scope)` returning an object with `.token` and
+        `.expires_on` (epoch seconds), e.g. an azure.identity credential. Without one,
+        `credential_factory` builds it on first use.
+        """
+        self.scope = scope
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.min_validity_seconds = min_validity_seconds
+        self._credential = credential
+        self._credential_factory = credential_factory
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._expires_on = 0.0
+        self._refreshing = False
+        self._stats = {
+            "requests": 0, "cache_hits": 0, "fetches": 0, "fetch_failures": 0, "background_refreshes": 0,
+            "fetch_total_ms": 0.0, "fetch_max_ms": 0.0, "last_fetch_ms": 0.0,
+        }
+
+    def get_token(self) -> str:
+        """Current token; blocks on a fetch only when nothing usable is cached."""
+        start_refresh = False
+        with self._lock:
+            self._stats["requests"] += 1
+            token = self._usable_token_locked()
+            if token is not None:
+                self._stats["cache_hits"] += 1
+                if self._clock() >= self._expires_on - self.refresh_margin_seconds and not self._refreshing:
+                    self._refreshing = start_refresh = True
+        if start_refresh:
+            threading.Thread(target=self._refresh_in_background, name="access-token-refresh", daemon=True).start()
+        if token is not None:
+            return token
+
+        with self._fetch_lock:
+            # Another caller may have fetched while we waited
+            with self._lock:
+                token = self._usable_token_locked()
+            return token if token is not None else self._fetch()
+
+    def _usable_token_locked(self) -> Optional[str]:
+        if self._token is not None and self._clock() < self._expires_on - self.min_validity_seconds:
+            return self._token
+        return None
+
+    def _fetch(self) -> str:
+        # Called with _fetch_lock held (one fetch at a time); cache hits are not blocked meanwhile
+        if self._credential is None:
+            self._credential = self._credential_factory()
+        started = time.perf_counter()
+        try:
+            access_token = self._credential.get_token(self.scope)
+        except Exception:
+            with self._lock:
+                self._stats["fetch_failures"] += 1
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._stats["fetches"] += 1
+            self._stats["fetch_total_ms"] += elapsed_ms
+            self._stats["fetch_max_ms"] = max(self._stats["fetch_max_ms"], elapsed_ms)
+            self._stats["last_fetch_ms"] = elapsed_ms
+            self._token = access_token.token
+            self._expires_on = float(access_token.expires_on)
+            valid_for = self._expires_on - self._clock()
+        logger.info(f"Access token for {self.scope} fetched in {elapsed_ms:.0f} ms (valid {valid_for:.0f}s)")
+        return access_token.token
+
+    def _refresh_in_background(self) -> None:
+        try:
+            with self._fetch_lock:
+                with self._lock:
+                    self._stats["background_refreshes"] += 1
+                self._fetch()
+        except Exception as e:
+            # The cached token is still valid; the next caller in the refresh window retries
+            logger.warning(f"Background refresh of access token for {self.scope} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            expires_in = self._expires_on - self._clock() if self._token is not None else None
+        stats["fetch_avg_ms"] = round(stats["fetch_total_ms"] / stats["fetches"], 2) if stats["fetches"] else 0.0
+        stats["fetch_total_ms"] = round(stats["fetch_total_ms"], 2)
+        stats["fetch_max_ms"] = round(stats["fetch_max_ms"], 2)
+        stats["last_fetch_ms"] = round(stats["last_fetch_ms"], 2)
+        stats["expires_in_seconds"] = round(expires_in, 1) if expires_in is not None else None
+        return stats
+
+
+def odbc_token_struct(token: str) -> bytes:
+    """Token in the length-prefixed UTF-16-LE layout the ODBC driver expects"""
+    token_bytes = token.encode("utf-16-le")
+    return struct.pack("=i", len(token_bytes)) + token_bytes
+
+
+sql_token_provider = AccessTokenProvider(
+    SQL_SCOPE,
+    refresh_margin_seconds=settings.sql_token_refresh_margin_seconds,
+)
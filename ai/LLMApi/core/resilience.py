@@ -0,0 +1,364 @@
+"""
+Retry + circuit breaking for outbound dependencies (OpenAI, Blob Storage, Service Bus, SQL).
+
+Each dependency gets one `ResilientDependency` per process holding:
+- a retry policy (decorrelated jitter, Retry-After aware, error classification),
+- a retry budget (retries limited to a fraction of traffic so an outage is not amplified),
+- a circuit breaker (closed -> open after N consecutive outage failures -> half-open probe);
+  throttling is retried after the requested wait but never opens the circuit.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Awaitable, Callable, TypeVar
+
+import openai
+from azure.core import exceptions as azure_exceptions
+from azure.servicebus import exceptions as servicebus_exceptions
+from sqlalchemy import exc as sqlalchemy_exceptions
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Azure SQL transient error numbers (throttling, failover, deadlock victim, etc.)
+_SQL_TRANSIENT_ERRORS = ("1205", "4060", "4221", "10053", "10054", "10060", "10928", "10929",
+                         "40197", "40501", "40613", "49918", "49919", "49920", "HYT00", "08S01")
+# Azure SQL "resource limit reached" / "service busy": throttling, not an outage
+_SQL_THROTTLING_ERRORS = ("10928", "10929", "40501")
+_RETRYABLE_HTTP_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class PermanentError(Exception):
+    """Raised for failures that will never succeed on retry (bad input, unsupported file, ...)."""
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the dependency while its circuit is open."""
+
+
+@dataclass(frozen=True)
+class ErrorClassification:
+    retryable: bool
+    retry_after: float | None = None
+    # False for throttling (429, Retry-After, 409 conflicts): the dependency is up but asking us to
+    # back off, so the retry honours the wait but the circuit breaker does not count it
+    counts_as_failure: bool = True
+
+
+def _retry_after_from_headers(headers: Any) -> float | None:
+    if not headers:
+        return None
+    for name in ("retry-after-ms", "x-ms-retry-after-ms"):
+        raw = headers.get(name)
+        if raw:
+            try:
+                return float(raw) / 1000.0
+            except ValueError:
+                pass
+    raw = headers.get("retry-after")
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            return None
+    return None
+
+
+def _classify_http_status(status: int, retry_after: float | None) -> ErrorClassification:
+    # Only server errors and request timeouts say the dependency is unhealthy
+    return ErrorClassification(
+        status in _RETRYABLE_HTTP_STATUS or status >= 500,
+        retry_after,
+        counts_as_failure=(status >= 500 or status == 408) and retry_after is None,
+    )
+
+
+def classify_error(exc: BaseException) -> ErrorClassification:
+    """
+    Decide whether `exc` is worth retrying and how long the server asked us to wait.
+    Only transport failures, throttling and server errors are transient; anything else (bad
+    input, unparseable or invalid model output, ...) is passed to the caller unretried.
+    """
+    if isinstance(exc, (PermanentError, CircuitOpenError)):
+        return ErrorClassification(False)
+
+    # OpenAI
+    if isinstance(exc, (openai.APITimeoutError, openai.APIConnectionError)):
+        return ErrorClassification(True)
+    if isinstance(exc, openai.APIStatusError):
+        retry_after = _retry_after_from_headers(exc.response.headers if exc.response is not None else None)
+        return _classify_http_status(exc.status_code, retry_after)
+
+    # Service Bus (before azure.core: its errors subclass AzureError)
+    if isinstance(exc, (servicebus_exceptions.ServiceBusAuthenticationError,
+                        servicebus_exceptions.ServiceBusAuthorizationError,
+                        servicebus_exceptions.MessagingEntityNotFoundError,
+                        servicebus_exceptions.MessagingEntityDisabledError,
+                        servicebus_exceptions.MessageSizeExceededError)):
+        return ErrorClassification(False)
+    if isinstance(exc, servicebus_exceptions.ServiceBusError):
+        return ErrorClassification(bool(getattr(exc, "_retryable", True)))
+
+    # Blob Storage / azure.core
+    if isinstance(exc, (azure_exceptions.ClientAuthenticationError, azure_exceptions.ResourceNotFoundError,
+                        azure_exceptions.ResourceExistsError)):
+        return ErrorClassification(False)
+    if isinstance(exc, (azure_exceptions.ServiceRequestError, azure_exceptions.ServiceResponseError)):
+        return ErrorClassification(True)
+    if isinstance(exc, azure_exceptions.HttpResponseError):
+        response = getattr(exc, "response", None)
+        retry_after = _retry_after_from_headers(getattr(response, "headers", None))
+        return _classify_http_status(exc.status_code or 0, retry_after)
+
+    # SQL
+    if isinstance(exc, sqlalchemy_exceptions.DBAPIError):
+        if exc.connection_invalidated:
+            return ErrorClassification(True)
+        if isinstance(exc, (sqlalchemy_exceptions.IntegrityError, sqlalchemy_exceptions.ProgrammingError)):
+            return ErrorClassification(False)
+        message = str(exc.orig) if exc.orig is not None else str(exc)
+        return ErrorClassification(
+            any(code in message for code in _SQL_TRANSIENT_ERRORS),
+            counts_as_failure=not any(code in message for code in _SQL_THROTTLING_ERRORS),
+        )
+    if isinstance(exc, sqlalchemy_exceptions.TimeoutError):  # pool checkout timeout
+        return ErrorClassification(True)
+
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return ErrorClassification(True)
+    return ErrorClassification(False)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    max_retry_after: float = 60.0
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: sleep = min(cap, uniform(base, previous * 3))."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+
+class RetryBudget:
+    """Token bucket: every call deposits `ratio` tokens, every retry spends one; `min_per_minute` always refills."""
+
+    def __init__(self, ratio: float, min_per_minute: float) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_minute / 60.0
+        self.capacity = max(min_per_minute, 1.0)
+        self._balance = self.capacity
+        self._last = time.monotonic()
+        self._lock = Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(self.capacity, self._balance + (now - self._last) * self.min_per_second)
+        self._last = now
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._refill()
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                return True
+            return False
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_seconds:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_seconds:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: let exactly one probe through
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Returns True when this failure opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                opened = self._state != self.OPEN
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+                return opened
+            return False
+
+    def release_probe(self) -> None:
+        """A half-open probe ended with a non-transient error: allow the next probe."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class ResilientDependency:
+    def __init__(self, name: str, policy: RetryPolicy, breaker: CircuitBreaker, budget: RetryBudget) -> None:
+        self.name = name
+        self.policy = policy
+        self.breaker = breaker
+        self.budget = budget
+        self._stats = {"calls": 0, "retries": 0, "failures": 0, "rejected_open": 0, "budget_exhausted": 0}
+        self._stats_lock = Lock()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def _before_attempt(self) -> None:
+        if not self.breaker.allow():
+            self._count("rejected_open")
+            raise CircuitOpenError(f"{self.name} circuit is open; failing fast")
+
+    def _after_failure(self, exc: BaseException, attempt: int, delay: float, label: str) -> float | None:
+        """Record the failure; return the sleep before the next attempt, or None to give up."""
+        classification = classify_error(exc)
+        if classification.retryable and classification.counts_as_failure:
+            if self.breaker.record_failure():
+                logger.error(f"[{label}] {self.name} circuit opened after repeated failures: {exc}")
+        else:
+            self.breaker.release_probe()
+        if not classification.retryable or attempt >= self.policy.max_attempts:
+            self._count("failures")
+            return None
+        if not self.budget.try_spend():
+            self._count("budget_exhausted")
+            self._count("failures")
+            logger.warning(f"[{label}] {self.name} retry budget exhausted; not retrying: {exc}")
+            return None
+        next_delay = self.policy.next_delay(delay)
+        if classification.retry_after is not None:
+            next_delay = max(next_delay, min(classification.retry_after, self.policy.max_retry_after))
+        self._count("retries")
+        logger.warning(f"[{label}] {self.name} attempt {attempt} failed, retrying in {next_delay:.2f}s: {exc}")
+        return next_delay
+
+    async def call_async(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        label = kwargs.get("request_id") or "-"
+        self._count("calls")
+        self.budget.record_call()
+        delay = self.policy.base_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            self._before_attempt()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as exc:
+                next_delay = self._after_failure(exc, attempt, delay, label)
+                if next_delay is None:
+                    raise
+                delay = next_delay
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled (hedge loser, host shutdown): says nothing about the dependency, but a
+                # half-open probe must not stay in flight or the circuit never closes again
+                self.breaker.release_probe()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        label = kwargs.get("request_id") or "-"
+        self._count("calls")
+        self.budget.record_call()
+        delay = self.policy.base_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            self._before_attempt()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                next_delay = self._after_failure(exc, attempt, delay, label)
+                if next_delay is None:
+                    raise
+                delay = next_delay
+                time.sleep(delay)
+                continue
+            except BaseException:
+                self.breaker.release_probe()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["circuit"] = self.breaker.state
+        return stats
+
+
+def _build(name: str, *, max_attempts: int) -> ResilientDependency:
+    return ResilientDependency(
+        name,
+        RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay=settings.retry_base_delay_seconds,
+            max_delay=settings.retry_max_delay_seconds,
+        ),
+        CircuitBreaker(settings.circuit_failure_threshold, settings.circuit_recovery_seconds),
+        RetryBudget(settings.retry_budget_ratio, settings.retry_budget_min_per_minute),
+    )
+
+
+# Per-process singletons. Model output problems (invalid JSON, failed validation) are not
+# dependency failures: they are neither retried here nor counted by the shared OpenAI breaker.
+openai_resilience = _build("openai", max_attempts=settings.max_retry_attempts)
+blob_resilience = _build("blob_storage", max_attempts=settings.max_retry_attempts)
+servicebus_resilience = _build("service_bus", max_attempts=settings.max_retry_attempts)
+sql_resilience = _build("sql", max_attempts=settings.max_retry_attempts)
+
+dependencies = {d.name: d for d in (openai_resilience, blob_resilience, servicebus_resilience, sql_resilience)}
+
+
+def get_resilience_stats() -> dict[str, Any]:
+    return {name: dep.get_stats() for name, dep in dependencies.items()}
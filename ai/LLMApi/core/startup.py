@@ -0,0 +1,108 @@
+"""
+Lazy initialization of process-wide dependencies (SQL engine, Blob Storage client).
+
+Nothing connects at import time, so cold starts of routes that never touch a dependency
+(health, swagger, metrics) do not pay for its handshake. Each component initializes on
+first use, or all of them concurrently when `warm_up()` runs (Functions warm-up trigger,
+FastAPI startup). Init time per component is recorded for the metrics endpoint.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, Iterable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Approximates worker start: this module is imported while the app modules load
+_PROCESS_START = time.perf_counter()
+
+
+class LazyComponent(Generic[T]):
+    def __init__(self, name: str, initializer: Callable[[], T]) -> None:
+        self.name = name
+        self._initializer = initializer
+        self._lock = threading.Lock()
+        # Held only while stats are copied or updated, never during the initializer (which holds _lock)
+        self._stats_lock = threading.Lock()
+        self._ready = False
+        self._value: Optional[T] = None
+        self._stats: Dict[str, Any] = {
+            "state": "pending", "attempts": 0, "init_ms": None, "ready_after_start_ms": None, "error": None,
+        }
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def get(self) -> T:
+        """Initialized value; the first caller runs the initializer, concurrent callers wait for it.
+        A failed initialization raises and is retried by the next caller."""
+        if self._ready:
+            return self._value
+        with self._lock:
+            if self._ready:
+                return self._value
+            with self._stats_lock:
+                self._stats.update(state="initializing", attempts=self._stats["attempts"] + 1)
+            started = time.perf_counter()
+            try:
+                value = self._initializer()
+            except Exception as e:
+                with self._stats_lock:
+                    self._stats.update(state="failed", init_ms=round((time.perf_counter() - started) * 1000.0, 1),
+                                       error=str(e))
+                raise
+            finished = time.perf_counter()
+            init_ms = round((finished - started) * 1000.0, 1)
+            with self._stats_lock:
+                self._stats.update(
+                    state="ready", init_ms=init_ms,
+                    ready_after_start_ms=round((finished - _PROCESS_START) * 1000.0, 1), error=None,
+                )
+            self._value, self._ready = value, True
+            logger.info(f"{self.name} initialized in {init_ms} ms")
+            return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of the init stats; does not wait for an initialization in progress."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+_components: Dict[str, LazyComponent] = {}
+
+
+def lazy_component(name: str, initializer: Callable[[], T]) -> LazyComponent[T]:
+    """Register a dependency initialized on first `get()` or by `warm_up()`."""
+    component = LazyComponent(name, initializer)
+    _components[name] = component
+    return component
+
+
+def warm_up(names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Initialize the registered components concurrently; failures are reported, not raised."""
+    components = [_components[name] for name in names] if names is not None else list(_components.values())
+    pending = [component for component in components if not component.ready]
+    started = time.perf_counter()
+
+    def initialize(component: LazyComponent) -> None:
+        try:
+            component.get()
+        except Exception as e:
+            logger.warning(f"Warm-up of {component.name} failed: {e}")
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="warm-up") as executor:
+            list(executor.map(initialize, pending))
+        logger.info(f"Warm-up of {len(pending)} component(s) finished in "
+                    f"{(time.perf_counter() - started) * 1000.0:.0f} ms")
+    return {component.name: component.get_stats() for component in components}
+
+
+def get_startup_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: component.get_stats() for name, component in _components.items()}
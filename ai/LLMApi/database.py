@@ -1,20 +1,33 @@
+import asyncio
+import contextvars
 import logging
 import urllib.parse
-import struct
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
-from azure.identity import DefaultAzureCredential
+from functools import lru_cache, partial
+from threading import Lock
+from typing import Any, Callable, Mapping, TypeVar
+from sqlalchemy import Table, create_engine, event, insert, inspect as sa_inspect, text
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.orm import Mapper, sessionmaker, Session
+from sqlalchemy.pool import QueuePool
+from core.startup import lazy_component
+from core.access_token import SQL_COPT_SS_ACCESS_TOKEN, odbc_token_struct, sql_token_provider
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Context variable to track current user for audit fields
 _current_user: ContextVar[str] = ContextVar('current_user', default='system')
 
 engine = None
-SessionLocal = None
+_session_factory = None
+_db_executor = None
+_db_executor_lock = Lock()
 
 def set_current_user(user_id: str) -> None:
     """Set the current user for audit tracking"""
@@ -36,6 +49,208 @@ def audit_context(user_id: str):
     
     return AuditContext()
 
+_INSERT_AUDIT_COLUMNS = ('CreatedBy', 'UpdatedBy')
+_UPDATE_AUDIT_COLUMNS = ('UpdatedBy',)
+# (insert, update) audit columns per mapped class and per table, computed once per mapper
+# instead of probing every flushed object with hasattr
+_audit_registry: dict = {}
+
+def audit_columns(key) -> tuple:
+    """(columns stamped on insert, columns stamped on update) for a mapped class or Table"""
+    entry = _audit_registry.get(key)
+    if entry is None:
+        columns = key.c if isinstance(key, Table) else sa_inspect(key).columns
+        entry = (
+            tuple(name for name in _INSERT_AUDIT_COLUMNS if name in columns),
+            tuple(name for name in _UPDATE_AUDIT_COLUMNS if name in columns),
+        )
+        _audit_registry[key] = entry
+    return entry
+
+@event.listens_for(Mapper, "mapper_configured")
+def _register_audited_mapper(mapper, class_):
+    audit_columns(class_)
+    audit_columns(mapper.local_table)
+
+@event.listens_for(Session, "before_flush")
+def receive_before_flush(session, flush_context, instances):
+    """Automatically populate audit fields before flush"""
+    current_user = get_current_user()
+
+    for obj in session.new:
+        for name in audit_columns(type(obj))[0]:
+            setattr(obj, name, current_user)
+
+    for obj in session.dirty:
+        for name in audit_columns(type(obj))[1]:
+            setattr(obj, name, current_user)
+
+def _statement_value_keys(statement) -> set:
+    """
+    Column names an INSERT/UPDATE sets through .values() / ordered_values(), read from the
+    statement itself: compiling it to find them would cost a full SQL compilation per execute
+    """
+    mappings = [statement._values or {}, dict(getattr(statement, "_ordered_values", None) or ())]
+    for rows in getattr(statement, "_multi_values", None) or ():
+        mappings.extend(rows)
+    keys = set()
+    for mapping in mappings:
+        if not isinstance(mapping, Mapping):  # positional multi-values row: every column is set
+            return {column.key for column in statement.table.c}
+        keys.update(getattr(key, "key", key) for key in mapping)
+    return keys
+
+@event.listens_for(Session, "do_orm_execute")
+def receive_do_orm_execute(orm_execute_state):
+    """
+    Stamp audit fields on INSERT/UPDATE statements executed through a Session (bulk_insert,
+    executemany updates, update().where()), which bypass before_flush.
+    Values passed explicitly, in the parameters or with .values(), are left alone.
+    """
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update):
+        return None
+    statement = orm_execute_state.statement
+    table = getattr(statement, "table", None)
+    if not isinstance(table, Table):
+        return None
+    inserting, updating = audit_columns(table)
+    names = inserting if orm_execute_state.is_insert else updating
+    if not names:
+        return None
+
+    current_user = get_current_user()
+    if orm_execute_state.is_executemany:
+        params = [{name: current_user for name in names if name not in row} for row in orm_execute_state.parameters]
+        if not any(params):
+            return None
+    else:
+        if orm_execute_state.parameters is None:
+            orm_execute_state.parameters = {}
+        # Execution parameters override .values(), so columns the statement already sets are skipped
+        statement_values = _statement_value_keys(statement)
+        params = {name: current_user for name in names
+                  if name not in orm_execute_state.parameters and name not in statement_values}
+        if not params:
+            return None
+    return orm_execute_state.invoke_statement(params=params)
+
+@lru_cache(maxsize=None)
+def column_keys(model_class) -> frozenset:
+    """Mapped column attribute names of an ORM model"""
+    return frozenset(attr.key for attr in sa_inspect(model_class).column_attrs)
+
+@lru_cache(maxsize=None)
+def insertable_columns(model_class) -> tuple:
+    """
+    Columns a bulk-inserted row of `model_class` carries: every mapped column except the ones
+    with a server default (Id, CreatedAt, UpdatedAt, IsDeleted, ...) and the audit columns,
+    which receive_do_orm_execute stamps only when a row leaves them out
+    """
+    return tuple(
+        attr.key for attr in sa_inspect(model_class).column_attrs
+        if attr.key not in _INSERT_AUDIT_COLUMNS and all(column.server_default is None for column in attr.columns)
+    )
+
+def normalize_row(model_class, values) -> dict:
+    """`values` as a row over exactly insertable_columns(model_class): unknown keys dropped, missing ones None"""
+    return {column: values.get(column) for column in insertable_columns(model_class)}
+
+def bulk_insert(db: Session, model_class, rows: list[dict]) -> int:
+    """
+    Insert `rows` (attribute name -> value) with executemany instead of one ORM object per row.
+    SQLAlchemy starts a new batch whenever the key set changes, so build the rows with
+    normalize_row(): a table's rows then go out as a single batch (one round trip with
+    fast_executemany). None is sent as NULL (render_nulls) rather than dropping the key, which
+    would split the batch again; server-default columns must therefore be left out of the rows.
+    Audit fields are stamped by receive_do_orm_execute.
+    """
+    if not rows:
+        return 0
+    db.execute(insert(model_class).execution_options(render_nulls=True), rows)
+    return len(rows)
+
+class PoolMetrics:
+    """Checkout wait, overflow and invalidation counters for the engine's connection pool (per process)"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._stats = {
+            "checkouts": 0, "checkout_wait_total_ms": 0.0, "checkout_wait_max_ms": 0.0, "checkout_timeouts": 0,
+            "overflow_checkouts": 0, "overflow_max": 0, "connects": 0, "invalidations": 0, "soft_invalidations": 0,
+        }
+
+    def record_checkout(self, wait_ms: float, overflow: int = 0, timed_out: bool = False) -> None:
+        with self._lock:
+            stats = self._stats
+            stats["checkout_wait_total_ms"] += wait_ms
+            stats["checkout_wait_max_ms"] = max(stats["checkout_wait_max_ms"], wait_ms)
+            if timed_out:
+                stats["checkout_timeouts"] += 1
+                return
+            stats["checkouts"] += 1
+            if overflow > 0:
+                stats["overflow_checkouts"] += 1
+                stats["overflow_max"] = max(stats["overflow_max"], overflow)
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        attempts = stats["checkouts"] + stats["checkout_timeouts"]
+        stats["checkout_wait_avg_ms"] = round(stats["checkout_wait_total_ms"] / attempts, 3) if attempts else 0.0
+        stats["checkout_wait_total_ms"] = round(stats["checkout_wait_total_ms"], 3)
+        stats["checkout_wait_max_ms"] = round(stats["checkout_wait_max_ms"], 3)
+        return stats
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waited for a free (or overflow) connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            pool_metrics.record_checkout((time.perf_counter() - started) * 1000.0, timed_out=True)
+            raise
+        pool_metrics.record_checkout((time.perf_counter() - started) * 1000.0, overflow=self.overflow())
+        return connection
+
+
+@event.listens_for(InstrumentedQueuePool, "connect")
+def _count_connect(dbapi_connection, connection_record):
+    pool_metrics.increment("connects")
+
+@event.listens_for(InstrumentedQueuePool, "invalidate")
+def _count_invalidate(dbapi_connection, connection_record, exception):
+    # Raised for dead connections found by pre-ping or by a failing statement; the pool reconnects
+    pool_metrics.increment("invalidations")
+    logger.warning(f"Database connection invalidated: {exception}")
+
+@event.listens_for(InstrumentedQueuePool, "soft_invalidate")
+def _count_soft_invalidate(dbapi_connection, connection_record, exception):
+    pool_metrics.increment("soft_invalidations")
+
+def get_pool_stats() -> dict:
+    """Pool counters plus the live pool state (empty when the engine is not initialized)"""
+    stats = pool_metrics.get_stats()
+    pool = engine.pool if engine is not None else None
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": settings.db_max_overflow,
+        })
+    return stats
+
 def create_sqlalchemy_url(connection_string: str) -> str:
     """Convert ODBC connection string to SQLAlchemy URL"""
     try:
@@ -45,9 +260,9 @@ def create_sqlalchemy_url(connection_string: str) -> str:
         logger.error(f"Error creating SQLAlchemy URL: {e}")
         raise
 
-def should_use_managed_identity() -> bool:
+def should_use_managed_identity(connection_string: str | None = None) -> bool:
     """Determine if we should use Managed Identity based on environment"""
-    conn_str = settings.database_connection_string.lower()
+    conn_str = (connection_string if connection_string is not None else settings.database_connection_string).lower()
     
     # Check if connection string has SQL authentication credentials
     has_sql_auth = any(auth in conn_str for auth in ['uid=', 'user id=', 'pwd=', 'password='])
@@ -61,11 +276,12 @@ def should_use_managed_identity() -> bool:
     logger.info(f"Authentication check - Has SQL Auth: {has_sql_auth}, Has Trusted Connection: {has_trusted_connection}, Using Managed Identity: {use_managed_identity}")
     return use_managed_identity
 
-def get_connection_string_with_auth() -> str:
+def get_connection_string_with_auth(base_conn_str: str | None = None) -> str:
     """Get connection string with appropriate authentication method"""
-    base_conn_str = settings.database_connection_string
+    if base_conn_str is None:
+        base_conn_str = settings.database_connection_string
     
-    if should_use_managed_identity():
+    if should_use_managed_identity(base_conn_str):
         # When using access token, connection string must be clean of auth parameters
         logger.info("Using Managed Identity authentication with access token")
         return base_conn_str.replace(';Authentication=ActiveDirectoryMsi', '')
@@ -73,59 +289,61 @@ def get_connection_string_with_auth() -> str:
         logger.info("Using SQL Server authentication from connection string")
         return base_conn_str
 
-def initialize_database():
-    """Initialize SQLAlchemy engine with appropriate authentication"""
-    global engine, SessionLocal
+def _build_engine(connection_string: str, poolclass=InstrumentedQueuePool):
+    """Pooled mssql+pyodbc engine for an ODBC connection string (token injected under Managed Identity)"""
+    sqlalchemy_url = create_sqlalchemy_url(connection_string)
+    # fast_executemany: pyodbc sends an executemany batch as one parameter array (see bulk_insert)
+    # pool_pre_ping/pool_recycle: connections dropped by Azure SQL while idle are replaced at checkout
+    # instead of failing the first statement of the CV being processed
+    new_engine = create_engine(
+        sqlalchemy_url,
+        echo=False,
+        fast_executemany=settings.db_fast_executemany,
+        poolclass=poolclass,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+
+    if should_use_managed_identity(connection_string):
+        @event.listens_for(new_engine, "do_connect")
+        def provide_token(dialect, conn_rec, cargs, cparams):
+            # One cached credential/token for the process (refreshed in the background before expiry)
+            try:
+                token = sql_token_provider.get_token()
+                cparams["attrs_before"] = {SQL_COPT_SS_ACCESS_TOKEN: odbc_token_struct(token)}
+            except Exception as e:
+                logger.error(f"Failed to inject Azure AD token: {e}")
+                logger.error("Make sure Managed Identity is enabled and has access to the database")
+                raise
+
+    return new_engine
+
+def _connect_database() -> sessionmaker:
+    """Create the SQLAlchemy engine with appropriate authentication and open the first pooled connection"""
+    global engine, _session_factory
 
     try:
         connection_string = get_connection_string_with_auth()
         safe_conn_str = connection_string.replace('AccountKey=', 'AccountKey=***')
         logger.info(f"Using connection string: {safe_conn_str}")
         
-        sqlalchemy_url = create_sqlalchemy_url(connection_string)
-        engine = create_engine(sqlalchemy_url, echo=False)
-
-        if should_use_managed_identity():
-            @event.listens_for(engine, "do_connect")
-            def provide_token(dialect, conn_rec, cargs, cparams):
-                try:
-                    logger.info("Acquiring Azure AD token for database connection...")
-                    credential = DefaultAzureCredential()
-                    token = credential.get_token("https://database.windows.net/.default").token
-                    token_bytes = token.encode("utf-16-le")
-                    token_struct = struct.pack("=i", len(token_bytes)) + token_bytes
-                    cparams["attrs_before"] = {1256: token_struct}  # SQL_COPT_SS_ACCESS_TOKEN
-                    logger.info("Azure AD token injected successfully")
-                except Exception as e:
-                    logger.error(f"Failed to inject Azure AD token: {e}")
-                    logger.error("Make sure Managed Identity is enabled and has access to the database")
-                    raise
+        engine = _build_engine(connection_string)
 
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        
-        # Register event listener for audit fields
-        @event.listens_for(Session, "before_flush")
-        def receive_before_flush(session, flush_context, instances):
-            """Automatically populate audit fields before flush"""
-            current_user = get_current_user()
-            
-            for obj in session.new:
-                if hasattr(obj, 'CreatedBy'):
-                    obj.CreatedBy = current_user
-                if hasattr(obj, 'UpdatedBy'):
-                    obj.UpdatedBy = current_user
-            
-            for obj in session.dirty:
-                if hasattr(obj, 'UpdatedBy'):
-                    obj.UpdatedBy = current_user
-        
         with engine.connect() as conn:
-            result = conn.execute("SELECT 1 as test").fetchone()
+            result = conn.execute(text("SELECT 1 as test")).fetchone()
             logger.info(f"Database connection test successful: {result}")
-        
+
+        _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
         logger.info("Database initialized successfully with audit tracking")
+        return _session_factory
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
+        if engine is not None:
+            engine.dispose()
+            engine = None
         if should_use_managed_identity():
             logger.error("Managed Identity troubleshooting:")
             logger.error("1. Ensure System Managed Identity is enabled on your Azure Function App")
@@ -133,21 +351,207 @@ def initialize_database():
             logger.error("3. For local development, ensure you're logged in with 'az login'")
         raise
 
+# Initialized on first use or by core.startup.warm_up(), not at import
+_database = lazy_component("database", _connect_database)
+
+def initialize_database():
+    """Initialize the database engine if it is not initialized yet"""
+    _database.get()
+
+class _LazySessionLocal:
+    """Session factory that initializes the engine on first call (importers keep this reference)"""
+
+    def __call__(self, **kwargs) -> Session:
+        return _database.get()(**kwargs)
+
+SessionLocal = _LazySessionLocal()
+
 def get_db():
     """Provide a database session"""
-    if SessionLocal is None:
-        initialize_database()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+def read_replica_connection_string() -> str:
+    """Connection string of the read replica, or "" when reads stay on the primary"""
+    if settings.database_read_connection_string:
+        return settings.database_read_connection_string
+    if settings.db_read_scale_out and settings.database_connection_string:
+        base = settings.database_connection_string.strip().rstrip(";")
+        if "applicationintent=" in base.lower():
+            return base
+        return f"{base};ApplicationIntent=ReadOnly"
+    return ""
+
+read_engine = None
+
+def _connect_read_replica() -> sessionmaker | None:
+    """Engine for the read replica (plain QueuePool, so pool_metrics keeps describing the primary)"""
+    global read_engine
+
+    connection_string = read_replica_connection_string()
+    if not connection_string:
+        return None
+    try:
+        read_engine = _build_engine(get_connection_string_with_auth(connection_string), poolclass=QueuePool)
+        with read_engine.connect() as conn:
+            conn.execute(text("SELECT 1 as test")).fetchone()
+        logger.info("Read replica connection test successful")
+        return sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    except Exception:
+        if read_engine is not None:
+            read_engine.dispose()
+            read_engine = None
+        raise
+
+# Seconds the readable secondaries are behind, as reported by the primary (Azure SQL, SQL Server 2016+;
+# needs VIEW DATABASE STATE). NULL when no secondary reports.
+_REPLICA_LAG_QUERY = "SELECT MAX(secondary_lag_seconds) FROM sys.dm_database_replica_states WHERE is_local = 0"
+
+def _probe_replica_lag() -> float | None:
+    initialize_database()
+    with engine.connect() as conn:
+        lag = conn.execute(text(_REPLICA_LAG_QUERY)).scalar()
+    return float(lag) if lag is not None else None
+
+class ReadReplicaRouter:
+    """
+    Session factory for read-only work. Sessions go to the read replica when one is configured,
+    and to the primary while the replica cannot be reached (for DB_READ_REPLICA_RETRY_SECONDS)
+    or lags more than DB_READ_REPLICA_MAX_LAG_SECONDS. Writes must keep using SessionLocal.
+    Lag is measured on the request path at most every DB_READ_REPLICA_LAG_CHECK_SECONDS.
+    """
+
+    def __init__(
+        self,
+        initializer: Callable[[], sessionmaker | None] = _connect_read_replica,
+        lag_probe: Callable[[], float | None] = _probe_replica_lag,
+        primary: Callable[[], Session] | None = None,
+        enabled: bool | None = None,
+        name: str = "database_read_replica",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = bool(read_replica_connection_string()) if enabled is None else enabled
+        self._initializer = initializer
+        self._lag_probe = lag_probe
+        self._primary = primary or SessionLocal
+        self._clock = clock
+        self._replica = lazy_component(name, self._initialize)
+        self._lock = Lock()
+        self._unavailable_until = 0.0
+        self._lag_seconds: float | None = None
+        self._lag_checked_at: float | None = None
+        self._stats = {
+            "replica_sessions": 0, "primary_sessions": 0, "connect_failures": 0, "lag_fallbacks": 0,
+            "lag_checks": 0, "lag_check_failures": 0, "last_error": None,
+        }
+
+    def _initialize(self) -> sessionmaker | None:
+        if not self.enabled:
+            return None
+        try:
+            return self._initializer()
+        except Exception as e:
+            self._mark_unavailable(e)
+            raise
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        with self._lock:
+            self._unavailable_until = self._clock() + settings.db_read_replica_retry_seconds
+            self._stats["connect_failures"] += 1
+            self._stats["last_error"] = str(error)
+        logger.warning(f"Read replica unavailable, reading from the primary for "
+                       f"{settings.db_read_replica_retry_seconds:.0f}s: {error}")
+
+    def _refresh_lag(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._lag_checked_at is not None and now - self._lag_checked_at < settings.db_read_replica_lag_check_seconds:
+                return
+            # Claimed before probing so concurrent requests do not probe too
+            self._lag_checked_at = now
+            self._stats["lag_checks"] += 1
+        try:
+            lag = self._lag_probe()
+        except Exception as e:
+            lag = None
+            with self._lock:
+                self._stats["lag_check_failures"] += 1
+            logger.warning(f"Could not measure read replica lag: {e}")
+        with self._lock:
+            self._lag_seconds = lag
+
+    def _use_replica(self) -> bool:
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self._clock() < self._unavailable_until:
+                return False
+        self._refresh_lag()
+        max_lag = settings.db_read_replica_max_lag_seconds
+        with self._lock:
+            if max_lag and self._lag_seconds is not None and self._lag_seconds > max_lag:
+                self._stats["lag_fallbacks"] += 1
+                return False
+        return True
+
+    def session(self) -> Session:
+        """Read-only session: on the replica when it is usable, otherwise on the primary"""
+        if self._use_replica():
+            try:
+                factory = self._replica.get()
+            except Exception:
+                factory = None  # recorded by _initialize
+            if factory is not None:
+                db = factory()
+                try:
+                    # Check out now, so an unreachable replica falls back here instead of failing the request
+                    db.connection()
+                except Exception as e:
+                    db.close()
+                    self._mark_unavailable(e)
+                else:
+                    with self._lock:
+                        self._stats["replica_sessions"] += 1
+                    db.info["read_replica"] = True
+                    return db
+        with self._lock:
+            self._stats["primary_sessions"] += 1
+        return self._primary()
+
+    __call__ = session
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            now = self._clock()
+            stats.update(
+                enabled=self.enabled,
+                available=self.enabled and now >= self._unavailable_until,
+                lag_seconds=self._lag_seconds,
+                lag_age_seconds=round(now - self._lag_checked_at, 1) if self._lag_checked_at is not None else None,
+            )
+        pool = read_engine.pool if read_engine is not None else None
+        if isinstance(pool, QueuePool):
+            stats.update(pool_size=pool.size(), pool_checked_out=pool.checkedout())
+        return stats
+
+read_replica = ReadReplicaRouter()
+
+def get_read_db():
+    """Provide a session for read-only requests (read replica when configured)"""
+    db = read_replica.session()
+    try:
+        yield db
+    finally:
+        db.close()
+
 def create_tables():
     """Create database tables"""
     try:
-        if engine is None:
-            initialize_database()
+        initialize_database()
         from models.database import Base
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
@@ -155,8 +559,29 @@ def create_tables():
         logger.error(f"Error creating tables: {e}")
         raise
 
-# Auto-initialize database on import
-try:
-    initialize_database()
-except Exception as e:
-    logger.warning(f"Database initialization failed on import: {e}")
+def _get_db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        with _db_executor_lock:
+            if _db_executor is None:
+                # No more threads than pooled connections: extra work queues here instead of on pool checkout
+                workers = settings.db_executor_max_workers or (settings.db_pool_size + settings.db_max_overflow)
+                _db_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db")
+    return _db_executor
+
+async def run_in_db_executor(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run blocking database work `fn(*args, **kwargs)` on the bounded DB executor so async callers
+    do not block the event loop. Context variables (audit user) are carried into the worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_get_db_executor(), partial(context.run, fn, *args, **kwargs))
+
+def _call_with_session(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    with SessionLocal() as db:
+        return fn(db, *args, **kwargs)
+
+async def run_with_session(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """`fn(db, *args, **kwargs)` with a fresh session, on the DB executor; commits are up to `fn`"""
+    return await run_in_db_executor(_call_with_session, fn, *args, **kwargs)
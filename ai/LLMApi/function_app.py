@@ -6,12 +6,23 @@ import sys
 import uuid
 import asyncio
 from azure_functions.cv_processor import cv_processor
-from database import SessionLocal, set_current_user
+from database import SessionLocal, set_current_user, get_pool_stats, read_replica
 
 from config import settings
 from models.database import File as FileModel, UserProfile, Candidate
 from models.pydantic_models import TranscriptFileReference, TranscriptItem
 from services.interview_scoring_service import interview_scoring_service
+from services.openai_rate_limiter import RequestPriority, openai_rate_limiter
+from services.extraction_cache import extraction_cache
+from services.openai_usage import openai_usage_tracker
+from services.request_hedging import openai_request_hedger
+from services.model_cascade import model_cascade
+from repositories.cv_extraction_repository import cv_extraction_repository
+from repositories.interview_repository import interview_repository
+from services.soft_delete_purge import soft_delete_purge
+from core.resilience import PermanentError, get_resilience_stats
+from core.access_token import sql_token_provider
+from core.startup import get_startup_stats, warm_up
 
 logger = logging.getLogger(__name__)
 
@@ -218,6 +229,20 @@ def openapi_spec(req: func.HttpRequest) -> func.HttpResponse:
         mimetype="application/json"
     )
 
+@app.warm_up_trigger("warmup")
+def warmup(warmup) -> None:
+    """Runs on new instances before they receive traffic: initialize SQL and Blob Storage concurrently"""
+    logging.info(f"Warm-up finished: {json.dumps(warm_up())}")
+
+@app.timer_trigger(schedule=settings.soft_delete_purge_schedule, arg_name="timer", run_on_startup=False, use_monitor=True)
+def soft_delete_purge_function(timer: func.TimerRequest) -> None:
+    """Reclaim soft-deleted extraction rows past the retention window (resumes an unfinished pass)"""
+    if not settings.soft_delete_purge_enabled:
+        return
+    report = soft_delete_purge.run()
+    logging.info(f"Soft-delete purge: completed={report.completed} reclaimed={report.rows_reclaimed} "
+                 f"tables={json.dumps(report.tables)}")
+
 @app.route(route="health", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
 def health_check_http(req: func.HttpRequest) -> func.HttpResponse:
     """Health check endpoint"""
@@ -227,6 +252,29 @@ def health_check_http(req: func.HttpRequest) -> func.HttpResponse:
         mimetype="application/json"
     )
 
+@app.route(route="metrics", methods=["GET"])
+def metrics_http(req: func.HttpRequest) -> func.HttpResponse:
+    """In-process performance counters (per worker process)"""
+    return func.HttpResponse(
+        json.dumps({
+            "openai_rate_limiter": openai_rate_limiter.get_stats(),
+            "extraction_cache": extraction_cache.get_stats(),
+            "resilience": get_resilience_stats(),
+            "openai_usage": openai_usage_tracker.get_stats(),
+            "openai_hedging": openai_request_hedger.get_stats(),
+            "model_cascade": model_cascade.get_stats(),
+            "cv_persistence": cv_extraction_repository.get_stats(),
+            "db_pool": get_pool_stats(),
+            "db_read_replica": read_replica.get_stats(),
+            "sql_token": sql_token_provider.get_stats(),
+            "startup": get_startup_stats(),
+            "soft_delete_purge": soft_delete_purge.get_stats(),
+            "interview_lookup": interview_repository.get_stats(),
+        }),
+        status_code=200,
+        mimetype="application/json"
+    )
+
 @app.route(route="", methods=["GET"])
 def root_http(req: func.HttpRequest) -> func.HttpResponse:
     """Root endpoint"""
@@ -312,7 +360,7 @@ async def upload_file(req: func.HttpRequest) -> func.HttpResponse:
         file_id = str(uuid.uuid4())
 
         # Upload to blob storage using C# pattern
-        folder_path, file_name, upload_success = azure_storage.upload_file(
+        folder_path, file_name, upload_success = await azure_storage.upload_file_async(
             file_content, user_id, file_id, file_extension
         )
         
@@ -384,7 +432,8 @@ async def upload_file(req: func.HttpRequest) -> func.HttpResponse:
             "promptVersion": prompt_version,
             "blobPath": full_blob_path,
             "folderPath": folder_path,
-            "fileName": file_name
+            "fileName": file_name,
+            "priority": RequestPriority.INTERACTIVE.name.lower()  # a user is waiting on this upload
         }
 
         queue_success = await service_bus.send_cv_processing_message(message_data)
@@ -471,7 +520,7 @@ async def webhook_elevenlabs_transcript(req: func.HttpRequest) -> func.HttpRespo
         transcriptFileRef = TranscriptFileReference(**json.loads(payload))
 
         # Download transcript from blob storage
-        blob_content = azure_storage.download_file(transcriptFileRef.blob_path)
+        blob_content = await azure_storage.download_file_async(transcriptFileRef.blob_path)
         if not blob_content:
             raise Exception("Failed to download transcript file from blob storage")
         
@@ -543,7 +592,10 @@ def cv_processor_function(msg: func.ServiceBusMessage) -> None:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
         
-        loop.run_until_complete(cv_processor.process_cv_direct(message_data, db))
+        try:
+            loop.run_until_complete(cv_processor.process_cv_direct(message_data, db))
+        finally:
+            db.close()  # return the connection to the pool
         
         logging.info("CV processed successfully")
         
@@ -560,7 +612,7 @@ def cv_processor_function(msg: func.ServiceBusMessage) -> None:
             "Missing required fields"
         ]
         
-        is_permanent_error = any(perm_error in error_msg for perm_error in permanent_errors)
+        is_permanent_error = isinstance(e, PermanentError) or any(perm_error in error_msg for perm_error in permanent_errors)
         
         if is_permanent_error:
             logging.error(f"Permanent error detected, not retrying: {error_msg}")
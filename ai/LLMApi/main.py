@@ -5,7 +5,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.routes import router
 from database import create_tables
+from core.startup import warm_up
+from services.openai_client import aclose_async_openai_client
 from config import settings
+import asyncio
 import logging
 
 # Configure logging
@@ -32,10 +35,17 @@ app.include_router(router, prefix="/api/v1")
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on startup"""
-    create_tables()
+    """Initialize dependencies concurrently, then database tables, on startup"""
+    # Both block on network handshakes: run them off the event loop
+    await asyncio.to_thread(warm_up)
+    await asyncio.to_thread(create_tables)
     logger.info("Application started successfully")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared OpenAI connection pool of this event loop"""
+    await aclose_async_openai_client()
+
 @app.get("/")
 async def root():
     return {"message": "CV Processing API is running"}
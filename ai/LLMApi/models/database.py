@@ -11,7 +11,7 @@ from typing import Tuple
 
 from sqlalchemy import (
     Column, String, Integer, Boolean, Text, Date, DateTime, JSON, ForeignKey, Float,
-    UniqueConstraint, CheckConstraint, Index, text, event, TypeDecorator
+    UniqueConstraint, CheckConstraint, Index, Computed, text, event, TypeDecorator
 )
 from sqlalchemy.dialects.mssql import UNIQUEIDENTIFIER, ROWVERSION
 from sqlalchemy.ext.declarative import declarative_base
@@ -71,6 +71,19 @@ class BaseDbModel:
     # RowVersion is automatically created and maintained by SQL Server, so we don't include it in SQLAlchemy
 
 
+def _active_profile_index(table: str) -> Index:
+    """
+    Filtered index on UserProfileId over live rows only. Mirrors the *_UserProfileId_Active
+    indexes of the EF migration Add_Filtered_Active_Indexes_For_Profile_Data.
+    Queries must filter `IsDeleted == False` (rendered as the literal `IsDeleted = 0`) to match it.
+    """
+    return Index(
+        f"IX_{table}_UserProfileId_Active",
+        "UserProfileId",
+        mssql_where=text("[IsDeleted] = 0"),
+    )
+
+
 # ================================================================
 # UserProfile
 # ================================================================
@@ -217,9 +230,10 @@ class KeyStrength(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="KeyStrengths")
 
-    __table_args__: Tuple[Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index] = (
         Index('IX_KeyStrengths_UserProfileId', 'UserProfileId'),
         Index('IX_KeyStrengths_StrengthName', 'StrengthName'),
+        _active_profile_index("KeyStrengths"),
     )
 
 
@@ -238,10 +252,11 @@ class Skill(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="Skills")
 
-    __table_args__: Tuple[Index, Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index, Index] = (
         Index('IX_Skills_UserProfileId', 'UserProfileId'),
         Index('IX_Skills_Category', 'Category'),
         Index('IX_Skills_SkillName', 'SkillName'),
+        _active_profile_index("Skills"),
     )
 
 
@@ -262,10 +277,11 @@ class Experience(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="Experiences")
 
-    __table_args__: Tuple[Index, Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index, Index] = (
         Index('IX_Experiences_UserProfileId', 'UserProfileId'),
         Index('IX_Experiences_Organization', 'Organization'),
         Index('IX_Experiences_StartDate', 'StartDate'),
+        _active_profile_index("Experiences"),
     )
 
 
@@ -285,10 +301,11 @@ class Education(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="Educations")
 
-    __table_args__: Tuple[Index, Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index, Index] = (
         Index('IX_Educations_UserProfileId', 'UserProfileId'),
         Index('IX_Educations_Institution', 'Institution'),
         Index('IX_Educations_Degree', 'Degree'),
+        _active_profile_index("Educations"),
     )
 
 
@@ -307,9 +324,10 @@ class ProjectsResearch(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="ProjectsResearch")
 
-    __table_args__: Tuple[Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index] = (
         Index('IX_ProjectsResearch_UserProfileId', 'UserProfileId'),
         Index('IX_ProjectsResearch_Title', 'Title'),
+        _active_profile_index("ProjectsResearch"),
     )
 
 
@@ -327,9 +345,10 @@ class CertificationsLicenses(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="CertificationsLicenses")
 
-    __table_args__: Tuple[Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index] = (
         Index('IX_CertificationsLicenses_UserProfileId', 'UserProfileId'),
         Index('IX_CertificationsLicenses_Name', 'Name'),
+        _active_profile_index("CertificationsLicenses"),
     )
 
 
@@ -347,9 +366,10 @@ class AwardsAchievements(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="AwardsAchievements")
 
-    __table_args__: Tuple[Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index] = (
         Index('IX_AwardsAchievements_UserProfileId', 'UserProfileId'),
         Index('IX_AwardsAchievements_Title', 'Title'),
+        _active_profile_index("AwardsAchievements"),
     )
 
 
@@ -368,9 +388,10 @@ class VolunteerExtracurricular(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="VolunteerExtracurricular")
 
-    __table_args__: Tuple[Index, Index] = (
+    __table_args__: Tuple[Index, Index, Index] = (
         Index('IX_VolunteerExtracurricular_UserProfileId', 'UserProfileId'),
         Index('IX_VolunteerExtracurricular_Organization', 'Organization'),
+        _active_profile_index("VolunteerExtracurricular"),
     )
 
 
@@ -386,8 +407,9 @@ class Summary(Base, BaseDbModel):
 
     UserProfile = relationship("UserProfile", back_populates="Summaries")
 
-    __table_args__: Tuple[Index] = (
+    __table_args__: Tuple[Index, Index] = (
         Index('IX_Summaries_UserProfileId', 'UserProfileId'),
+        _active_profile_index("Summaries"),
     )
 
 
@@ -441,6 +463,18 @@ class Interview(Base, BaseDbModel):
     InterviewConfigurationName = Column(String(255), nullable=False)
     InterviewConfigurationVersion = Column(String(50), nullable=False)
     TranscriptUrl = Column(String(1000), nullable=True)
+    # Part of TranscriptUrl after "/conversations/conv_" up to the next '/', '?' or '#'; persisted
+    # computed column (EF migration Add_Interview_ConversationId), read-only here
+    ConversationId = Column(
+        String(128),
+        Computed(
+            "CAST(SUBSTRING(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), "
+            "1, PATINDEX('%[/?#]%', CONCAT(SUBSTRING([TranscriptUrl], NULLIF(CHARINDEX('/conversations/conv_', [TranscriptUrl]), 0) + 20, 128), '/')) - 1) "
+            "AS nvarchar(128))",
+            persisted=True,
+        ),
+        nullable=True,
+    )
     CompletedAt = Column(DateTime, nullable=True)
     Duration = Column(Float, nullable=True)  # store duration in seconds
     InstructionPromptName = Column(String(255), nullable=False)
@@ -453,5 +487,5 @@ class Interview(Base, BaseDbModel):
 
     __table_args__: Tuple[Index, Index] = (
         Index('IX_Interviews_JobApplicationStepId', 'JobApplicationStepId'),
-        Index('IX_Interviews_TranscriptUrl', 'TranscriptUrl')
+        Index('IX_Interviews_ConversationId', 'ConversationId', mssql_where=text("[ConversationId] IS NOT NULL")),
     )
\ No newline at end of file
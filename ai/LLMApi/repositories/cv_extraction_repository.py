@@ -0,0 +1,259 @@
+import logging
+import time
+from collections import defaultdict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Tuple
+
+from sqlalchemy import bindparam, delete, func, select, text, update
+from sqlalchemy.orm import Session
+
+from database import bulk_insert, get_current_user, insertable_columns
+from models.database import (
+    AwardsAchievements, CertificationsLicenses, Education, Experience, KeyStrength, ProjectsResearch,
+    Scoring, Skill, Summary, VolunteerExtracurricular,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-profile extraction tables that are soft-deleted when a new CV is processed
+SOFT_DELETE_MODELS = (
+    Experience, Education, Skill, ProjectsResearch, CertificationsLicenses,
+    AwardsAchievements, VolunteerExtracurricular, Summary, KeyStrength,
+)
+
+# Natural key per table: a new extraction item matching an active row on these columns
+# (case- and whitespace-insensitive) updates that row in place instead of replacing it
+NATURAL_KEYS = {
+    Experience: ("Organization", "Title", "StartDate"),
+    Education: ("Institution", "Degree", "StartDate"),
+    Skill: ("SkillName",),
+    ProjectsResearch: ("Title",),
+    CertificationsLicenses: ("Name", "Issuer"),
+    AwardsAchievements: ("Title", "Year"),
+    VolunteerExtracurricular: ("Organization", "Role", "StartDate"),
+    Summary: ("Type",),
+    KeyStrength: ("StrengthName",),
+}
+
+# SQL Server caps a statement at 2100 parameters
+_MAX_IDS_PER_STATEMENT = 1000
+
+
+@lru_cache(maxsize=None)
+def _data_columns(model_class) -> Tuple[str, ...]:
+    """
+    Columns holding extracted values: the insertable columns of database.normalize_row()
+    except the owning profile. Reconcile compares exactly these.
+    """
+    return tuple(column for column in insertable_columns(model_class) if column != "UserProfileId")
+
+
+def _key_part(value: Any) -> Any:
+    return " ".join(value.split()).casefold() if isinstance(value, str) else value
+
+
+def natural_key(model_class, row: Mapping[str, Any]) -> Tuple[Any, ...]:
+    return tuple(_key_part(row.get(column)) for column in NATURAL_KEYS[model_class])
+
+
+def _build_retire_batch() -> str:
+    """
+    One T-SQL batch: every soft-delete + the Scoring delete, with per-table row counts
+    collected in a table variable and returned as a single result set.
+    NOCOUNT is switched back off so pooled connections keep normal rowcount reporting.
+    """
+    statements = [
+        "SET NOCOUNT ON;",
+        "DECLARE @UserId uniqueidentifier = :user_id, @CvEvaluationId uniqueidentifier = :cv_evaluation_id, "
+        "@UpdatedBy nvarchar(100) = :updated_by;",
+        "DECLARE @counts TABLE (TableName sysname, Rows int);",
+    ]
+    for model in SOFT_DELETE_MODELS:
+        table = model.__tablename__
+        statements.append(
+            f"UPDATE [{table}] SET IsDeleted = 1, UpdatedAt = GETUTCDATE(), UpdatedBy = @UpdatedBy "
+            f"WHERE UserProfileId = @UserId AND IsDeleted = 0; "
+            f"INSERT INTO @counts VALUES ('{table}', @@ROWCOUNT);"
+        )
+    statements.append(
+        f"DELETE FROM [{Scoring.__tablename__}] WHERE CvEvaluationId = @CvEvaluationId; "
+        f"INSERT INTO @counts VALUES ('{Scoring.__tablename__}', @@ROWCOUNT);"
+    )
+    statements += ["SET NOCOUNT OFF;", "SELECT TableName, Rows FROM @counts;"]
+    return "\n".join(statements)
+
+
+class CvExtractionRepository:
+    _RETIRE_BATCH = _build_retire_batch()
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stats = {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0}
+        self._reconcile_stats = {
+            "calls": 0, "total_ms": 0.0, "max_ms": 0.0,
+            "inserted": 0, "updated": 0, "retired": 0, "unchanged": 0,
+        }
+
+    def retire_previous_extraction(self, db: Session, user_id: str, cv_evaluation_id: str, request_id: str = "unknown") -> Dict[str, int]:
+        """
+        Soft-delete the profile's previous extraction rows (and clear Scorings of the evaluation)
+        in one server round trip on SQL Server. Returns rows touched per table.
+        """
+        started = time.perf_counter()
+        params = {"user_id": user_id, "cv_evaluation_id": cv_evaluation_id, "updated_by": get_current_user()}
+        if db.get_bind().dialect.name == "mssql":
+            counts = {table: rows for table, rows in db.execute(text(self._RETIRE_BATCH), params).all()}
+        else:
+            counts = self._retire_per_statement(db, params)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        total = sum(counts.values())
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["total_ms"] += elapsed_ms
+            self._stats["max_ms"] = max(self._stats["max_ms"], elapsed_ms)
+            self._stats["rows"] += total
+        logger.info(f"[{request_id}] Retired previous extraction: {total} rows in {elapsed_ms:.1f} ms")
+        return counts
+
+    @staticmethod
+    def _retire_per_statement(db: Session, params: Dict[str, Any]) -> Dict[str, int]:
+        # Portable fallback (SQLite double, other dialects): same statements, one round trip each;
+        # UpdatedBy is stamped by database.receive_do_orm_execute
+        counts = {}
+        for model in SOFT_DELETE_MODELS:
+            result = db.execute(
+                update(model)
+                .where(model.UserProfileId == params["user_id"], model.IsDeleted == False)
+                .values(IsDeleted=True, UpdatedAt=func.current_timestamp())
+                .execution_options(synchronize_session=False)
+            )
+            counts[model.__tablename__] = result.rowcount
+        result = db.execute(
+            delete(Scoring)
+            .where(Scoring.CvEvaluationId == params["cv_evaluation_id"])
+            .execution_options(synchronize_session=False)
+        )
+        counts[Scoring.__tablename__] = result.rowcount
+        return counts
+
+    def reconcile_extraction(
+        self,
+        db: Session,
+        user_id: str,
+        cv_evaluation_id: str,
+        rows_by_model: Dict[Any, List[Dict[str, Any]]],
+        request_id: str = "unknown",
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Apply a new extraction as a diff against the profile's active rows: items matched by
+        natural key are updated only when a value changed, new items are inserted and active
+        rows with no counterpart are soft-deleted. Unchanged rows keep their Id and audit fields.
+        Rows must carry every _data_columns() column (build them with database.normalize_row());
+        None means the value is now empty.
+        Scorings belong to the evaluation, so they are cleared and inserted as before.
+        Returns inserted/updated/retired/unchanged counts per table.
+        """
+        started = time.perf_counter()
+        report = {}
+        for model_class in SOFT_DELETE_MODELS:
+            report[model_class.__tablename__] = self._reconcile_table(
+                db, model_class, user_id, rows_by_model.get(model_class) or [], _data_columns(model_class)
+            )
+
+        scoring_rows = rows_by_model.get(Scoring) or []
+        cleared = db.execute(
+            delete(Scoring)
+            .where(Scoring.CvEvaluationId == cv_evaluation_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        report[Scoring.__tablename__] = {
+            "inserted": bulk_insert(db, Scoring, scoring_rows), "updated": 0,
+            "retired": max(cleared or 0, 0), "unchanged": 0,
+        }
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        totals = {name: sum(counts[name] for counts in report.values())
+                  for name in ("inserted", "updated", "retired", "unchanged")}
+        with self._lock:
+            stats = self._reconcile_stats
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            for name, value in totals.items():
+                stats[name] += value
+        logger.info(
+            f"[{request_id}] Reconciled extraction in {elapsed_ms:.1f} ms: "
+            f"{totals['inserted']} inserted, {totals['updated']} updated, "
+            f"{totals['retired']} retired, {totals['unchanged']} unchanged"
+        )
+        return report
+
+    @staticmethod
+    def _reconcile_table(
+        db: Session, model_class, user_id: str, rows: List[Dict[str, Any]], columns: Tuple[str, ...]
+    ) -> Dict[str, int]:
+        for row in rows:
+            missing = [column for column in columns if column not in row]
+            if missing:
+                raise ValueError(
+                    f"{model_class.__tablename__} row lacks {missing}; build reconcile rows with database.normalize_row()"
+                )
+        table = model_class.__table__
+        existing = db.execute(
+            select(table.c.Id, *(table.c[column] for column in columns))
+            .where(table.c.UserProfileId == user_id, table.c.IsDeleted == False)
+        ).mappings().all()
+
+        active = defaultdict(list)
+        for row in existing:
+            active[natural_key(model_class, row)].append(row)
+
+        inserts, updates, unchanged = [], [], 0
+        for row in rows:
+            matches = active.get(natural_key(model_class, row))
+            if not matches:
+                inserts.append(row)
+                continue
+            current = matches.pop(0)
+            values = {column: row[column] for column in columns}
+            if any(values[column] != current[column] for column in columns):
+                updates.append({"_id": current["Id"], **values})
+            else:
+                unchanged += 1
+        retired_ids = [row["Id"] for matches in active.values() for row in matches]
+
+        if updates:
+            # Full column set on every row keeps the parameter sets uniform: one executemany batch
+            db.execute(update(table).where(table.c.Id == bindparam("_id")), updates)
+        for start in range(0, len(retired_ids), _MAX_IDS_PER_STATEMENT):
+            db.execute(
+                update(table)
+                .where(table.c.Id.in_(retired_ids[start:start + _MAX_IDS_PER_STATEMENT]))
+                .values(IsDeleted=True)
+            )
+        return {
+            "inserted": bulk_insert(db, model_class, inserts),
+            "updated": len(updates),
+            "retired": len(retired_ids),
+            "unchanged": unchanged,
+        }
+
+    @staticmethod
+    def _summarize(stats: Dict[str, Any]) -> Dict[str, Any]:
+        stats["avg_ms"] = round(stats["total_ms"] / stats["calls"], 2) if stats["calls"] else 0.0
+        stats["total_ms"] = round(stats["total_ms"], 2)
+        stats["max_ms"] = round(stats["max_ms"], 2)
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            retire, reconcile = dict(self._stats), dict(self._reconcile_stats)
+        return {
+            "retire_previous_extraction": self._summarize(retire),
+            "reconcile_extraction": self._summarize(reconcile),
+        }
+
+
+cv_extraction_repository = CvExtractionRepository()
@@ -1,17 +1,137 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict
+from uuid import UUID
+
 from sqlalchemy import select
 
-from database import SessionLocal
+from database import SessionLocal, run_in_db_executor
 from config import settings
 
+from core.resilience import sql_resilience
 from models.database import Interview
 
+
 class InterviewRepository:
+    def __init__(
+        self,
+        cache_size: int | None = None,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # conv_id -> (Interview.Id, expiry). Entries expire after the TTL and are dropped by
+        # invalidate() or when the cached interview turns out deleted, so a soft-deleted or
+        # re-linked interview is not served forever. Misses are not cached: the row may not exist yet.
+        self._cache_size = settings.interview_conv_id_cache_size if cache_size is None else cache_size
+        self._ttl_seconds = settings.interview_conv_id_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._clock = clock
+        self._ids: "OrderedDict[str, tuple[UUID, float]]" = OrderedDict()
+        self._lock = Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "invalidations": 0}
+
+    def get_id_by_conv_id(self, conv_id: str) -> UUID | None:
+        interview_id = self._cached(conv_id)
+        if interview_id is None:
+            interview_id = sql_resilience.call(self._get_id_by_conv_id, conv_id)
+            self._remember(conv_id, interview_id)
+        return interview_id
+
+    async def get_id_by_conv_id_async(self, conv_id: str) -> UUID | None:
+        interview_id = self._cached(conv_id)
+        if interview_id is None:
+            # Query runs on the DB executor; retry backoff awaits instead of sleeping a thread
+            interview_id = await sql_resilience.call_async(run_in_db_executor, self._get_id_by_conv_id, conv_id)
+            self._remember(conv_id, interview_id)
+        return interview_id
+
     def get_by_conv_id(self, conv_id: str) -> Interview | None:
+        interview_id = self.get_id_by_conv_id(conv_id)
+        interview = sql_resilience.call(self._get_by_id, interview_id) if interview_id else None
+        if interview_id and not self._is_current(interview, conv_id):
+            # Cached id went stale (deleted or re-linked since): look it up once more
+            self.invalidate(conv_id)
+            interview_id = self.get_id_by_conv_id(conv_id)
+            interview = sql_resilience.call(self._get_by_id, interview_id) if interview_id else None
+        return interview
+
+    async def get_by_conv_id_async(self, conv_id: str) -> Interview | None:
+        interview_id = await self.get_id_by_conv_id_async(conv_id)
+        if not interview_id:
+            return None
+        interview = await sql_resilience.call_async(run_in_db_executor, self._get_by_id, interview_id)
+        if not self._is_current(interview, conv_id):
+            self.invalidate(conv_id)
+            interview_id = await self.get_id_by_conv_id_async(conv_id)
+            if not interview_id:
+                return None
+            interview = await sql_resilience.call_async(run_in_db_executor, self._get_by_id, interview_id)
+        return interview
+
+    @staticmethod
+    def _is_current(interview: Interview | None, conv_id: str) -> bool:
+        return interview is not None and not interview.IsDeleted and interview.ConversationId == conv_id
+
+    def _get_id_by_conv_id(self, conv_id: str) -> UUID | None:
+        # Seek on the filtered IX_Interviews_ConversationId index. ConversationId is not unique:
+        # of several live interviews on one conversation the newest wins, the same one every time
         with SessionLocal() as db:
-            transcript_url = f"{settings.backend_base_url}/api/candidate/ai-interview/conversations/conv_{conv_id}"
-            result = db.execute(
-                select(Interview).where(Interview.TranscriptUrl == transcript_url)
-            )
-            return result.scalar_one_or_none()
+            return db.execute(
+                select(Interview.Id)
+                .where(Interview.ConversationId == conv_id, Interview.IsDeleted == False)
+                .order_by(Interview.CreatedAt.desc(), Interview.Id)
+                .limit(1)
+            ).scalar()
+
+    def _get_by_id(self, interview_id: UUID) -> Interview | None:
+        with SessionLocal() as db:
+            return db.get(Interview, interview_id)
+
+    # ---------- conv_id cache ----------
+
+    def _cached(self, conv_id: str) -> UUID | None:
+        with self._lock:
+            entry = self._ids.get(conv_id)
+            if entry is not None and self._clock() >= entry[1]:
+                del self._ids[conv_id]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._ids.move_to_end(conv_id)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def _remember(self, conv_id: str, interview_id: UUID | None) -> None:
+        if interview_id is None or self._cache_size <= 0:
+            return
+        with self._lock:
+            self._ids[conv_id] = (interview_id, self._clock() + self._ttl_seconds)
+            self._ids.move_to_end(conv_id)
+            while len(self._ids) > self._cache_size:
+                self._ids.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, conv_id: str) -> None:
+        """Forget the cached interview of `conv_id` (e.g. after it was deleted or re-linked)."""
+        with self._lock:
+            if self._ids.pop(conv_id, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._ids)
+        stats["max_size"] = self._cache_size
+        stats["ttl_seconds"] = self._ttl_seconds
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
 
-interview_repository = InterviewRepository()
\ No newline at end of file
+interview_repository = InterviewRepository()
@@ -1,4 +1,7 @@
-from database import SessionLocal
+from sqlalchemy import select
+
+from database import SessionLocal, run_in_db_executor
+from core.resilience import sql_resilience
 
 from models.database import Score
 from models.pydantic_models import InterviewScore
@@ -21,6 +24,13 @@ class ScoreRepository:
 
     def create_or_update_score(self, score: InterviewScore, interview_id: str) -> Score:
         """Create new score or update existing one (upsert logic)"""
+        # Each attempt runs in a fresh session, so a retried failover/deadlock replays the whole upsert
+        return sql_resilience.call(self._upsert_score, score, interview_id)
+
+    async def create_or_update_score_async(self, score: InterviewScore, interview_id: str) -> Score:
+        return await sql_resilience.call_async(run_in_db_executor, self._upsert_score, score, interview_id)
+
+    def _upsert_score(self, score: InterviewScore, interview_id: str) -> Score:
         with SessionLocal() as db:
             # Check if score already exists for this interview
             existing_score = db.execute(
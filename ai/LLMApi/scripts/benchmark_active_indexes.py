@@ -0,0 +1,127 @@
+"""
+Benchmark the profile read path before and after the filtered IX_<table>_UserProfileId_Active
+indexes (EF migration Add_Filtered_Active_Indexes_For_Profile_Data).
+
+Seeds profiles whose every CV run soft-deleted the previous extraction, so most rows are
+history (IsDeleted = 1) and only the last run is live. Reads whole live rows from the nine
+extraction tables per profile, as api/routes.get_user_profile loads them.
+
+"before" is the pre-migration schema (UserProfileId indexes only); "after" adds the filtered
+indexes. On SQL Server, apply the migration and compare `SET STATISTICS IO ON` for the same queries.
+
+Usage (from ai/LLMApi):
+    python -m scripts.benchmark_active_indexes --profiles 200 --runs 10 --rows 8
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import bindparam, insert, select, text
+
+from database import column_keys
+from models.database import UserProfile
+from scripts.benchmark_bulk_insert import CHILD_TABLES
+from scripts.sqlite_double import create_sqlite_engine
+
+
+def active_index(model_class):
+    return next(index for index in model_class.__table__.indexes if index.name.endswith("_UserProfileId_Active"))
+
+
+def seed(engine, profiles: int, runs: int, rows_per_table: int) -> list:
+    user_ids = [uuid.uuid4() for _ in range(profiles)]
+    with engine.begin() as conn:
+        conn.execute(insert(UserProfile.__table__), [
+            {"Id": user_id, "Name": f"User {n}", "Email": f"user{n}@example.com"} for n, user_id in enumerate(user_ids)
+        ])
+        for model_class, factory in CHILD_TABLES.items():
+            columns = column_keys(model_class)
+            batch = []
+            for user_id in user_ids:
+                for run in range(runs):
+                    for i in range(rows_per_table):
+                        row = {"UserProfileId": user_id, "IsDeleted": run < runs - 1, **factory(run * rows_per_table + i)}
+                        batch.append({k: v for k, v in row.items() if k in columns})
+            conn.execute(insert(model_class.__table__), batch)
+    return user_ids
+
+
+def set_indexes(engine, filtered: bool) -> None:
+    with engine.begin() as conn:
+        for model_class in CHILD_TABLES:
+            index = active_index(model_class)
+            conn.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+            if filtered:
+                conn.execute(text(
+                    f'CREATE INDEX "{index.name}" ON "{model_class.__tablename__}" ("UserProfileId") WHERE "IsDeleted" = 0'
+                ))
+        conn.execute(text("ANALYZE"))
+
+
+def read_queries() -> list:
+    queries = []
+    for model_class in CHILD_TABLES:
+        table = model_class.__table__
+        queries.append(select(table).where(table.c.UserProfileId == bindparam("user_id"), table.c.IsDeleted == False))
+    return queries
+
+
+def run(engine, queries, user_ids) -> tuple[float, int]:
+    # Compiled once and run on the driver cursor, so the timing is the database's share
+    statements = [str(query.compile(engine)) for query in queries]
+    rows = 0
+    with engine.connect() as conn:
+        cursor = conn.connection.dbapi_connection.cursor()
+        start = time.perf_counter()
+        for user_id in user_ids:
+            for statement in statements:
+                rows += len(cursor.execute(statement, (user_id.hex,)).fetchall())
+        elapsed = time.perf_counter() - start
+        cursor.close()
+    return elapsed, rows
+
+
+def plan(engine, query, user_id) -> str:
+    with engine.connect() as conn:
+        return " | ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {query.compile(engine)}", (user_id.hex,)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=10, help="CV runs per profile; all but the last are soft-deleted")
+    parser.add_argument("--rows", type=int, default=8, help="rows per table per CV run")
+    parser.add_argument("--reads", type=int, default=500, help="profile reads per measurement")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    engine = create_sqlite_engine()
+    started = time.perf_counter()
+    user_ids = seed(engine, args.profiles, args.runs, args.rows)
+    total = args.profiles * args.runs * args.rows * len(CHILD_TABLES)
+    print(f"seeded {total} rows ({total // args.runs} live) in {time.perf_counter() - started:.1f}s: "
+          f"{args.profiles} profiles x {args.runs} runs x {len(CHILD_TABLES)} tables x {args.rows} rows")
+
+    sample = [random.choice(user_ids) for _ in range(args.reads)]
+    print(f"{'indexes':>8} {'seconds':>9} {'reads/s':>9} {'rows':>8}")
+    results = {}
+    for filtered in (False, True):
+        set_indexes(engine, filtered)
+        label = "after" if filtered else "before"
+        elapsed, rows = run(engine, read_queries(), sample)
+        results[label] = elapsed
+        print(f"{label:>8} {elapsed:>9.3f} {args.reads / elapsed:>9.0f} {rows:>8}")
+        print(f"  plan (Skills): {plan(engine, read_queries()[2], sample[0])}")
+    print(f"speedup: {results['before'] / results['after']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
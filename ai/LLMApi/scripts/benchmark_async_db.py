@@ -0,0 +1,117 @@
+"""
+Benchmark blocking DB calls made from async code vs database.run_in_db_executor.
+
+Each simulated request does what the async paths do around an LLM call: a lookup, an awaited
+"LLM" delay, then a write. In the blocking variant the queries run on the event loop thread
+(as the repositories did), so concurrent requests serialize behind every round trip; in the
+executor variant they run on the bounded DB executor and overlap. A ticker task measures how
+late the event loop runs scheduled callbacks (loop lag).
+
+Runs against a file-backed SQLite double (so the pool holds real separate connections);
+--latency-ms simulates the network round trip of every statement.
+
+Usage (from ai/LLMApi):
+    python -m scripts.benchmark_async_db --requests 100 --concurrency 20 --latency-ms 5 --llm-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from database import bulk_insert, run_in_db_executor
+from models.database import KeyStrength, UserProfile
+from scripts.sqlite_double import create_sqlite_engine
+
+
+def lookup(engine, user_id) -> str:
+    with Session(engine) as db:
+        return db.execute(select(UserProfile.Name).where(UserProfile.Id == user_id)).scalar_one()
+
+
+def write(engine, user_id, n: int) -> None:
+    with Session(engine) as db:
+        bulk_insert(db, KeyStrength, [{"UserProfileId": user_id, "StrengthName": f"Strength {n}"}])
+        db.commit()
+
+
+async def request_blocking(engine, user_id, n: int, llm_seconds: float) -> None:
+    lookup(engine, user_id)
+    await asyncio.sleep(llm_seconds)
+    write(engine, user_id, n)
+
+
+async def request_executor(engine, user_id, n: int, llm_seconds: float) -> None:
+    await run_in_db_executor(lookup, engine, user_id)
+    await asyncio.sleep(llm_seconds)
+    await run_in_db_executor(write, engine, user_id, n)
+
+
+async def run(request, engine, user_ids, requests: int, concurrency: int, llm_seconds: float) -> tuple[float, float]:
+    lag = {"max": 0.0}
+    stop = asyncio.Event()
+
+    async def ticker(interval: float = 0.01) -> None:
+        while not stop.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lag["max"] = max(lag["max"], time.perf_counter() - expected)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(n: int) -> None:
+        async with semaphore:
+            await request(engine, user_ids[n % len(user_ids)], n, llm_seconds)
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+    return elapsed, lag["max"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="simulated round trip per statement")
+    parser.add_argument("--llm-ms", type=float, default=50.0, help="awaited work between the DB calls")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_sqlite_engine(f"sqlite:///{path}")
+    with Session(engine) as db:
+        profiles = [UserProfile(Id=uuid.uuid4(), Name=f"User {i}", Email=f"user{i}@example.com") for i in range(10)]
+        db.add_all(profiles)
+        db.commit()
+        user_ids = [p.Id for p in profiles]
+
+    if args.latency_ms:
+        @event.listens_for(engine, "before_cursor_execute")
+        def _simulated_round_trip(*_):
+            time.sleep(args.latency_ms / 1000.0)
+
+    print(f"{args.requests} requests, concurrency={args.concurrency}, "
+          f"latency={args.latency_ms}ms/statement, llm={args.llm_ms}ms")
+    print(f"{'path':>9} {'seconds':>9} {'req/s':>8} {'max loop lag ms':>16}")
+    results = {}
+    for name, request in (("blocking", request_blocking), ("executor", request_executor)):
+        elapsed, lag = asyncio.run(run(request, engine, user_ids, args.requests, args.concurrency, args.llm_ms / 1000.0))
+        results[name] = elapsed
+        print(f"{name:>9} {elapsed:>9.3f} {args.requests / elapsed:>8.1f} {lag * 1000.0:>16.1f}")
+    print(f"speedup: {results['blocking'] / results['executor']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark persisting extracted CV child rows: one ORM object per row (previous safe_save path)
+vs database.bulk_insert (one executemany batch per table).
+
+Runs against the SQLite double by default; --latency-ms adds a simulated network round trip
+to every statement sent, which is what dominates against Azure SQL. Pass --url with a
+mssql+pyodbc URL to measure a real database (tables must exist; rows are rolled back).
+
+Usage (from ai/LLMApi):
+    python -m scripts.benchmark_bulk_insert --cvs 50 --rows 8 --latency-ms 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from database import bulk_insert, normalize_row
+from models.database import (
+    AwardsAchievements, CertificationsLicenses, Education, Experience, KeyStrength, ProjectsResearch,
+    Skill, Summary, UserProfile, VolunteerExtracurricular,
+)
+from scripts.sqlite_double import create_sqlite_engine
+
+CHILD_TABLES = {
+    Experience: lambda i: {"Title": f"Engineer {i}", "Organization": "Contoso", "StartDate": date(2018, 1, 1),
+                           "EndDate": date(2021, 6, 1), "Description": "Built services " * 10},
+    Education: lambda i: {"Degree": "BSc", "Institution": "University", "FieldOfStudy": "CS"},
+    Skill: lambda i: {"SkillName": f"Skill {i}", "Category": "Technical", "YearsExperience": i % 10},
+    ProjectsResearch: lambda i: {"Title": f"Project {i}", "Description": "Research " * 8},
+    CertificationsLicenses: lambda i: {"Name": f"Cert {i}", "Issuer": "Issuer"},
+    AwardsAchievements: lambda i: {"Title": f"Award {i}", "Year": 2020},
+    VolunteerExtracurricular: lambda i: {"Role": "Mentor", "Organization": "Club"},
+    Summary: lambda i: {"Type": "Overall", "Text": "Summary " * 20},
+    KeyStrength: lambda i: {"StrengthName": f"Strength {i}", "Description": "Good"},
+}
+
+
+def cv_rows(user_id, rows_per_table: int) -> list[tuple[type, list[dict]]]:
+    out = []
+    for model_class, factory in CHILD_TABLES.items():
+        out.append((model_class, [normalize_row(model_class, {"UserProfileId": user_id, **factory(i)})
+                                  for i in range(rows_per_table)]))
+    return out
+
+
+def save_orm(db: Session, tables) -> None:
+    for model_class, rows in tables:
+        for row in rows:
+            db.add(model_class(**row))
+    db.flush()
+
+
+def save_bulk(db: Session, tables) -> None:
+    for model_class, rows in tables:
+        bulk_insert(db, model_class, rows)
+
+
+def run(engine, save, cvs: int, rows_per_table: int, user_ids) -> tuple[float, int]:
+    statements = {"n": 0}
+
+    def count(*args):
+        statements["n"] += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with Session(engine) as db:
+            start = time.perf_counter()
+            for n in range(cvs):
+                save(db, cv_rows(user_ids[n % len(user_ids)], rows_per_table))
+            elapsed = time.perf_counter() - start
+            db.rollback()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return elapsed, statements["n"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="database URL (default: in-memory SQLite double)")
+    parser.add_argument("--cvs", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=8, help="rows per child table per CV")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated round trip per statement")
+    args = parser.parse_args()
+
+    if args.url:
+        engine = create_engine(args.url, fast_executemany=args.url.startswith("mssql+pyodbc"))
+        with Session(engine) as db:
+            user_ids = [row[0] for row in db.query(UserProfile.Id).limit(10).all()]
+        if not user_ids:
+            sys.exit("Target database has no UserProfiles to attach rows to")
+    else:
+        engine = create_sqlite_engine()
+        with Session(engine) as db:
+            profiles = [UserProfile(Id=uuid.uuid4(), Name=f"User {i}", Email=f"user{i}@example.com") for i in range(10)]
+            db.add_all(profiles)
+            db.commit()
+            user_ids = [p.Id for p in profiles]
+
+    if args.latency_ms:
+        @event.listens_for(engine, "before_cursor_execute")
+        def _simulated_round_trip(*_):
+            time.sleep(args.latency_ms / 1000.0)
+
+    total_rows = args.cvs * args.rows * len(CHILD_TABLES)
+    print(f"{args.cvs} CVs x {len(CHILD_TABLES)} tables x {args.rows} rows = {total_rows} rows, "
+          f"latency={args.latency_ms}ms/statement")
+    print(f"{'path':>6} {'seconds':>9} {'statements':>11} {'rows/s':>10}")
+    results = {}
+    for name, save in (("orm", save_orm), ("bulk", save_bulk)):
+        elapsed, statements = run(engine, save, args.cvs, args.rows, user_ids)
+        results[name] = elapsed
+        print(f"{name:>6} {elapsed:>9.3f} {statements:>11} {total_rows / elapsed:>10.0f}")
+    print(f"speedup: {results['orm'] / results['bulk']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
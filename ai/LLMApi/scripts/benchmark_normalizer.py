@@ -0,0 +1,235 @@
+"""
+Benchmark the table-driven CV response normalizer against the previous implementation.
+
+Corpus: every *.json file under --corpus (e.g. the extraction cache directory or exported
+CvEvaluation.ResponseJson values, one document per file). Without --corpus a synthetic corpus
+shaped like raw json_object-mode responses is generated. Outputs of both implementations are
+compared document by document before timing.
+
+Usage (from ai/LLMApi):
+    python -m scripts.benchmark_normalizer --corpus /tmp/cv_extraction_cache --repeat 5
+    python -m scripts.benchmark_normalizer --synthetic 2000
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import glob
+import json
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cv_response_normalizer import normalize_cv_response, normalize_date
+
+
+# ---------- previous implementation, kept for comparison ----------
+
+def legacy_normalize_date(date_str: str) -> str | None:
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    if date_str.lower() in ["present", "current"]:
+        return None
+    month_year_match = re.match(r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})$', date_str, re.IGNORECASE)
+    year_month_match = re.match(r'^(\d{4})-(\d{1,2})$', date_str)
+    year_match = re.match(r'^(\d{4})$', date_str)
+    if month_year_match:
+        month_name, year = month_year_match.groups()
+        month_number = datetime.strptime(month_name[:3], "%b").month
+        return f"{year}-{month_number:02d}-01"
+    elif year_month_match:
+        year, month = year_month_match.groups()
+        return f"{year}-{int(month):02d}-01"
+    elif year_match:
+        return f"{year_match.group(1)}-01-01"
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+    except Exception:
+        return None
+
+
+def legacy_normalize(data: dict) -> dict:
+    if "UserProfile" in data and data["UserProfile"]:
+        user_profile = data["UserProfile"]
+        for field in ["JobTypePreferences", "RemotePreferences", "Roles"]:
+            if field in user_profile and user_profile[field] is not None:
+                if isinstance(user_profile[field], str):
+                    user_profile[field] = [user_profile[field].strip()]
+                elif isinstance(user_profile[field], list):
+                    user_profile[field] = [item.strip() for item in user_profile[field] if item]
+    for field in ["Experience", "Education", "Skills", "ProjectsResearch", "CertificationsLicenses",
+                  "AwardsAchievements", "VolunteerExtracurricular", "Scoring", "Summaries", "KeyStrengths"]:
+        if field not in data or data[field] is None:
+            data[field] = []
+    LEVEL_MAP = {
+        "Fluent": "Senior", "High": "Senior", "Proficient": "Senior",
+        "Advanced": "Senior", "Intermediate": "Mid", "Beginner": "Junior",
+        "Basic": "Junior", "Expert": "Expert", "Senior": "Senior",
+        "Mid": "Mid", "Junior": "Junior"
+    }
+    TYPE_MAP = {
+        "Positive": "Positives", "Negative": "Negatives",
+        "Positives": "Positives", "Negatives": "Negatives", "Overall": "Overall",
+        "Weakness": "Weaknesses", "Weaknesses": "Weaknesses"
+    }
+    for exp in data.get("Experience", []):
+        exp["StartDate"] = legacy_normalize_date(exp.get("StartDate"))
+        exp["EndDate"] = legacy_normalize_date(exp.get("EndDate"))
+    for edu in data.get("Education", []):
+        edu["StartDate"] = legacy_normalize_date(edu.get("StartDate"))
+        edu["EndDate"] = legacy_normalize_date(edu.get("EndDate"))
+    for cert in data.get("CertificationsLicenses", []):
+        cert["DateIssued"] = legacy_normalize_date(cert.get("DateIssued"))
+        cert["ValidUntil"] = legacy_normalize_date(cert.get("ValidUntil"))
+    for award in data.get("AwardsAchievements", []):
+        year = award.get("Year")
+        if isinstance(year, str) and year.isdigit():
+            award["Year"] = int(year)
+        elif isinstance(year, int):
+            award["Year"] = year
+        else:
+            award["Year"] = None
+    for vol in data.get("VolunteerExtracurricular", []):
+        vol["StartDate"] = legacy_normalize_date(vol.get("StartDate"))
+        vol["EndDate"] = legacy_normalize_date(vol.get("EndDate"))
+    for skill in data.get("Skills", []):
+        years_exp = skill.get("YearsExperience")
+        if isinstance(years_exp, str):
+            try:
+                skill["YearsExperience"] = int(float(years_exp))
+            except ValueError:
+                skill["YearsExperience"] = None
+        elif isinstance(years_exp, (int, float)):
+            skill["YearsExperience"] = int(years_exp)
+        else:
+            skill["YearsExperience"] = None
+    if isinstance(data.get("Scoring"), list):
+        for item in data["Scoring"]:
+            if not isinstance(item, dict):
+                continue
+            if item.get("Years") is None and item.get("YearsExperience") is not None:
+                item["Years"] = item.get("YearsExperience")
+            for key in ("Score", "Years"):
+                raw_val = item.get(key)
+                if raw_val is None:
+                    continue
+                try:
+                    if isinstance(raw_val, str):
+                        raw_val = raw_val.strip()
+                        if raw_val == "":
+                            item[key] = None
+                            continue
+                    item[key] = int(float(raw_val))
+                except Exception:
+                    item[key] = None
+            score = item.get("Score")
+            if isinstance(score, int) and (score < 1 or score > 10):
+                item["Score"] = None
+    if isinstance(data.get("Scoring"), list):
+        for item in data["Scoring"]:
+            if isinstance(item, dict) and "Level" in item:
+                item["Level"] = LEVEL_MAP.get(str(item["Level"]).strip(), "Junior")
+    if isinstance(data.get("Summaries"), list):
+        for item in data["Summaries"]:
+            if isinstance(item, dict) and "Type" in item:
+                item["Type"] = TYPE_MAP.get(str(item["Type"]).strip(), "Overall")
+    return data
+
+
+# ---------- corpus ----------
+
+_DATES = ["January 2019", "feb 2020", "March 2021", "2018-07", "2017", "2020-03-15", "Present",
+          "Current", "Summer 2019", "", None, "2016-9", "December 2022"]
+_LEVELS = ["Senior", "Advanced", "Intermediate", "Beginner", "Expert", "Fluent", "Lead"]
+_TYPES = ["Positives", "Negative", "Overall", "Weakness", "Strengths"]
+
+
+def synthetic_corpus(size: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+
+    def dates() -> dict:
+        return {"StartDate": rng.choice(_DATES), "EndDate": rng.choice(_DATES)}
+
+    corpus = []
+    for n in range(size):
+        corpus.append({
+            "UserProfile": {
+                "Name": f"Candidate {n}",
+                "JobTypePreferences": rng.choice(["Full-time", ["Full-time ", "Contract"], None]),
+                "RemotePreferences": rng.choice(["Remote", ["Hybrid", ""], []]),
+                "Roles": [" Backend Engineer", "Data Engineer "],
+            },
+            "Candidate": {"CvFileId": None, "UserProfileId": None},
+            "Experience": [{"Title": "Engineer", "Organization": f"Org {i}", **dates()} for i in range(rng.randint(1, 8))],
+            "Education": [{"Degree": "BSc", "Institution": "Uni", **dates()} for _ in range(rng.randint(1, 3))],
+            "Skills": [{"SkillName": f"Skill {i}", "YearsExperience": rng.choice(["3", "2.5", 4, None, "n/a"])}
+                       for i in range(rng.randint(3, 20))],
+            "ProjectsResearch": [{"Title": "Project"}],
+            "CertificationsLicenses": [{"Name": "Cert", "DateIssued": rng.choice(_DATES), "ValidUntil": rng.choice(_DATES)}],
+            "AwardsAchievements": [{"Title": "Award", "Year": rng.choice(["2019", 2020, "n/a", None])}],
+            "VolunteerExtracurricular": None,
+            "Scoring": [{"Category": f"C{i}", "Score": rng.choice(["7", 8, "11", "", 9.5]),
+                         "YearsExperience": rng.choice(["3", None]), "Level": rng.choice(_LEVELS)} for i in range(6)],
+            "Summaries": [{"Type": t, "Text": "..."} for t in _TYPES],
+            "KeyStrengths": [{"StrengthName": "Ownership"}],
+        })
+    return corpus
+
+
+def load_corpus(directory: str) -> list[dict]:
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(directory, "**", "*.json"), recursive=True)):
+        with open(path, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+        if isinstance(doc, dict) and "UserProfile" in doc:
+            corpus.append(doc)
+    return corpus
+
+
+def time_it(fn, corpus: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        docs = copy.deepcopy(corpus)  # normalization mutates in place; copying is not timed
+        start = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of JSON extraction responses")
+    parser.add_argument("--synthetic", type=int, default=2000, help="synthetic corpus size when --corpus is not given")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.synthetic)
+    if not corpus:
+        sys.exit("Corpus is empty")
+
+    mismatches = sum(
+        legacy_normalize(copy.deepcopy(doc)) != normalize_cv_response(copy.deepcopy(doc)) for doc in corpus
+    )
+    print(f"documents: {len(corpus)}  output mismatches vs legacy: {mismatches}")
+
+    legacy = time_it(legacy_normalize, corpus, args.repeat)
+    normalize_date.cache_clear()
+    cold = time_it(normalize_cv_response, corpus, 1)
+    warm = time_it(normalize_cv_response, corpus, args.repeat)
+    per_doc = 1e6 / len(corpus)
+    print(f"{'impl':>22} {'total_s':>9} {'us/doc':>8} {'speedup':>8}")
+    print(f"{'legacy':>22} {legacy:>9.4f} {legacy * per_doc:>8.1f} {1:>7.2f}x")
+    print(f"{'table-driven (cold)':>22} {cold:>9.4f} {cold * per_doc:>8.1f} {legacy / cold:>7.2f}x")
+    print(f"{'table-driven (warm)':>22} {warm:>9.4f} {warm * per_doc:>8.1f} {legacy / warm:>7.2f}x")
+    print(f"date cache: {normalize_date.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
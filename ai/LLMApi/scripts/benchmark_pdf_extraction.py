@@ -0,0 +1,90 @@
+"""
+Benchmark serial vs process-pool PDF text extraction across page counts.
+
+Usage (from ai/LLMApi):
+    python -m scripts.benchmark_pdf_extraction --pages 4 16 64 256 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyPDF2 import PageObject, PdfReader, PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from services.pdf_text_extraction import extract_pdf_text
+
+
+def build_pdf(page_count: int, lines_per_page: int = 45) -> bytes:
+    """Generate a text-only PDF with `page_count` dense pages."""
+    writer = PdfWriter()
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    font_ref = writer._add_object(font)
+    for p in range(page_count):
+        page = PageObject.create_blank_page(width=612, height=792)
+        ops = ["BT", "/F1 10 Tf", "50 760 Td", "12 TL"]
+        for i in range(lines_per_page):
+            ops.append(f"(Page {p + 1} line {i + 1}: Senior engineer, Python, SQL, Azure, distributed systems) '")
+        ops.append("ET")
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font_ref}),
+        })
+        writer.add_page(page)
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def legacy_extract(file_content: bytes) -> str:
+    """The previous OpenAIService._extract_text_from_pdf loop, kept for comparison."""
+    reader = PdfReader(io.BytesIO(file_content))
+    text = ""
+    for page in reader.pages:
+        text += page.extract_text() + "\n"
+    return text.strip()
+
+
+def time_it(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 8, 32, 128])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Warm the pool so process start-up is not billed to the first measurement
+    extract_pdf_text(build_pdf(8), parallel_min_pages=1, workers=args.workers)
+
+    print(f"{'pages':>6} {'legacy_s':>10} {'serial_s':>10} {'parallel_s':>11} {'speedup':>8}")
+    for pages in args.pages:
+        pdf = build_pdf(pages)
+        legacy = time_it(lambda: legacy_extract(pdf), args.repeat)
+        serial = time_it(lambda: extract_pdf_text(pdf, workers=1, max_pages=0), args.repeat)
+        parallel = time_it(
+            lambda: extract_pdf_text(pdf, workers=args.workers, parallel_min_pages=1, max_pages=0), args.repeat
+        )
+        print(f"{pages:>6} {legacy:>10.3f} {serial:>10.3f} {parallel:>11.3f} {serial / parallel:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Download the tokenizer encodings into TIKTOKEN_CACHE_DIR (default ./tiktoken_cache) so they ship
+with the app: services/resume_text_compactor.py never downloads them at runtime, and falls back
+to a chars/4 estimate when the file is missing. Run at build time, where there is network access.
+
+Usage (from ai/LLMApi):
+    python -m scripts.fetch_tiktoken_encodings [o200k_base cl100k_base]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+from services.resume_text_compactor import TIKTOKEN_ENCODING_URLS, bundled_encoding_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("encodings", nargs="*", help=f"any of {', '.join(sorted(TIKTOKEN_ENCODING_URLS))} "
+                        f"(default: RESUME_TOKENIZER_ENCODING = {settings.resume_tokenizer_encoding})")
+    args = parser.parse_args()
+    encodings = args.encodings or [settings.resume_tokenizer_encoding]
+    unknown = [name for name in encodings if name not in TIKTOKEN_ENCODING_URLS]
+    if unknown:
+        parser.error(f"unknown encoding(s): {', '.join(unknown)}")
+
+    os.makedirs(settings.tiktoken_cache_dir, exist_ok=True)
+    os.environ["TIKTOKEN_CACHE_DIR"] = settings.tiktoken_cache_dir
+    import tiktoken
+
+    for name in encodings:
+        # tiktoken writes the downloaded file to TIKTOKEN_CACHE_DIR under its cache key
+        tiktoken.get_encoding(name)
+        path = bundled_encoding_path(name)
+        print(f"{name}: {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Bulk CV extraction through the OpenAI Batch API.
+
+Usage (from ai/LLMApi):
+    python -m scripts.run_cv_batch --limit 500                 # CVs without an evaluation
+    python -m scripts.run_cv_batch --limit 500 --reprocess     # re-score all current CVs (e.g. after a prompt change)
+    python -m scripts.run_cv_batch --resume batch_abc123       # ingest a batch submitted earlier
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import database
+from azure_functions.cv_processor import cv_processor
+from services.cv_batch_service import CvBatchService
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--reprocess", action="store_true", help="include CVs that already have an evaluation")
+    parser.add_argument("--resume", metavar="BATCH_ID", help="wait for and ingest an existing batch")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    service = CvBatchService(cv_processor)
+    db = database.SessionLocal()
+    try:
+        if args.resume:
+            batch = await service.wait(args.resume)
+            report = await service.ingest(db, batch)
+        else:
+            report = await service.run(db, args.limit, include_processed=args.reprocess)
+    finally:
+        db.close()
+
+    if report is None:
+        print("Nothing to process")
+        return
+    print(f"Batch {report.batch_id}: {report.succeeded} succeeded, {report.failed} failed")
+    for file_id, error in report.errors.items():
+        print(f"  {file_id}: {error}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""
+Purge (or archive then purge) soft-deleted extraction rows older than the retention window.
+
+Usage (from ai/LLMApi):
+    python -m scripts.run_soft_delete_purge --dry-run                    # rows eligible per table
+    python -m scripts.run_soft_delete_purge --retention-days 90          # delete; resumes an unfinished pass
+    python -m scripts.run_soft_delete_purge --archive --max-seconds 0    # archive to Blob Storage, no time budget
+    python -m scripts.run_soft_delete_purge --reset                      # discard the checkpoint first
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from services.soft_delete_purge import soft_delete_purge
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--retention-days", type=int, help="default: SOFT_DELETE_PURGE_RETENTION_DAYS")
+    parser.add_argument("--batch-size", type=int, help="default: SOFT_DELETE_PURGE_BATCH_SIZE")
+    parser.add_argument("--pause-ms", type=float, help="default: SOFT_DELETE_PURGE_PAUSE_MS")
+    parser.add_argument("--max-seconds", type=float, help="time budget, 0 = none (default: SOFT_DELETE_PURGE_MAX_RUN_SECONDS)")
+    parser.add_argument("--archive", action="store_true", help="archive rows to Blob Storage before deleting")
+    parser.add_argument("--dry-run", action="store_true", help="only count eligible rows")
+    parser.add_argument("--reset", action="store_true", help="start a new pass instead of resuming")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.reset:
+        soft_delete_purge.reset()
+    report = soft_delete_purge.run(
+        retention_days=args.retention_days,
+        batch_size=args.batch_size,
+        pause_seconds=args.pause_ms / 1000.0 if args.pause_ms is not None else None,
+        max_seconds=args.max_seconds,
+        archive=True if args.archive else None,
+        dry_run=args.dry_run,
+    )
+
+    print(f"cutoff {report.cutoff:%Y-%m-%d %H:%M:%S} UTC, "
+          f"{'dry run' if report.dry_run else 'pass complete' if report.completed else 'pass paused (resume with another run)'}, "
+          f"{report.elapsed_seconds}s")
+    for table, counts in report.tables.items():
+        print(f"  {table:<26} " + " ".join(f"{name}={value}" for name, value in counts.items()))
+    if not report.dry_run:
+        print(f"rows reclaimed: {report.rows_reclaimed}")
+
+
+if __name__ == "__main__":
+    main()
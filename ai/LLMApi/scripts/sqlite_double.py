@@ -0,0 +1,108 @@
+"""
+SQLite stand-in for the Azure SQL schema, used by the local benchmarks (no ODBC driver or
+database server needed). Only DDL differs: T-SQL defaults and types are rendered as SQLite
+equivalents; the ORM models in models/database.py are used unchanged.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.mssql import UNIQUEIDENTIFIER
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.functions import Function
+from sqlalchemy.types import Uuid
+
+from models.database import (
+    Base, AwardsAchievements, Candidate, CertificationsLicenses, CvEvaluation, Education, Experience, File,
+    KeyStrength, ProjectsResearch, Scoring, Skill, Summary, UserProfile, VolunteerExtracurricular,
+)
+
+_SQLITE_FUNCTIONS = {
+    # Same 32-hex-digit form SQLAlchemy binds uuid.UUID values as on non-native dialects
+    "newid": "(lower(hex(randomblob(16))))",
+    "getutcdate": "CURRENT_TIMESTAMP",
+}
+
+# Tables written by CVProcessor, parents first
+CV_TABLES = [
+    UserProfile.__table__, File.__table__, Candidate.__table__, CvEvaluation.__table__,
+    Experience.__table__, Education.__table__, Skill.__table__, ProjectsResearch.__table__,
+    CertificationsLicenses.__table__, AwardsAchievements.__table__, VolunteerExtracurricular.__table__,
+    Scoring.__table__, Summary.__table__, KeyStrength.__table__,
+]
+
+
+def _like_to_regex(pattern: str) -> str:
+    # T-SQL LIKE pattern (%, _ and [...] classes) as a regex
+    parts = re.split(r"(\[[^\]]*\]|%|_)", pattern)
+    return "".join(
+        ".*" if part == "%" else "." if part == "_" else part if part.startswith("[") else re.escape(part)
+        for part in parts
+    )
+
+
+def _patindex(pattern, value):
+    # Only the '%...%' (search anywhere) form the schema uses
+    if pattern is None or value is None:
+        return None
+    match = re.search(_like_to_regex(pattern.strip("%")), value, re.S)
+    return match.start() + 1 if match else 0
+
+
+# T-SQL functions used by CHECK constraints and computed columns
+_TSQL_FUNCTIONS = {
+    "LEN": (1, lambda value: None if value is None else len(str(value).rstrip())),
+    "CHARINDEX": (2, lambda needle, value: None if needle is None or value is None else value.find(needle) + 1),
+    "PATINDEX": (2, _patindex),
+    "CONCAT": (-1, lambda *values: "".join("" if value is None else str(value) for value in values)),
+}
+
+
+class _TSqlUuid(Uuid):
+    """Binds uuid strings too, as SQL Server does for uniqueidentifier parameters."""
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        process = super().bind_processor(dialect)
+
+        def coerce(value):
+            if isinstance(value, str):
+                value = uuid.UUID(value)
+            return process(value) if process else value
+        return coerce
+
+
+@compiles(UNIQUEIDENTIFIER, "sqlite")
+def _compile_uniqueidentifier(type_, compiler, **kw):
+    return "CHAR(36)"
+
+
+@compiles(Function, "sqlite")
+def _compile_function(element, compiler, **kw):
+    replacement = _SQLITE_FUNCTIONS.get(element.name.lower())
+    return replacement if replacement is not None else compiler.visit_function(element, **kw)
+
+
+def create_sqlite_engine(url: str = "sqlite://", tables=None) -> Engine:
+    """Engine with the CV tables created (in-memory by default, one shared connection)."""
+    kwargs = {"poolclass": StaticPool} if url == "sqlite://" else {}
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **kwargs)
+    # Processing messages carry ids as strings; uniqueidentifier columns accept them on SQL Server
+    engine.dialect.colspecs = {**engine.dialect.colspecs, Uuid: _TSqlUuid}
+
+    @event.listens_for(engine, "connect")
+    def _register_tsql_functions(dbapi_connection, connection_record):
+        for name, (arity, function) in _TSQL_FUNCTIONS.items():
+            dbapi_connection.create_function(name, arity, function, deterministic=True)
+
+    Base.metadata.create_all(engine, tables=tables or CV_TABLES)
+    return engine
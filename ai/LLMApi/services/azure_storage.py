@@ -1,4 +1,5 @@
 from azure.storage.blob import BlobServiceClient
+import asyncio
 from azure.core.exceptions import AzureError
 import json
 import uuid
@@ -7,34 +8,43 @@ import logging
 from datetime import datetime
 from config import settings
 from core.file_helper import FilePathHelper
+from core.resilience import blob_resilience
+from core.startup import lazy_component
 
 logger = logging.getLogger(__name__)
 
 class AzureStorageService:
     def __init__(self):
+        self.container_name = settings.azure_storage_container_name
+        # Client is built (and the container ensured) on first use or by core.startup.warm_up()
+        self._client = lazy_component("blob_storage", self._connect)
+
+    @property
+    def blob_service(self) -> Optional[BlobServiceClient]:
+        try:
+            return self._client.get()
+        except Exception:
+            return None
+
+    def _connect(self) -> Optional[BlobServiceClient]:
         if not settings.azure_storage_connection_string or settings.azure_storage_connection_string.strip() == "":
             logger.error("AZURE_STORAGE_CONNECTION_STRING is empty or not set!")
-            self.blob_service = None
-            self.container_name = settings.azure_storage_container_name
-            return
-        
+            return None
+
         try:
-            self.blob_service = BlobServiceClient.from_connection_string(
+            blob_service = BlobServiceClient.from_connection_string(
                 settings.azure_storage_connection_string
             )
-            self.container_name = settings.azure_storage_container_name
-            self._ensure_container_exists()
+            self._ensure_container_exists(blob_service)
             logger.info("Azure Storage Service initialized successfully")
+            return blob_service
         except Exception as e:
             logger.error(f"Failed to initialize Azure Storage Service: {e}")
-            self.blob_service = None
-    
-    def _ensure_container_exists(self):
+            raise
+
+    def _ensure_container_exists(self, blob_service: BlobServiceClient):
         try:
-            if not self.blob_service:
-                logger.warning("Cannot create container - blob_service is None")
-                return
-            container_client = self.blob_service.get_container_client(self.container_name)
+            container_client = blob_service.get_container_client(self.container_name)
             container_client.create_container()
         except Exception as e:
             logger.info(f"Container {self.container_name} already exists or error: {e}")
@@ -55,7 +65,7 @@ class AzureStorageService:
                 blob=full_blob_path
             )
             
-            blob_client.upload_blob(file_content, overwrite=True)
+            blob_resilience.call(blob_client.upload_blob, file_content, overwrite=True)
             logger.info(f"File uploaded to blob storage: {full_blob_path}")
             return folder_path, file_name, True
         except AzureError as e:
@@ -82,7 +92,7 @@ class AzureStorageService:
             )
             
             json_content = json.dumps(json_data, indent=2)
-            blob_client.upload_blob(json_content.encode('utf-8'), overwrite=True)
+            blob_resilience.call(blob_client.upload_blob, json_content.encode('utf-8'), overwrite=True)
             logger.info(f"JSON response uploaded to blob storage: {full_blob_path}")
             return folder_path, file_name, True
         except AzureError as e:
@@ -92,6 +102,23 @@ class AzureStorageService:
             logger.error(f"Unexpected error uploading JSON to {full_blob_path}: {e}")
             return folder_path, file_name, False
     
+    def upload_blob(self, blob_path: str, content: bytes) -> bool:
+        """Upload (overwrite) raw content at blob_path, e.g. archived rows. Returns success"""
+        if not self.blob_service:
+            logger.error("Azure Storage Service not initialized")
+            return False
+
+        try:
+            blob_client = self.blob_service.get_blob_client(
+                container=self.container_name,
+                blob=blob_path
+            )
+            blob_resilience.call(blob_client.upload_blob, content, overwrite=True)
+            return True
+        except Exception as e:
+            logger.error(f"Error uploading blob {blob_path}: {e}")
+            return False
+
     def download_file(self, blob_path: str) -> Optional[bytes]:
         """Download file from blob storage"""
         if not self.blob_service:
@@ -103,7 +130,7 @@ class AzureStorageService:
                 container=self.container_name,
                 blob=blob_path
             )
-            return blob_client.download_blob().readall()
+            return blob_resilience.call(lambda: blob_client.download_blob().readall())
         except AzureError as e:
             logger.error(f"Azure error downloading file from {blob_path}: {e}")
             return None
@@ -111,4 +138,62 @@ class AzureStorageService:
             logger.error(f"Unexpected error downloading file from {blob_path}: {e}")
             return None
 
+    # ---------- async variants ----------
+    # For callers on an event loop: each blocking SDK call runs on a worker thread and the retry
+    # backoff is an asyncio.sleep (blob_resilience.call_async), so neither stalls the loop.
+
+    async def _blob_service_async(self) -> Optional[BlobServiceClient]:
+        # The first use may still connect and create the container; keep that off the loop too
+        if self._client.ready:
+            return self.blob_service
+        return await asyncio.to_thread(lambda: self.blob_service)
+
+    async def _upload_async(self, blob_path: str, content: bytes) -> bool:
+        blob_service = await self._blob_service_async()
+        if not blob_service:
+            logger.error("Azure Storage Service not initialized")
+            return False
+
+        try:
+            blob_client = blob_service.get_blob_client(
+                container=self.container_name,
+                blob=blob_path
+            )
+            await blob_resilience.call_async(asyncio.to_thread, blob_client.upload_blob, content, overwrite=True)
+            logger.info(f"Uploaded to blob storage: {blob_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error uploading blob {blob_path}: {e}")
+            return False
+
+    async def upload_file_async(self, file_content: bytes, user_id: str, file_id: str, file_extension: str) -> tuple[str, str, bool]:
+        """upload_file for async callers. Returns (folder_path, file_name, success)"""
+        folder_path, file_name = FilePathHelper.build_user_file_path(user_id, file_id, file_extension)
+        success = await self._upload_async(FilePathHelper.get_full_path(folder_path, file_name), file_content)
+        return folder_path, file_name, success
+
+    async def upload_json_response_async(self, json_data: dict, user_id: str, file_id: str) -> tuple[str, str, bool]:
+        """upload_json_response for async callers. Returns (folder_path, file_name, success)"""
+        folder_path, file_name = FilePathHelper.build_generated_file_path(user_id, file_id, "json")
+        json_content = json.dumps(json_data, indent=2)
+        success = await self._upload_async(FilePathHelper.get_full_path(folder_path, file_name), json_content.encode('utf-8'))
+        return folder_path, file_name, success
+
+    async def download_file_async(self, blob_path: str) -> Optional[bytes]:
+        """download_file for async callers"""
+        blob_service = await self._blob_service_async()
+        if not blob_service:
+            logger.error("Azure Storage Service not initialized")
+            return None
+
+        try:
+            blob_client = blob_service.get_blob_client(
+                container=self.container_name,
+                blob=blob_path
+            )
+            return await blob_resilience.call_async(asyncio.to_thread, lambda: blob_client.download_blob().readall())
+        except Exception as e:
+            logger.error(f"Error downloading file from {blob_path}: {e}")
+            return None
+
 azure_storage = AzureStorageService()
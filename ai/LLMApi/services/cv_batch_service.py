@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+
+from config import settings
+from core.resilience import openai_resilience
+from database import run_in_db_executor
+from models.database import Candidate, CvEvaluation, File
+from services.azure_storage import azure_storage
+from services.openai_client import get_async_openai_client
+from services.openai_usage import openai_usage_tracker
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass(frozen=True)
+class BatchStatus:
+    id: str
+    status: str
+    output_file_id: Optional[str] = None
+    error_file_id: Optional[str] = None
+    request_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in _TERMINAL_STATUSES
+
+
+class BatchClient(ABC):
+    """Minimal Batch API surface used by `CvBatchService` (`InMemoryBatchClient` stands in for it locally)."""
+
+    @abstractmethod
+    async def upload_batch_file(self, file_name: str, content: bytes) -> str:
+        ...
+
+    @abstractmethod
+    async def create_batch(self, input_file_id: str, metadata: Dict[str, str] | None = None) -> BatchStatus:
+        ...
+
+    @abstractmethod
+    async def retrieve_batch(self, batch_id: str) -> BatchStatus:
+        ...
+
+    @abstractmethod
+    async def download_file(self, file_id: str) -> bytes:
+        ...
+
+
+class OpenAIBatchClient(BatchClient):
+    def _to_status(self, batch: Any) -> BatchStatus:
+        counts = getattr(batch, "request_counts", None)
+        return BatchStatus(
+            id=batch.id,
+            status=batch.status,
+            output_file_id=getattr(batch, "output_file_id", None),
+            error_file_id=getattr(batch, "error_file_id", None),
+            request_counts=counts.model_dump() if counts is not None else {},
+        )
+
+    async def upload_batch_file(self, file_name: str, content: bytes) -> str:
+        uploaded = await openai_resilience.call_async(
+            get_async_openai_client().files.create, file=(file_name, content), purpose="batch"
+        )
+        return uploaded.id
+
+    async def create_batch(self, input_file_id: str, metadata: Dict[str, str] | None = None) -> BatchStatus:
+        batch = await openai_resilience.call_async(
+            get_async_openai_client().batches.create,
+            input_file_id=input_file_id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+            metadata=metadata,
+        )
+        return self._to_status(batch)
+
+    async def retrieve_batch(self, batch_id: str) -> BatchStatus:
+        return self._to_status(await openai_resilience.call_async(get_async_openai_client().batches.retrieve, batch_id))
+
+    async def download_file(self, file_id: str) -> bytes:
+        content = await openai_resilience.call_async(get_async_openai_client().files.content, file_id)
+        return content.content
+
+
+class InMemoryBatchClient(BatchClient):
+    """
+    Local stand-in for the Batch API: a created batch completes on the first `retrieve_batch`,
+    with every request answered by `responder(custom_id, body)` (the completion message content).
+    A responder that raises puts that request in the error file instead.
+    """
+
+    def __init__(self, responder: Callable[[str, Dict[str, Any]], str], polls_until_complete: int = 1) -> None:
+        self.responder = responder
+        self.polls_until_complete = polls_until_complete
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, BatchStatus] = {}
+        self._inputs: Dict[str, str] = {}
+        self._polls: Dict[str, int] = {}
+
+    def _store(self, content: bytes) -> str:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        self.files[file_id] = content
+        return file_id
+
+    async def upload_batch_file(self, file_name: str, content: bytes) -> str:
+        return self._store(content)
+
+    async def create_batch(self, input_file_id: str, metadata: Dict[str, str] | None = None) -> BatchStatus:
+        batch = BatchStatus(id=f"batch_{uuid.uuid4().hex[:12]}", status="in_progress")
+        self.batches[batch.id] = batch
+        self._inputs[batch.id] = input_file_id
+        self._polls[batch.id] = 0
+        return batch
+
+    async def retrieve_batch(self, batch_id: str) -> BatchStatus:
+        batch = self.batches[batch_id]
+        self._polls[batch_id] += 1
+        if batch.is_terminal or self._polls[batch_id] < self.polls_until_complete:
+            return batch
+        outputs, errors = [], []
+        for line in self.files[self._inputs[batch_id]].decode("utf-8").splitlines():
+            request = json.loads(line)
+            custom_id = request["custom_id"]
+            try:
+                content = self.responder(custom_id, request["body"])
+            except Exception as e:
+                errors.append({"custom_id": custom_id, "response": None, "error": {"message": str(e)}})
+                continue
+            outputs.append({"custom_id": custom_id, "error": None, "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"role": "assistant", "content": content}}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }}})
+
+        def to_file(items: List[Dict[str, Any]]) -> Optional[str]:
+            return self._store(("\n".join(json.dumps(item) for item in items) + "\n").encode("utf-8")) if items else None
+
+        batch = BatchStatus(
+            id=batch_id,
+            status="completed",
+            output_file_id=to_file(outputs),
+            error_file_id=to_file(errors),
+            request_counts={"total": len(outputs) + len(errors), "completed": len(outputs), "failed": len(errors)},
+        )
+        self.batches[batch_id] = batch
+        return batch
+
+    async def download_file(self, file_id: str) -> bytes:
+        return self.files[file_id]
+
+
+@dataclass
+class BatchIngestReport:
+    batch_id: str
+    succeeded: int = 0
+    failed: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class CvBatchService:
+    """
+    Bulk CV extraction through the OpenAI Batch API (half price, separate rate limits).
+
+    Flow: build JSONL of chat requests -> upload + create batch -> poll -> normalize each
+    result and persist it through CVProcessor.save_extraction. A manifest of the submitted
+    jobs (with the prompt, model and file size each request was built with) is written next
+    to the JSONL so ingestion can resume from a batch id in a later run without downloading
+    the CVs again.
+    """
+
+    def __init__(self, processor, client: BatchClient | None = None, work_dir: str | None = None) -> None:
+        self.processor = processor
+        self.client = client or OpenAIBatchClient()
+        self.work_dir = work_dir or settings.batch_work_dir or os.path.join(tempfile.gettempdir(), "cv_batches")
+
+    # ---------- selection ----------
+
+    @staticmethod
+    def find_pending_jobs(db: Session, limit: int, include_processed: bool = False) -> List[Dict[str, Any]]:
+        """Processing messages for candidates whose current CV has no evaluation (or all CVs, to re-score)."""
+        query = (
+            select(Candidate.UserId, File.Id, File.Extension, File.FolderPath, File.FilePath)
+            .join(File, File.Id == Candidate.CvFileId)
+            .where(Candidate.IsDeleted == False, File.IsDeleted == False)
+        )
+        if not include_processed:
+            query = query.where(
+                ~exists().where(CvEvaluation.FileId == File.Id, CvEvaluation.IsDeleted == False)
+            )
+        rows = db.execute(query.limit(limit)).all()
+        return [
+            {
+                "userId": str(user_id),
+                "fileId": str(file_id),
+                "fileExtension": extension,
+                "blobPath": f"{folder}/{path}" if folder else path,
+            }
+            for user_id, file_id, extension, folder, path in rows
+        ]
+
+    # ---------- submission ----------
+
+    async def build_batch_lines(self, db: Session, jobs: List[Dict[str, Any]]) -> tuple[List[str], Dict[str, Dict[str, Any]]]:
+        """One JSONL line per job (custom_id = fileId). Jobs that cannot be prepared are skipped."""
+        openai_service = self.processor.openai_service
+        lines: List[str] = []
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for job in jobs:
+            file_id = job["fileId"]
+            try:
+                file_content = job.get("fileContent") or await azure_storage.download_file_async(job["blobPath"])
+                if not file_content:
+                    raise ValueError(f"Failed to download file from blob storage: {job.get('blobPath')}")
+                system_prompt, scoring_prompt = await run_in_db_executor(
+                    self.processor.resolve_extraction_prompts, db, job, file_id
+                )
+                messages = await openai_service.build_extraction_messages(
+                    file_content, system_prompt.content, scoring_prompt.content, job["fileExtension"], file_id
+                )
+            except Exception as e:
+                logger.warning(f"[{file_id}] Skipping batch job: {e}")
+                continue
+            body = openai_service.build_completion_params(messages)
+            lines.append(json.dumps({"custom_id": file_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}))
+            prompt_category, prompt_version = self.processor.resolve_evaluation_prompt(job, scoring_prompt)
+            manifest[file_id] = {
+                **{k: v for k, v in job.items() if k != "fileContent"},
+                "fileSizeBytes": len(file_content),
+                "evaluationPromptCategory": prompt_category,
+                "evaluationPromptVersion": prompt_version,
+                "modelUsed": body["model"],
+            }
+        return lines, manifest
+
+    async def submit(self, db: Session, jobs: List[Dict[str, Any]]) -> BatchStatus | None:
+        lines, manifest = await self.build_batch_lines(db, jobs)
+        if not lines:
+            logger.info("No batch jobs to submit")
+            return None
+
+        os.makedirs(self.work_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        jsonl_path = os.path.join(self.work_dir, f"cv_extraction_{stamp}.jsonl")
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(jsonl_path, "wb") as f:
+            f.write(payload)
+
+        input_file_id = await self.client.upload_batch_file(os.path.basename(jsonl_path), payload)
+        batch = await self.client.create_batch(input_file_id, metadata={"purpose": "cv_extraction"})
+        self._write_manifest(batch.id, manifest)
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} CVs ({jsonl_path})")
+        return batch
+
+    # ---------- completion ----------
+
+    async def wait(self, batch_id: str, poll_interval_seconds: float | None = None, timeout_seconds: float | None = None) -> BatchStatus:
+        poll = poll_interval_seconds or settings.batch_poll_interval_seconds
+        deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+        while True:
+            batch = await self.client.retrieve_batch(batch_id)
+            if batch.is_terminal:
+                logger.info(f"Batch {batch_id} finished with status={batch.status} counts={batch.request_counts}")
+                return batch
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch_id} still {batch.status} after {timeout_seconds}s")
+            logger.info(f"Batch {batch_id} status={batch.status} counts={batch.request_counts}")
+            await asyncio.sleep(poll)
+
+    async def ingest(self, db: Session, batch: BatchStatus) -> BatchIngestReport:
+        """Normalize every successful result and persist it like a live extraction (no re-download)."""
+        report = BatchIngestReport(batch_id=batch.id)
+        manifest = self._read_manifest(batch.id)
+        openai_service = self.processor.openai_service
+
+        if batch.error_file_id:
+            for line in (await self.client.download_file(batch.error_file_id)).decode("utf-8").splitlines():
+                if line.strip():
+                    item = json.loads(line)
+                    report.failed += 1
+                    report.errors[item.get("custom_id", "?")] = json.dumps(item.get("error") or item.get("response"))
+
+        if not batch.output_file_id:
+            return report
+
+        for line in (await self.client.download_file(batch.output_file_id)).decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            file_id = item.get("custom_id")
+            job = manifest.get(file_id)
+            try:
+                if job is None:
+                    raise ValueError("custom_id not found in batch manifest")
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    raise ValueError(f"Batch request failed: {item.get('error') or response.get('body')}")
+                openai_usage_tracker.record("cv_extraction_batch", response["body"].get("usage"), request_id=file_id)
+                content = response["body"]["choices"][0]["message"]["content"]
+                extraction_result = openai_service.parse_completion_content(content, file_id)
+                await self.processor.save_extraction(
+                    db,
+                    job,
+                    extraction_result,
+                    model_used=job["modelUsed"],
+                    prompt_category=job["evaluationPromptCategory"],
+                    prompt_version=job["evaluationPromptVersion"],
+                    file_size_bytes=job["fileSizeBytes"],
+                    request_id=file_id,
+                )
+                report.succeeded += 1
+            except Exception as e:
+                logger.error(f"[{file_id}] Failed to ingest batch result: {e}")
+                report.failed += 1
+                report.errors[file_id or "?"] = str(e)
+
+        logger.info(f"Batch {batch.id} ingested: {report.succeeded} succeeded, {report.failed} failed")
+        return report
+
+    async def run(self, db: Session, limit: int, include_processed: bool = False) -> BatchIngestReport | None:
+        """Select pending CVs, submit, wait for completion and ingest results."""
+        jobs = await run_in_db_executor(self.find_pending_jobs, db, limit, include_processed=include_processed)
+        batch = await self.submit(db, jobs)
+        if batch is None:
+            return None
+        batch = await self.wait(batch.id)
+        return await self.ingest(db, batch)
+
+    # ---------- manifest ----------
+
+    def _manifest_path(self, batch_id: str) -> str:
+        return os.path.join(self.work_dir, f"{batch_id}.manifest.json")
+
+    def _write_manifest(self, batch_id: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+        with open(self._manifest_path(batch_id), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    def _read_manifest(self, batch_id: str) -> Dict[str, Dict[str, Any]]:
+        with open(self._manifest_path(batch_id), "r", encoding="utf-8") as f:
+            return json.load(f)
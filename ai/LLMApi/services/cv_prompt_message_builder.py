@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -11,11 +12,20 @@ class CvPromptTemplates:
     """
     Central place for CV extraction prompt defaults + parsing rules.
     Keep this file small and CV-specific (no generic prompt engine).
+
+    Templates keep {resume_text} LAST: OpenAI caches the longest shared prompt prefix,
+    so everything static (system message, JSON format, rules) must come before the
+    per-candidate text.
     """
 
     default_system_message: str
     default_user_template: str
     default_scoring_instructions: str
+    # Used with schema-enforced structured outputs: the response schema is sent as
+    # `response_format`, so the inline JSON skeleton is not repeated in the prompt.
+    default_structured_user_template: str
+    # Section-parallel extraction of long CVs: one call per section, {fields}/{field_format} filled in
+    default_section_user_template: str
 
 
 DEFAULT_TEMPLATES = CvPromptTemplates(
@@ -37,14 +47,28 @@ DEFAULT_TEMPLATES = CvPromptTemplates(
         "For 'Type' in Summaries: Use ONLY: Positives | Negatives | Overall | Weaknesses\n"
         "- Must give a short list of Key strengths (1 sentences per strength) of the candidate.\n"
     ),
-    default_user_template=(
+    default_structured_user_template=(
         "Please analyze the following CV/resume text and extract all available information.\n"
-        "Return the information in the exact JSON format provided below.\n"
+        "Use PascalCase field names exactly as defined by the response schema.\n"
         "If any information is missing or not available, use null values.\n\n"
         "CRITICAL OUTPUT RULES (MUST FOLLOW EXACTLY):\n"
         "{scoring_text}\n\n"
         "CV/Resume Text:\n"
-        "{resume_text}\n\n"
+        "{resume_text}\n"
+    ),
+    default_section_user_template=(
+        "The following text is ONE SECTION of a longer CV/resume.\n"
+        "Extract ONLY these fields from it: {fields}. Include every entry in the section, in order.\n"
+        "Use PascalCase field names and null for missing values.\n"
+        "Required JSON format:\n"
+        "{field_format}\n\n"
+        "CV Section Text:\n"
+        "{resume_text}\n"
+    ),
+    default_user_template=(
+        "Please analyze the following CV/resume text and extract all available information.\n"
+        "Return the information in the exact JSON format provided below.\n"
+        "If any information is missing or not available, use null values.\n\n"
         "Required JSON format (use PascalCase for all field names):\n"
         "{\n"
         "\"UserProfile\": {\n"
@@ -75,11 +99,23 @@ DEFAULT_TEMPLATES = CvPromptTemplates(
         "\"Scoring\": [{\"Category\": null, \"FixedCategory\": null,\"Score\": null,\"Years\": null,\"Level\": null}],\n"
         "\"Summaries\": [{\"Type\": null,\"Text\": null}],\n"
         "\"KeyStrengths\": [{\"StrengthName\": null,\"Description\": null}]\n"
-        "}\n"
+        "}\n\n"
+        "CRITICAL OUTPUT RULES (MUST FOLLOW EXACTLY):\n"
+        "{scoring_text}\n\n"
+        "CV/Resume Text:\n"
+        "{resume_text}\n"
     ),
 )
 
 
+# JSON skeletons for the list fields extracted per section (json_object mode)
+SECTION_FIELD_FORMATS: dict[str, str] = {
+    "Experience": "\"Experience\": [{\"Title\": null,\"Organization\": null,\"Industry\": null,\"Location\": null,\"StartDate\": null,\"EndDate\": null,\"Description\": null}]",
+    "Education": "\"Education\": [{\"Degree\": null,\"Institution\": null,\"FieldOfStudy\": null,\"Location\": null,\"StartDate\": null,\"EndDate\": null}]",
+    "ProjectsResearch": "\"ProjectsResearch\": [{\"Title\": null,\"Description\": null,\"Role\": null,\"TechnologiesUsed\": null,\"Link\": null}]",
+}
+
+
 def build_cv_extraction_messages(
     *,
     system_prompt_text: str | None,
@@ -87,6 +123,8 @@ def build_cv_extraction_messages(
     resume_text: str,
     request_id: str,
     templates: CvPromptTemplates = DEFAULT_TEMPLATES,
+    structured_output: bool = False,
+    omit_fields: Sequence[str] = (),
 ) -> list[dict]:
     """
     Build OpenAI chat messages for CV extraction using 2 DB prompts:
@@ -99,10 +137,21 @@ def build_cv_extraction_messages(
     ---USER---
     (user template; may include {resume_text} and {scoring_text})
 
-    If markers are not present, we treat the full text as the system message and use default user template.
+    If markers are not present, we treat the full text as the system message and use default user template
+    (the skeleton-free variant when `structured_output` is set).
+
+    DB templates that place {resume_text} before other static text are reordered so the
+    resume comes last (see `_move_resume_to_end`), keeping the cacheable prefix intact.
+
+    `omit_fields` (sectioned extraction) asks for empty arrays for fields extracted by separate calls.
     """
 
     scoring_text = (scoring_prompt_text or "").strip() or templates.default_scoring_instructions
+    if omit_fields:
+        scoring_text += (
+            f"\n- Return EMPTY arrays for {', '.join(omit_fields)}: they are extracted separately. "
+            "Still use those parts of the CV for Scoring, Summaries and KeyStrengths."
+        )
     raw = (system_prompt_text or "").strip()
 
     system_content, user_template = _split_system_prompt(raw)
@@ -112,13 +161,40 @@ def build_cv_extraction_messages(
         system_content = templates.default_system_message
 
     if not user_template:
-        user_template = templates.default_user_template
+        user_template = (
+            templates.default_structured_user_template if structured_output else templates.default_user_template
+        )
 
+    user_template = _move_resume_to_end(user_template)
     user_content = _apply_placeholders(user_template, scoring_text=scoring_text, resume_text=resume_text)
 
     return [{"role": "system", "content": system_content}, {"role": "user", "content": user_content}]
 
 
+def build_cv_section_messages(
+    *,
+    system_prompt_text: str | None,
+    fields: Sequence[str],
+    section_text: str,
+    request_id: str,
+    templates: CvPromptTemplates = DEFAULT_TEMPLATES,
+) -> list[dict]:
+    """Messages for extracting `fields` from one resume section (same system message as the full call)."""
+    system_content, _ = _split_system_prompt((system_prompt_text or "").strip())
+    if not system_content:
+        logger.warning(f"[{request_id}] System prompt missing/empty; using built-in default system message.")
+        system_content = templates.default_system_message
+
+    field_format = "{\n" + ",\n".join(SECTION_FIELD_FORMATS[f] for f in fields) + "\n}"
+    user_content = (
+        templates.default_section_user_template
+        .replace("{fields}", ", ".join(fields))
+        .replace("{field_format}", field_format)
+        .replace("{resume_text}", section_text)
+    )
+    return [{"role": "system", "content": system_content}, {"role": "user", "content": user_content}]
+
+
 def _split_system_prompt(system_prompt_text: str) -> tuple[str | None, str | None]:
     raw = (system_prompt_text or "").strip()
     if not raw:
@@ -134,6 +210,23 @@ def _split_system_prompt(system_prompt_text: str) -> tuple[str | None, str | Non
     return raw, None
 
 
+def _move_resume_to_end(template: str) -> str:
+    """
+    Move any static text that follows {resume_text} in front of the resume paragraph.
+    The resume paragraph ("CV/Resume Text:\n{resume_text}") is the text after the last
+    blank line preceding the placeholder, so its label stays attached.
+    """
+    if template.count("{resume_text}") != 1:
+        return template
+    head, tail = template.split("{resume_text}", 1)
+    if not tail.strip():
+        return template
+    cut = head.rfind("\n\n")
+    prefix, resume_label = (head[:cut].rstrip(), head[cut:].lstrip("\n")) if cut != -1 else ("", head)
+    static = "\n\n".join(part for part in (prefix, tail.strip()) if part)
+    return f"{static}\n\n{resume_label}{{resume_text}}\n"
+
+
 def _apply_placeholders(template: str, *, scoring_text: str, resume_text: str) -> str:
     # Use simple replace (not .format) so JSON braces in the schema don't break.
     return template.replace("{scoring_text}", scoring_text).replace("{resume_text}", resume_text)
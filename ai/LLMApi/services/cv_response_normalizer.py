@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# ---------- lookup tables (built once) ----------
+
+LEVEL_MAP = {
+    "Fluent": "Senior", "High": "Senior", "Proficient": "Senior",
+    "Advanced": "Senior", "Intermediate": "Mid", "Beginner": "Junior",
+    "Basic": "Junior", "Expert": "Expert", "Senior": "Senior",
+    "Mid": "Mid", "Junior": "Junior"
+}
+TYPE_MAP = {
+    "Positive": "Positives", "Negative": "Negatives",
+    "Positives": "Positives", "Negatives": "Negatives", "Overall": "Overall",
+    "Weakness": "Weaknesses", "Weaknesses": "Weaknesses"
+}
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"),
+        start=1,
+    )
+}
+_ONGOING = frozenset({"present", "current"})
+
+# "January 2023" | "2021-05" | "2021" in one precompiled pattern
+_DATE_RE = re.compile(
+    r"^(?:(?P<month_name>" + "|".join(_MONTHS) + r")\s+(?P<month_year>\d{4})"
+    r"|(?P<ym_year>\d{4})-(?P<ym_month>\d{1,2})"
+    r"|(?P<year>\d{4}))$",
+    re.IGNORECASE,
+)
+
+_ARRAY_FIELDS = (
+    "Experience", "Education", "Skills", "ProjectsResearch",
+    "CertificationsLicenses", "AwardsAchievements", "VolunteerExtracurricular",
+    "Scoring", "Summaries", "KeyStrengths",
+)
+_PROFILE_LIST_FIELDS = ("JobTypePreferences", "RemotePreferences", "Roles")
+
+
+@lru_cache(maxsize=8192)
+def normalize_date(date_str: str | None) -> str | None:
+    """Normalize various date formats to ISO YYYY-MM-DD or return None for invalid/ongoing dates."""
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    if date_str.lower() in _ONGOING:
+        return None
+
+    match = _DATE_RE.match(date_str)
+    if match is not None:
+        if match["month_name"]:
+            return f"{match['month_year']}-{_MONTHS[match['month_name'].lower()]:02d}-01"
+        if match["ym_year"]:
+            return f"{match['ym_year']}-{int(match['ym_month']):02d}-01"
+        return f"{match['year']}-01-01"
+
+    # Try parsing exact dates like "2023-01-15"
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+    except Exception:
+        return None
+
+
+def _date(value: Any) -> str | None:
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = str(value)
+    return normalize_date(value) if isinstance(value, str) or value is None else None
+
+
+def _to_int(value: Any) -> int | None:
+    # Pydantic expects int; truncate floats safely (e.g. "3.5" -> 3)
+    try:
+        if isinstance(value, str):
+            value = value.strip()
+            if value == "":
+                return None
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+# ---------- per-item rules ----------
+
+def _date_fields(*names: str) -> Callable[[dict], None]:
+    def rule(item: dict) -> None:
+        for name in names:
+            item[name] = _date(item.get(name))
+    return rule
+
+
+def _award(item: dict) -> None:
+    year = item.get("Year")
+    if isinstance(year, str) and year.isdigit():
+        item["Year"] = int(year)
+    elif not isinstance(year, int):
+        item["Year"] = None
+
+
+def _skill(item: dict) -> None:
+    years = item.get("YearsExperience")
+    item["YearsExperience"] = _to_int(years) if isinstance(years, (str, int, float)) else None
+
+
+def _scoring(item: dict) -> None:
+    # Some models may emit YearsExperience instead of Years for scoring items
+    if item.get("Years") is None and item.get("YearsExperience") is not None:
+        item["Years"] = item.get("YearsExperience")
+    for key in ("Score", "Years"):
+        if item.get(key) is not None:
+            item[key] = _to_int(item[key])
+    # Score must be 1-10, otherwise null
+    score = item.get("Score")
+    if isinstance(score, int) and not 1 <= score <= 10:
+        item["Score"] = None
+    if "Level" in item:
+        item["Level"] = LEVEL_MAP.get(str(item["Level"]).strip(), "Junior")
+
+
+def _summary(item: dict) -> None:
+    if "Type" in item:
+        item["Type"] = TYPE_MAP.get(str(item["Type"]).strip(), "Overall")
+
+
+_ITEM_RULES: dict[str, Callable[[dict], None]] = {
+    "Experience": _date_fields("StartDate", "EndDate"),
+    "Education": _date_fields("StartDate", "EndDate"),
+    "CertificationsLicenses": _date_fields("DateIssued", "ValidUntil"),
+    "VolunteerExtracurricular": _date_fields("StartDate", "EndDate"),
+    "AwardsAchievements": _award,
+    "Skills": _skill,
+    "Scoring": _scoring,
+    "Summaries": _summary,
+}
+
+
+def _user_profile(profile: dict) -> None:
+    for name in _PROFILE_LIST_FIELDS:
+        value = profile.get(name)
+        if isinstance(value, str):
+            profile[name] = [value.strip()]
+        elif isinstance(value, list):
+            profile[name] = [item.strip() if isinstance(item, str) else item for item in value if item]
+
+
+def normalize_cv_response(data: dict, request_id: str = "unknown") -> dict:
+    """
+    Normalize an extraction response in place (one pass over the document) and enforce
+    strict enum values: profile strings -> lists, missing arrays -> [], ISO dates,
+    integer years/scores, Scoring.Level and Summaries.Type mapped to their enums.
+    """
+    try:
+        profile = data.get("UserProfile")
+        if isinstance(profile, dict):
+            _user_profile(profile)
+
+        for field in _ARRAY_FIELDS:
+            items = data.get(field)
+            if items is None:
+                data[field] = []
+                continue
+            rule = _ITEM_RULES.get(field)
+            if rule is None or not isinstance(items, list):
+                continue
+            for item in items:
+                if isinstance(item, dict):
+                    rule(item)
+
+        logger.debug(f"[{request_id}] Response data normalized successfully")
+        return data
+
+    except Exception as e:
+        logger.error(f"[{request_id}] Error normalizing response data: {e}")
+        return data  # Return original on failure (better than crashing)
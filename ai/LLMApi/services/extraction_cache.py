@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Optional
+
+from config import settings
+from services.prompt_resolver import ResolvedPrompt
+
+logger = logging.getLogger(__name__)
+
+# Bump when a code change alters what extraction produces for the same inputs (prompt layout,
+# normalizer rules, ...) so entries written by the old code stop matching
+EXTRACTION_PIPELINE_VERSION = 1
+
+
+def extraction_pipeline_fingerprint() -> str:
+    """Settings that change the extraction result for the same file, prompts and model."""
+    return ";".join((
+        f"v={EXTRACTION_PIPELINE_VERSION}",
+        f"output={settings.cv_extraction_output_mode}",
+        f"compaction={settings.resume_compaction_enabled}:{settings.resume_token_budget}:{settings.resume_tokenizer_encoding}",
+        f"sectioned={settings.cv_sectioned_extraction_min_chars}:{settings.cv_section_min_chars}",
+    ))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class ExtractionCacheBackend(ABC):
+    """Storage for normalized extraction results keyed by a content hash."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, value: dict) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+
+class FileSystemCacheBackend(ExtractionCacheBackend):
+    """
+    One JSON file per entry under `directory`.
+    Least-recently-used entries are evicted once `max_entries` or `max_bytes` is exceeded;
+    entries older than `ttl_seconds` are treated as misses and removed.
+    """
+
+    def __init__(self, directory: str, *, max_entries: int, max_bytes: int, ttl_seconds: int, stats: CacheStats) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._stats = stats
+        # key -> (size_bytes, created_at, last_access)
+        self._index: dict[str, tuple[int, float, float]] | None = None
+        self._total_bytes = 0
+        self._lock = Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load_index(self) -> dict[str, tuple[int, float, float]]:
+        # Called with the lock held
+        if self._index is not None:
+            return self._index
+        # Entries hold candidate PII: keep the directory private to the service account
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        os.chmod(self.directory, 0o700)
+        index: dict[str, tuple[int, float, float]] = {}
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            st = entry.stat()
+            index[entry.name[:-5]] = (st.st_size, st.st_mtime, st.st_atime)
+            total += st.st_size
+        self._index = index
+        self._total_bytes = total
+        return index
+
+    def _remove(self, key: str) -> None:
+        # Called with the lock held
+        index = self._load_index()
+        size, _, _ = index.pop(key, (0, 0.0, 0.0))
+        self._total_bytes -= size
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            index = self._load_index()
+            meta = index.get(key)
+            if meta is None:
+                return None
+            size, created_at, _ = meta
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                self._remove(key)
+                self._stats.expirations += 1
+                return None
+            index[key] = (size, created_at, now)
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Extraction cache entry {key} unreadable, dropping: {e}")
+            with self._lock:
+                self._remove(key)
+            return None
+
+    def put(self, key: str, value: dict) -> None:
+        payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self._load_index()
+            # Write to a temp file then rename so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+            now = time.time()
+            if key in self._index:
+                self._total_bytes -= self._index[key][0]
+            self._index[key] = (len(payload), now, now)
+            self._total_bytes += len(payload)
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _evict(self) -> None:
+        # Called with the lock held
+        index = self._index
+        if len(index) <= self.max_entries and self._total_bytes <= self.max_bytes:
+            return
+        for key in sorted(index, key=lambda k: index[k][2]):
+            if len(index) <= self.max_entries and self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+            self._stats.evictions += 1
+
+
+class ExtractionCache:
+    """
+    Content-addressed cache of normalized CV extraction results.
+
+    Key = SHA-256 over the file bytes, the resolved system/scoring prompts (name+version),
+    the model and the extraction pipeline settings, so a prompt bump, model change or
+    pipeline change (output mode, compaction, sectioning) naturally invalidates old entries.
+    """
+
+    def __init__(self, backend: ExtractionCacheBackend | None, *, enabled: bool = True, stats: CacheStats | None = None) -> None:
+        self.backend = backend
+        self.enabled = enabled and backend is not None
+        self.stats = stats or CacheStats()
+
+    @staticmethod
+    def _prompt_fingerprint(prompt: ResolvedPrompt) -> str:
+        # DB prompts are immutable per name+version; defaults have no version, so hash their content
+        if prompt.version is not None:
+            return f"{prompt.name}:{prompt.version}"
+        return f"{prompt.name}:sha256={hashlib.sha256(prompt.content.encode('utf-8')).hexdigest()}"
+
+    def build_key(
+        self,
+        file_content: bytes,
+        system_prompt: ResolvedPrompt,
+        scoring_prompt: ResolvedPrompt,
+        model: str,
+        pipeline: str | None = None,
+    ) -> str:
+        h = hashlib.sha256()
+        h.update(file_content)
+        h.update(b"\x00system=" + self._prompt_fingerprint(system_prompt).encode("utf-8"))
+        h.update(b"\x00scoring=" + self._prompt_fingerprint(scoring_prompt).encode("utf-8"))
+        h.update(b"\x00model=" + model.encode("utf-8"))
+        pipeline = extraction_pipeline_fingerprint() if pipeline is None else pipeline
+        h.update(b"\x00pipeline=" + pipeline.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str, *, request_id: str = "unknown") -> Optional[dict]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"[{request_id}] Extraction cache read failed: {e}")
+            value = None
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        logger.info(f"[{request_id}] Extraction cache hit ({key[:12]})")
+        return value
+
+    def put(self, key: str, value: dict, *, request_id: str = "unknown") -> None:
+        if not self.enabled or value is None:
+            return
+        try:
+            self.backend.put(key, value)
+            self.stats.stores += 1
+        except Exception as e:
+            # A cache failure must never fail the CV
+            logger.warning(f"[{request_id}] Extraction cache write failed: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": round(self.stats.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stats.stores,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+        }
+
+
+def _build_default_cache() -> ExtractionCache:
+    stats = CacheStats()
+    if settings.extraction_cache_enabled and not settings.extraction_cache_dir:
+        # No shared temp-dir fallback: the entries are full CV extractions
+        logger.warning("EXTRACTION_CACHE_ENABLED is set without EXTRACTION_CACHE_DIR; extraction cache disabled")
+        return ExtractionCache(None, enabled=False, stats=stats)
+    backend = FileSystemCacheBackend(
+        settings.extraction_cache_dir,
+        max_entries=settings.extraction_cache_max_entries,
+        max_bytes=settings.extraction_cache_max_mb * 1024 * 1024,
+        ttl_seconds=settings.extraction_cache_ttl_hours * 3600,
+        stats=stats,
+    )
+    return ExtractionCache(backend, enabled=settings.extraction_cache_enabled, stats=stats)
+
+
+# Singleton (per process)
+extraction_cache = _build_default_cache()
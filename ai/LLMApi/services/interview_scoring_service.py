@@ -1,13 +1,15 @@
-import asyncio
 import json
 import logging
+import time
 from typing import Any
 
-from openai import AsyncOpenAI
 from typing import List
 
-from database import SessionLocal
 from services.prompt_resolver import PromptRef, prompt_resolver
+from services.openai_client import get_async_openai_client
+from core.resilience import openai_resilience
+from services.openai_rate_limiter import RequestPriority, estimate_message_tokens, openai_rate_limiter
+from services.openai_usage import openai_usage_tracker
 from config import settings
 from models.pydantic_models import ScoringCriteria, TranscriptItem, InterviewScore
 from repositories.score_repository import score_repository
@@ -17,12 +19,15 @@ logger = logging.getLogger(__name__)
 
 class InterviewScoringService:
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
         self.model = settings.openai_model
         self.max_output_tokens = settings.max_output_tokens
         self.text_verbosity = settings.text_verbosity
+
+    @property
+    def client(self):
+        return get_async_openai_client()
     
-    def _build_scoring_prompt(self, transcript: List[TranscriptItem], criteria: ScoringCriteria) -> str:
+    async def _build_scoring_prompt(self, transcript: List[TranscriptItem], criteria: ScoringCriteria) -> str:
 
         conversation_lines = []
         for item in transcript:
@@ -35,16 +40,12 @@ class InterviewScoringService:
         problem_solving_weight = criteria.ProblemSolving
         english_weight = criteria.English
 
-        db = SessionLocal()
-        
-
-        scoring_prompt = prompt_resolver.resolve(
-                db,
-                PromptRef(name="Transcript Scoring Prompt"),
-                request_id="request_id",
-                default_content="",
-                allow_latest=True,
-            )
+        scoring_prompt = await prompt_resolver.resolve_async(
+            PromptRef(name="Transcript Scoring Prompt"),
+            request_id="request_id",
+            default_content="",
+            allow_latest=True,
+        )
         
         if not scoring_prompt:
             raise ValueError("Scoring prompt not found.")
@@ -75,61 +76,66 @@ class InterviewScoringService:
 
         DEBUG = False  # Set to True to enable debug mode with fixed responses
         
-        prompt = self._build_scoring_prompt(transcript, criteria)
+        prompt = await self._build_scoring_prompt(transcript, criteria)
 
-        last_error: Exception | None = None
         max_output_tokens = self.max_output_tokens
         for attempt in range(1, 3):
+            # If in debug mode, return a fixed response
+            if DEBUG:
+                return InterviewScore(
+                    Communication=25,
+                    Technical=35,
+                    ProblemSolving=25,
+                    English=15
+                )
+
+            # Responses API + Structured Outputs
+            parse_kwargs: dict[str, Any] = {
+                "model": self.model,
+                "instructions": (
+                    "You are an expert HR and technical interviewer. You evaluate candidates fairly and provide constructive, detailed feedback. "
+                    "Return ONLY valid JSON that matches the schema."
+                ),
+                "input": prompt,
+                "max_output_tokens": max_output_tokens,
+                "text": {"verbosity": self.text_verbosity},
+                "text_format": InterviewScore,
+            }
             try:
-                # If in debug mode, return a fixed response
-                if DEBUG:
-                    return InterviewScore(
-                        Communication=25,
-                        Technical=35,
-                        ProblemSolving=25,
-                        English=15
-                    )
-
-                # Responses API + Structured Outputs
-                parse_kwargs: dict[str, Any] = {
-                    "model": self.model,
-                    "instructions": (
-                        "You are an expert HR and technical interviewer. You evaluate candidates fairly and provide constructive, detailed feedback. "
-                        "Return ONLY valid JSON that matches the schema."
-                    ),
-                    "input": prompt,
-                    "max_output_tokens": max_output_tokens,
-                    "text": {"verbosity": self.text_verbosity},
-                    "text_format": InterviewScore,
-                }
-                response = await self.client.responses.parse(**parse_kwargs)
-
-                status = getattr(response, "status", None)
-                if status == "incomplete":
-                    incomplete = getattr(response, "incomplete_details", None)
-                    reason = getattr(incomplete, "reason", None)
-                    if attempt < 2 and reason == "max_output_tokens" and max_output_tokens < 8000:
-                        max_output_tokens = min(8000, max_output_tokens * 2)
-                        await asyncio.sleep(0.2)
-                        continue
-                    raise ValueError(f"Incomplete response from OpenAI: {incomplete}")
-
-                parsed = getattr(response, "output_parsed", None)
-                if parsed is None:
-                    # If parsing failed for any reason, surface the best available text.
-                    output_text = getattr(response, "output_text", None)
-                    raise ValueError(f"No parsed output from OpenAI. output_text={output_text!r}")
-                
-                return parsed
-
+                # Transient failures (429/5xx/timeouts) are retried by the shared engine; unparsed output is not
+                response = await openai_resilience.call_async(self._request_score, parse_kwargs)
             except Exception as e:
-                last_error = e
-                if attempt < 2:
-                    await asyncio.sleep(0.5)
-                    continue
-                break
+                raise ValueError(f"OpenAI API error: {e}")
 
-        raise ValueError(f"OpenAI API error: {last_error}")
+            incomplete = getattr(response, "incomplete_details", None)
+            if getattr(response, "status", None) == "incomplete":
+                reason = getattr(incomplete, "reason", None)
+                if attempt < 2 and reason == "max_output_tokens" and max_output_tokens < 8000:
+                    max_output_tokens = min(8000, max_output_tokens * 2)
+                    continue
+                raise ValueError(f"OpenAI API error: Incomplete response from OpenAI: {incomplete}")
+
+            return response.output_parsed
+
+        raise ValueError("OpenAI API error: response still incomplete after raising max_output_tokens")
+
+    async def _request_score(self, parse_kwargs: dict[str, Any]):
+        estimated_tokens = estimate_message_tokens(parse_kwargs["input"]) + parse_kwargs["max_output_tokens"]
+        async with openai_rate_limiter.limit(
+            estimated_tokens, RequestPriority.INTERACTIVE, parse_kwargs["model"]
+        ) as permit:
+            started = time.perf_counter()
+            response = await self.client.responses.parse(**parse_kwargs)
+            permit.record_usage(getattr(response, "usage", None))
+        openai_usage_tracker.record(
+            "interview_scoring", getattr(response, "usage", None), latency_seconds=time.perf_counter() - started
+        )
+
+        if getattr(response, "status", None) != "incomplete" and getattr(response, "output_parsed", None) is None:
+            # If parsing failed for any reason, surface the best available text.
+            output_text = getattr(response, "output_text", None)
+            raise ValueError(f"No parsed output from OpenAI. output_text={output_text!r}")
+        return response
     
     async def process_transcript(
         self,
@@ -137,8 +143,8 @@ class InterviewScoringService:
         conv_id: str
     ) -> tuple[bool, str]:
         try:
-            interview = interview_repository.get_by_conv_id(conv_id)
-            if not interview:
+            interview_id = await interview_repository.get_id_by_conv_id_async(conv_id)
+            if not interview_id:
                 raise ValueError(f"No Interview found for conv_id={conv_id}")
             
             criteria = ScoringCriteria(
@@ -149,7 +155,7 @@ class InterviewScoringService:
             )
             score = await self._score_transcript(transcript, criteria)
 
-            score_repository.create_or_update_score(score, interview_id=interview.Id)
+            await score_repository.create_or_update_score_async(score, interview_id=interview_id)
 
             return True, "Interview scored successfully"
         except Exception as e:
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+from threading import Lock
+from typing import Any
+
+from pydantic import ValidationError
+
+from config import settings
+from models.pydantic_models import CVExtractionResponse
+from services.resume_sections import count_section_headings, has_section
+
+logger = logging.getLogger(__name__)
+
+
+class ModelCascade:
+    """
+    Routing rules for CV extraction (used by CVProcessor).
+
+    Short resumes with recognisable section headings go to `cascade_model` first; the
+    result is accepted only if it validates against CVExtractionResponse and passes the
+    quality heuristics below, otherwise the caller escalates to the main model.
+    """
+
+    def __init__(self, *, enabled: bool, cascade_model: str, main_model: str, max_chars: int, min_headings: int) -> None:
+        self.enabled = enabled and bool(cascade_model) and cascade_model != main_model
+        self.cascade_model = cascade_model
+        self.main_model = main_model
+        self.max_chars = max_chars
+        self.min_headings = min_headings
+        self._lock = Lock()
+        self._stats = {"routed_main": 0, "routed_cascade": 0, "accepted": 0, "escalated": 0}
+
+    @property
+    def cache_model_key(self) -> str:
+        """Model part of the extraction cache key: results depend on the whole routing setup."""
+        if not self.enabled:
+            return self.main_model
+        return f"{self.cascade_model}>{self.main_model}:{self.max_chars}:{self.min_headings}"
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def route(self, resume_text: str, request_id: str = "unknown") -> str:
+        """Model to try first for this resume."""
+        if self.enabled and len(resume_text) <= self.max_chars and count_section_headings(resume_text) >= self.min_headings:
+            self._count("routed_cascade")
+            logger.info(f"[{request_id}] Simple CV ({len(resume_text)} chars): trying {self.cascade_model} first")
+            return self.cascade_model
+        self._count("routed_main")
+        return self.main_model
+
+    def quality_issues(self, result: dict, resume_text: str) -> list[str]:
+        """Reasons to distrust a cascade-model result (empty list = accept)."""
+        try:
+            cv = CVExtractionResponse.model_validate(result)
+        except ValidationError as e:
+            return [f"validation failed: {e.error_count()} errors"]
+
+        issues = []
+        if not (cv.UserProfile.Name or "").strip():
+            issues.append("no candidate name")
+        if not cv.Scoring:
+            issues.append("empty Scoring")
+        if not cv.Summaries:
+            issues.append("no Summaries")
+        if not cv.KeyStrengths:
+            issues.append("no KeyStrengths")
+        if not cv.Experience and has_section(resume_text, "experience"):
+            issues.append("Experience section present but nothing extracted")
+        if not cv.Education and has_section(resume_text, "education"):
+            issues.append("Education section present but nothing extracted")
+        if any(item.Score is None for item in cv.Scoring):
+            issues.append("Scoring entries without Score")
+        return issues
+
+    def record_outcome(self, accepted: bool) -> None:
+        self._count("accepted" if accepted else "escalated")
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+        stats.update(enabled=self.enabled, cascade_model=self.cascade_model, main_model=self.main_model)
+        return stats
+
+
+# Singleton (per process)
+model_cascade = ModelCascade(
+    enabled=settings.cv_cascade_enabled,
+    cascade_model=settings.cv_cascade_model,
+    main_model=settings.openai_model,
+    max_chars=settings.cv_cascade_max_chars,
+    min_headings=settings.cv_cascade_min_headings,
+)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import weakref
+from threading import Lock
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI
+
+from config import settings
+from services.openai_rate_limiter import current_model, openai_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# One AsyncOpenAI client per event loop. httpx connections are bound to the loop that
+# opened them, and the Service Bus trigger runs each message on its own worker-thread loop.
+# Each client is closed inside its loop when the loop shuts down (see _close_with_loop).
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[AsyncOpenAI, Any]]" = weakref.WeakKeyDictionary()
+_lock = Lock()
+
+
+async def _observe_rate_limits(response: httpx.Response) -> None:
+    # Every OpenAI response carries x-ratelimit-* headers; feed them to the shared limiter. The hook
+    # runs in the calling task, so the model is the one reserved by the enclosing limit() block
+    # (calls made outside the limiter, e.g. Batch API file uploads, count against the default model)
+    openai_rate_limiter.update_from_headers(response.headers, response.status_code, current_model())
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry=settings.openai_keepalive_expiry_seconds,
+    )
+    timeout = httpx.Timeout(
+        settings.openai_request_timeout_seconds,
+        connect=settings.openai_connect_timeout_seconds,
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeout, event_hooks={"response": [_observe_rate_limits]})
+
+
+async def _close_with_loop(client: AsyncOpenAI):
+    """
+    Parked async generator that closes `client` when its loop shuts down: asyncio.run() and
+    loop.shutdown_asyncgens() aclose() every live async generator before the loop is closed,
+    which is the last point where the loop-bound httpx connections can still be closed.
+    """
+    try:
+        yield
+    finally:
+        with _lock:
+            for loop, registered in list(_clients.items()):
+                if registered[0] is client:
+                    del _clients[loop]
+        await client.close()
+
+
+def _park(generator) -> None:
+    # Advance to the first `yield` synchronously (nothing is awaited before it); the running
+    # loop's firstiter hook registers the generator for shutdown_asyncgens()
+    try:
+        generator.asend(None).send(None)
+    except StopIteration:
+        pass
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client for the running event loop (keep-alive pool reused)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        registered = _clients.get(loop)
+        if registered is None:
+            # SDK retries are disabled: core/resilience.py owns retries, budgets and circuit breaking
+            client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=_build_http_client(), max_retries=0)
+            closer = _close_with_loop(client)
+            _park(closer)
+            # The loop only holds its async generators weakly: the entry keeps the closer alive
+            registered = _clients[loop] = (client, closer)
+            logger.info(
+                f"Created AsyncOpenAI client (max_connections={settings.openai_max_connections}, "
+                f"keepalive={settings.openai_max_keepalive_connections})"
+            )
+        return registered[0]
+
+
+async def aclose_async_openai_client() -> None:
+    """Close the running loop's client now (e.g. FastAPI shutdown); a later call creates a new one."""
+    with _lock:
+        registered = _clients.pop(asyncio.get_running_loop(), None)
+    if registered is not None:
+        await registered[1].aclose()
+
+
+@atexit.register
+def close_async_openai_clients() -> None:
+    """
+    Close the clients of loops that are idle at process exit (worker-thread loops of the Service
+    Bus trigger are never closed). Clients of running or already closed loops are left alone.
+    """
+    with _lock:
+        registered = list(_clients.items())
+        _clients.clear()
+    for loop, (client, closer) in registered:
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(closer.aclose())
+        except Exception as e:
+            logger.warning(f"Could not close AsyncOpenAI client: {e}")
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import re
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from threading import Lock
+from typing import Any, AsyncIterator, Iterator, Mapping
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+_MAX_SLEEP_SECONDS = 1.0
+_APPROX_CHARS_PER_TOKEN = 4
+
+
+class RequestPriority(IntEnum):
+    """Lower value is served first."""
+
+    INTERACTIVE = 0  # webhook / user-facing work (interview scoring, API CV uploads)
+    BACKGROUND = 1  # queue-driven CV extraction, bulk jobs
+
+    @classmethod
+    def parse(cls, value: Any) -> "RequestPriority":
+        """Priority named in a queue message ("interactive" / "background"); BACKGROUND otherwise."""
+        try:
+            return cls[str(value).upper()]
+        except KeyError:
+            return cls.BACKGROUND
+
+
+# Priority of the OpenAI calls made in this context (see request_priority)
+_current_priority: ContextVar[RequestPriority] = ContextVar("openai_request_priority", default=RequestPriority.BACKGROUND)
+# Model reserved by the enclosing limit(); the HTTP response hook attributes the headers to it
+_current_model: ContextVar[str | None] = ContextVar("openai_request_model", default=None)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run the OpenAI calls made inside the block (and the tasks it spawns) at `priority`."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> RequestPriority:
+    return _current_priority.get()
+
+
+def current_model() -> str | None:
+    """Model of the limit() block the caller is in; None outside rate-limited calls."""
+    return _current_model.get()
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Parse OpenAI reset headers like "1s", "6m0s", "20ms" into seconds."""
+    if not value:
+        return None
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(n) * _DURATION_SECONDS[unit] for n, unit in parts)
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // _APPROX_CHARS_PER_TOKEN)
+
+
+def estimate_message_tokens(messages: list[dict] | str) -> int:
+    if isinstance(messages, str):
+        return estimate_tokens(messages)
+    return sum(estimate_tokens(str(m.get("content") or "")) for m in messages)
+
+
+class _Bucket:
+    """Requests + tokens budget and waiter queue of one model (OpenAI limits are per model)."""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self.rpm_capacity = float(requests_per_minute)
+        self.tpm_capacity = float(tokens_per_minute)
+        self.rpm_available = self.rpm_capacity
+        self.tpm_available = self.tpm_capacity
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self.waiting: set[tuple[int, int]] = set()
+        self.throttled_responses = 0
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.last_refill
+        if elapsed <= 0:
+            return
+        self.rpm_available = min(self.rpm_capacity, self.rpm_available + elapsed * self.rpm_capacity / 60.0)
+        self.tpm_available = min(self.tpm_capacity, self.tpm_available + elapsed * self.tpm_capacity / 60.0)
+        self.last_refill = now
+
+    def seconds_until_available(self, tokens: float, now: float) -> float:
+        wait = max(0.0, self.paused_until - now)
+        if self.rpm_available < 1:
+            wait = max(wait, (1 - self.rpm_available) * 60.0 / self.rpm_capacity)
+        if self.tpm_available < tokens:
+            wait = max(wait, (tokens - self.tpm_available) * 60.0 / self.tpm_capacity)
+        return wait
+
+
+class _Permit:
+    def __init__(self, limiter: "OpenAIRateLimiter", bucket: _Bucket, reserved_tokens: int) -> None:
+        self._limiter = limiter
+        self._bucket = bucket
+        self.reserved_tokens = reserved_tokens
+        self.settled = False
+
+    def record_usage(self, usage: Any) -> None:
+        """Reconcile the reservation with the actual `usage` reported by the API."""
+        total = getattr(usage, "total_tokens", None) if usage is not None else None
+        if total is None:
+            return
+        self._limiter._refund(self._bucket, self.reserved_tokens - int(total))
+        self.reserved_tokens = int(total)
+        self.settled = True
+
+    def release(self) -> None:
+        """Give back a reservation no usage was reported for (failed, throttled or cancelled call)."""
+        if not self.settled:
+            self._limiter._refund(self._bucket, self.reserved_tokens)
+            self.reserved_tokens = 0
+            self.settled = True
+
+
+class OpenAIRateLimiter:
+    """
+    Process-wide requests-per-minute + tokens-per-minute limiter for all OpenAI traffic.
+
+    Each model has two continuously refilling buckets that gate its calls (OpenAI enforces
+    limits per model, so e.g. the cascade model does not spend the main model's budget).
+    Limits and remaining budget are corrected from the `x-ratelimit-*` response headers (see
+    services/openai_client.py), and a 429 pauses the model's callers for the server-provided
+    reset time. Waiters are served by (priority, arrival), so interactive work overtakes queued
+    background work. Thread-safe: queue triggers run their own event loops on worker threads.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, default_model: str | None = None) -> None:
+        self._lock = Lock()
+        self._requests_per_minute = requests_per_minute
+        self._tokens_per_minute = tokens_per_minute
+        # Calls and responses that do not name a model are counted against this one
+        self.default_model = default_model or settings.openai_model
+        self._buckets: dict[str, _Bucket] = {}
+        self._seq = itertools.count()
+        # metrics
+        self._granted = 0
+        self._waited = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    # ---------- bucket maintenance (lock held) ----------
+
+    def _bucket(self, model: str | None) -> _Bucket:
+        model = model or self.default_model
+        bucket = self._buckets.get(model)
+        if bucket is None:
+            # Configured limits until the first response reports the model's own
+            bucket = self._buckets[model] = _Bucket(self._requests_per_minute, self._tokens_per_minute)
+        return bucket
+
+    def _refund(self, bucket: _Bucket, tokens: int) -> None:
+        with self._lock:
+            bucket.tpm_available = min(bucket.tpm_capacity, bucket.tpm_available + tokens)
+
+    # ---------- public API ----------
+
+    async def acquire(
+        self,
+        estimated_tokens: int,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+        model: str | None = None,
+    ) -> _Permit:
+        ticket = (int(priority), next(self._seq))
+        start = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(model)
+            bucket.waiting.add(ticket)
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    bucket.refill(now)
+                    # A single request larger than the whole minute budget could never be admitted
+                    tokens = float(min(max(estimated_tokens, 1), bucket.tpm_capacity))
+                    delay = bucket.seconds_until_available(tokens, now)
+                    if delay <= 0 and ticket == min(bucket.waiting):
+                        bucket.rpm_available -= 1
+                        bucket.tpm_available -= tokens
+                        self._record_wait(now - start)
+                        return _Permit(self, bucket, int(tokens))
+                await asyncio.sleep(min(max(delay, 0.01), _MAX_SLEEP_SECONDS))
+        finally:
+            with self._lock:
+                bucket.waiting.discard(ticket)
+
+    @asynccontextmanager
+    async def limit(
+        self,
+        estimated_tokens: int,
+        priority: RequestPriority = RequestPriority.BACKGROUND,
+        model: str | None = None,
+    ) -> AsyncIterator[_Permit]:
+        permit = await self.acquire(estimated_tokens, priority, model)
+        model_token = _current_model.set(model)
+        try:
+            yield permit
+        finally:
+            _current_model.reset(model_token)
+            # The request slot stays spent; unreported tokens go back so failures do not starve later calls
+            permit.release()
+
+    def update_from_headers(
+        self, headers: Mapping[str, str], status_code: int | None = None, model: str | None = None
+    ) -> None:
+        """Adapt to the server's view of `model`'s limits (called for every OpenAI HTTP response)."""
+        def _int(name: str) -> int | None:
+            raw = headers.get(name)
+            try:
+                return int(raw) if raw is not None else None
+            except ValueError:
+                return None
+
+        limit_requests = _int("x-ratelimit-limit-requests")
+        limit_tokens = _int("x-ratelimit-limit-tokens")
+        remaining_requests = _int("x-ratelimit-remaining-requests")
+        remaining_tokens = _int("x-ratelimit-remaining-tokens")
+
+        with self._lock:
+            bucket = self._bucket(model)
+            bucket.refill(time.monotonic())
+            if limit_requests:
+                bucket.rpm_capacity = float(limit_requests)
+            if limit_tokens:
+                bucket.tpm_capacity = float(limit_tokens)
+            if remaining_requests is not None:
+                bucket.rpm_available = min(bucket.rpm_available, float(remaining_requests))
+            if remaining_tokens is not None:
+                bucket.tpm_available = min(bucket.tpm_available, float(remaining_tokens))
+
+            if status_code == 429:
+                bucket.throttled_responses += 1
+                pause = parse_reset_duration(headers.get("retry-after")) or max(
+                    parse_reset_duration(headers.get("x-ratelimit-reset-requests")) or 0.0,
+                    parse_reset_duration(headers.get("x-ratelimit-reset-tokens")) or 0.0,
+                    1.0,
+                )
+                bucket.paused_until = max(bucket.paused_until, time.monotonic() + pause)
+                logger.warning(f"OpenAI returned 429 for {model or self.default_model}; pausing its traffic for {pause:.1f}s")
+
+    def _record_wait(self, waited: float) -> None:
+        # lock held
+        self._granted += 1
+        if waited > 0.001:
+            self._waited += 1
+        self._total_wait_seconds += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            by_priority = {p.name.lower(): 0 for p in RequestPriority}
+            models = {}
+            for model, bucket in self._buckets.items():
+                bucket.refill(now)
+                for priority, _ in bucket.waiting:
+                    by_priority[RequestPriority(priority).name.lower()] += 1
+                models[model] = {
+                    "queue_depth": len(bucket.waiting),
+                    "throttled_responses": bucket.throttled_responses,
+                    "rpm_limit": bucket.rpm_capacity,
+                    "tpm_limit": bucket.tpm_capacity,
+                    "rpm_available": round(bucket.rpm_available, 2),
+                    "tpm_available": round(bucket.tpm_available, 2),
+                    "paused_for_seconds": round(max(0.0, bucket.paused_until - now), 2),
+                }
+            return {
+                "queue_depth": sum(by_priority.values()),
+                "queue_depth_by_priority": by_priority,
+                "granted": self._granted,
+                "waited": self._waited,
+                "avg_wait_seconds": round(self._total_wait_seconds / self._granted, 4) if self._granted else 0.0,
+                "max_wait_seconds": round(self._max_wait_seconds, 4),
+                "throttled_responses": sum(m["throttled_responses"] for m in models.values()),
+                "models": models,
+            }
+
+
+# Singleton (per process) shared by every OpenAI call site
+openai_rate_limiter = OpenAIRateLimiter(
+    requests_per_minute=settings.openai_requests_per_minute,
+    tokens_per_minute=settings.openai_tokens_per_minute,
+    default_model=settings.openai_model,
+)
@@ -1,54 +1,92 @@
-from openai import OpenAI
 from config import settings
+import asyncio
 import logging
 import json
-import PyPDF2
 import docx
 import io
 from typing import Union
-from datetime import datetime
-import re
-
-from services.cv_prompt_message_builder import build_cv_extraction_messages
-
-def _normalize_date(date_str: str) -> str | None:
-    """Normalize various date formats to ISO YYYY-MM-DD or return None for invalid/ongoing dates."""
-    if not date_str:
-        return None
-    date_str = date_str.strip()
-    if date_str.lower() in ["present", "current"]:
-        return None
-
-    # Match formats like "January 2023", "Feb 2020", "2021", "2021-05"
-    month_year_match = re.match(r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})$', date_str, re.IGNORECASE)
-    year_month_match = re.match(r'^(\d{4})-(\d{1,2})$', date_str)
-    year_match = re.match(r'^(\d{4})$', date_str)
-
-    if month_year_match:
-        month_name, year = month_year_match.groups()
-        month_number = datetime.strptime(month_name[:3], "%b").month
-        return f"{year}-{month_number:02d}-01"
-    elif year_month_match:
-        year, month = year_month_match.groups()
-        return f"{year}-{int(month):02d}-01"
-    elif year_match:
-        year = year_match.group(1)
-        return f"{year}-01-01"
-
-    # Try parsing exact dates like "2023-01-15"
-    try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return dt.date().isoformat()
-    except Exception:
-        return None
-
+import time
+from functools import lru_cache
+
+from pydantic import BaseModel, ValidationError, create_model
+
+from core.resilience import PermanentError, openai_resilience
+from models.pydantic_models import CVExtractionResponse
+from services.cv_response_normalizer import normalize_cv_response
+from services.cv_prompt_message_builder import build_cv_extraction_messages, build_cv_section_messages
+from services.openai_client import get_async_openai_client
+from services.openai_rate_limiter import current_priority, estimate_message_tokens, openai_rate_limiter
+from services.openai_usage import openai_usage_tracker
+from services.request_hedging import HedgeAttempt, openai_request_hedger
+from services.pdf_text_extraction import extract_pdf_text, iter_pdf_page_text
+from services.resume_sections import SECTION_FIELDS, split_resume_sections
+from services.resume_text_compactor import compact_resume_text
 
 logger = logging.getLogger(__name__)
 
+
+def _strict_schema(schema):
+    """
+    Pydantic JSON schema -> structured-outputs strict schema: every object closed and every
+    property required (optional fields stay nullable, defaults are dropped).
+    """
+    if isinstance(schema, list):
+        return [_strict_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    strict = {}
+    for key, value in schema.items():
+        if key == "default":
+            continue
+        if key in ("properties", "$defs"):
+            strict[key] = {name: _strict_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = _strict_schema(value)
+    if strict.get("type") == "object" and "properties" in strict:
+        strict["additionalProperties"] = False
+        strict["required"] = list(strict["properties"])
+    return strict
+
+
+def strict_response_format(model: type[BaseModel]) -> dict:
+    """`response_format` enforcing `model`'s schema; a plain dict, so Batch API request bodies can carry it too."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "schema": _strict_schema(model.model_json_schema()), "strict": True},
+    }
+
+
+# Strict JSON schema derived from CVExtractionResponse (built once; it's ~9 KB)
+CV_EXTRACTION_RESPONSE_FORMAT = strict_response_format(CVExtractionResponse)
+
+
+def _fields_excluding(omit_fields: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(name for name in CVExtractionResponse.model_fields if name not in omit_fields)
+
+
+@lru_cache(maxsize=16)
+def _partial_response_format(name: str, fields: tuple[str, ...]) -> dict:
+    """Strict schema for a subset of CVExtractionResponse fields (sectioned extraction)."""
+    model = create_model(
+        name,
+        **{f: (CVExtractionResponse.model_fields[f].annotation, ...) for f in fields},
+    )
+    return strict_response_format(model)
+
 class OpenAIService:
     def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = settings.openai_model
+        # "structured" = schema-enforced outputs; "json_object" = legacy JSON mode + inline skeleton
+        self.output_mode = settings.cv_extraction_output_mode
+
+    @property
+    def use_structured_output(self) -> bool:
+        return self.output_mode == "structured"
+
+    @property
+    def client(self):
+        # Shared AsyncOpenAI client with a pooled keep-alive HTTP connection (per event loop)
+        return get_async_openai_client()
 
     def _extract_text_from_file(self, file_content: bytes, file_extension: str) -> str:
         """Extract text content from various file formats."""
@@ -66,34 +104,236 @@ class OpenAIService:
                     return file_content.decode('utf-8', errors='ignore')
         except Exception as e:
             logger.error(f"Error extracting text from {file_extension} file: {e}")
-            raise Exception(f"Unable to extract text from {file_extension} file: {e}")
+            raise PermanentError(f"Unable to extract text from {file_extension} file: {e}")
 
     def _extract_text_from_pdf(self, file_content: bytes) -> str:
         """Extract text from PDF file."""
         try:
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return extract_pdf_text(file_content)
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             raise
 
+    def _extract_pages_from_file(self, file_content: bytes, file_extension: str) -> list[str]:
+        """Extract text per page (PDF) or as a single page (other formats)."""
+        if file_extension.lower() == 'pdf':
+            try:
+                return list(iter_pdf_page_text(file_content))
+            except Exception as e:
+                logger.error(f"Error extracting text from PDF: {e}")
+                raise PermanentError(f"Unable to extract text from {file_extension} file: {e}")
+        return [self._extract_text_from_file(file_content, file_extension)]
+
+    def _prepare_resume_text(self, file_content: bytes, file_extension: str, request_id: str) -> str:
+        """Extract the resume text and, when enabled, compact it to the configured token budget."""
+        pages = self._extract_pages_from_file(file_content, file_extension)
+        if not settings.resume_compaction_enabled:
+            return "\n".join(pages).strip()
+        return compact_resume_text(pages, request_id=request_id).text
+
     def _extract_text_from_docx(self, file_content: bytes) -> str:
         """Extract text from DOCX file."""
         try:
             doc_file = io.BytesIO(file_content)
             doc = docx.Document(doc_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
         except Exception as e:
             logger.error(f"Error extracting text from DOCX: {e}")
             raise
 
+    async def prepare_resume_text(self, file_content: bytes, file_extension: str, request_id: str) -> str:
+        """Extract + compact the resume text off the event loop."""
+        # PDF/DOCX parsing and compaction are CPU-bound; keep them off the event loop
+        text_content = await asyncio.to_thread(self._prepare_resume_text, file_content, file_extension, request_id)
+
+        if not text_content.strip():
+            raise PermanentError("No text content could be extracted from the file")
+
+        logger.info(f"[{request_id}] Extracted {len(text_content)} characters from {file_extension} file")
+        return text_content
+
+    async def build_extraction_messages(
+        self,
+        file_content: bytes,
+        system_prompt_text: str | None,
+        scoring_prompt_text: str | None,
+        file_extension: str,
+        request_id: str,
+    ) -> list[dict]:
+        """Extract + compact the resume text and assemble the chat messages for it."""
+        text_content = await self.prepare_resume_text(file_content, file_extension, request_id)
+        return build_cv_extraction_messages(
+            system_prompt_text=system_prompt_text,
+            scoring_prompt_text=scoring_prompt_text,
+            resume_text=text_content,
+            request_id=request_id,
+            structured_output=self.use_structured_output,
+        )
+
+    def build_completion_params(
+        self, messages: list[dict], response_format: dict | None = None, model: str | None = None
+    ) -> dict:
+        """Chat Completions request body for CV extraction (shared by the live and Batch API paths)."""
+        if response_format is None:
+            response_format = CV_EXTRACTION_RESPONSE_FORMAT if self.use_structured_output else {"type": "json_object"}
+        return {
+            "model": model or self.model,
+            "messages": messages,
+            "response_format": response_format,
+            "temperature": 0.1,
+        }
+
+    async def _complete(
+        self,
+        messages: list[dict],
+        request_id: str,
+        response_format: dict | None = None,
+        operation: str = "cv_extraction",
+        model: str | None = None,
+    ) -> str:
+        """
+        One extraction call (hedged when enabled); returns the message content. Transient failures
+        are retried here, per call, so a sectioned extraction only repeats the call that failed.
+        """
+        model = model or self.model
+        return await openai_resilience.call_async(
+            openai_request_hedger.run,
+            f"{operation}:{model}",
+            lambda attempt: self._complete_once(messages, request_id, response_format, operation, model, attempt),
+            request_id=request_id,
+        )
+
+    async def _complete_once(
+        self,
+        messages: list[dict],
+        request_id: str,
+        response_format: dict | None,
+        operation: str,
+        model: str,
+        attempt: HedgeAttempt | None = None,
+    ) -> str:
+        """One rate-limited Chat Completions call at the caller's request_priority(); returns the message content."""
+        # Reserve prompt tokens + the output ceiling; reconciled with response.usage below
+        estimated_tokens = estimate_message_tokens(messages) + settings.max_output_tokens
+        async with openai_rate_limiter.limit(estimated_tokens, current_priority(), model) as permit:
+            if attempt is not None:
+                attempt.mark_sent()  # the hedger times the call from here, not from the limiter queue
+            started = time.perf_counter()
+            response = await self.client.chat.completions.create(
+                **self.build_completion_params(messages, response_format, model)
+            )
+            permit.record_usage(response.usage)
+        openai_usage_tracker.record(
+            operation, response.usage, latency_seconds=time.perf_counter() - started, request_id=request_id
+        )
+
+        message = response.choices[0].message
+        if getattr(message, "refusal", None):
+            raise PermanentError(f"OpenAI refused CV extraction: {message.refusal}")
+        return message.content
+
+    def _plan_sections(self, resume_text: str, request_id: str) -> dict[str, str]:
+        """Sections to extract by separate calls; empty = single-shot extraction."""
+        threshold = settings.cv_sectioned_extraction_min_chars
+        if not threshold or len(resume_text) < threshold:
+            return {}
+        sections = split_resume_sections(resume_text, min_section_chars=settings.cv_section_min_chars)
+        if not sections:
+            logger.info(f"[{request_id}] Long CV ({len(resume_text)} chars) but no sections detected; single-shot extraction")
+            return {}
+        logger.info(
+            f"[{request_id}] Long CV ({len(resume_text)} chars): sectioned extraction for "
+            + ", ".join(f"{key}={len(text)}" for key, text in sections.items())
+        )
+        return sections
+
+    async def _extract_sectioned(
+        self,
+        resume_text: str,
+        sections: dict[str, str],
+        system_prompt_text: str | None,
+        scoring_prompt_text: str | None,
+        request_id: str,
+        model: str | None = None,
+        repair: bool = True,
+    ) -> dict:
+        """
+        One call over the whole CV for profile/skills/scoring/summaries (section lists left empty)
+        plus one smaller call per detected section, all concurrent; results are merged and then
+        validated/normalized like a single-shot response.
+        """
+        omit_fields = tuple(f for key in sections for f in SECTION_FIELDS[key])
+        core_messages = build_cv_extraction_messages(
+            system_prompt_text=system_prompt_text,
+            scoring_prompt_text=scoring_prompt_text,
+            resume_text=resume_text,
+            request_id=request_id,
+            structured_output=self.use_structured_output,
+            omit_fields=omit_fields,
+        )
+        calls = [self._complete(
+            core_messages,
+            request_id,
+            _partial_response_format("CVExtractionCore", _fields_excluding(omit_fields)) if self.use_structured_output else None,
+            operation="cv_extraction_core",
+            model=model,
+        )]
+        for key, section_text in sections.items():
+            fields = SECTION_FIELDS[key]
+            section_messages = build_cv_section_messages(
+                system_prompt_text=system_prompt_text,
+                fields=fields,
+                section_text=section_text,
+                request_id=request_id,
+            )
+            calls.append(self._complete(
+                section_messages,
+                request_id,
+                _partial_response_format(f"CVSection{''.join(fields)}", fields) if self.use_structured_output else None,
+                operation="cv_extraction_section",
+                model=model,
+            ))
+
+        started = time.perf_counter()
+        tasks = [asyncio.ensure_future(call) for call in calls]
+        try:
+            core_text, *section_texts = await asyncio.gather(*tasks)
+        except BaseException:
+            # One call failed (after its own retries) or we were cancelled: stop paying for the others
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        merged = json.loads(core_text)
+        for key, section_text in zip(sections, section_texts):
+            part = json.loads(section_text)
+            for field_name in SECTION_FIELDS[key]:
+                merged[field_name] = part.get(field_name) or []
+        logger.info(
+            f"[{request_id}] Sectioned extraction finished: {len(calls)} concurrent calls in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+        return self.parse_completion_content(json.dumps(merged), request_id, repair=repair)
+
+    def parse_completion_content(self, response_text: str, request_id: str, repair: bool = True) -> dict:
+        """
+        Parse + normalize the model's JSON content.
+        With `repair=False` structured output that fails validation is returned as-is, so the
+        caller (model cascade) can reject it instead of accepting a repaired result.
+        """
+        if self.use_structured_output:
+            # Schema-enforced output already has the right shape/enums/types; validation replaces repair passes
+            try:
+                return CVExtractionResponse.model_validate_json(response_text).model_dump(mode="json")
+            except ValidationError as e:
+                if not repair:
+                    logger.warning(f"[{request_id}] Structured output failed validation: {e.error_count()} errors")
+                    return json.loads(response_text)
+                logger.warning(f"[{request_id}] Structured output failed validation, falling back to normalization: {e}")
+        extracted_data = json.loads(response_text)
+        # Normalize + enforce strict enums
+        return self._normalize_response_data(extracted_data, request_id)
+
     async def extract_cv_data(
         self,
         file_content: bytes,
@@ -101,41 +341,47 @@ class OpenAIService:
         scoring_prompt_text: str | None,
         file_extension: str,
         request_id: str = None,
+        model: str | None = None,
     ) -> dict:
         """Extract CV data using OpenAI with text content."""
+        if request_id is None:
+            request_id = "unknown"
+        resume_text = await self.prepare_resume_text(file_content, file_extension, request_id)
+        return await self.extract_cv_data_from_text(
+            resume_text, system_prompt_text, scoring_prompt_text, request_id=request_id, model=model
+        )
+
+    async def extract_cv_data_from_text(
+        self,
+        resume_text: str,
+        system_prompt_text: str | None,
+        scoring_prompt_text: str | None,
+        request_id: str = None,
+        model: str | None = None,
+        repair: bool = True,
+    ) -> dict:
+        """Extract CV data from already extracted resume text (`model` defaults to settings.openai_model)."""
         try:
             if request_id is None:
                 request_id = "unknown"
 
-            text_content = self._extract_text_from_file(file_content, file_extension)
-
-            if not text_content.strip():
-                raise Exception("No text content could be extracted from the file")
-
-            logger.info(f"[{request_id}] Extracted {len(text_content)} characters from {file_extension} file")
-
-            messages = build_cv_extraction_messages(
-                system_prompt_text=system_prompt_text,
-                scoring_prompt_text=scoring_prompt_text,
-                resume_text=text_content,
-                request_id=request_id,
-            )
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                response_format={"type": "json_object"},
-                temperature=0.1
-            )
-
-            response_text = response.choices[0].message.content
-            logger.info(f"[{request_id}] Successfully received response from OpenAI.")
-
-            # Parse the response
-            extracted_data = json.loads(response_text)
-
-            # Normalize + enforce strict enums
-            extracted_data = self._normalize_response_data(extracted_data, request_id)
+            sections = self._plan_sections(resume_text, request_id)
+            if sections:
+                extracted_data = await self._extract_sectioned(
+                    resume_text, sections, system_prompt_text, scoring_prompt_text, request_id,
+                    model=model, repair=repair,
+                )
+            else:
+                messages = build_cv_extraction_messages(
+                    system_prompt_text=system_prompt_text,
+                    scoring_prompt_text=scoring_prompt_text,
+                    resume_text=resume_text,
+                    request_id=request_id,
+                    structured_output=self.use_structured_output,
+                )
+                response_text = await self._complete(messages, request_id, model=model)
+                logger.info(f"[{request_id}] Successfully received response from OpenAI.")
+                extracted_data = self.parse_completion_content(response_text, request_id, repair=repair)
             logger.info(f"[{request_id}] CV data extracted successfully")
 
             return extracted_data
@@ -149,129 +395,7 @@ class OpenAIService:
 
     def _normalize_response_data(self, data: dict, request_id: str = None) -> dict:
         """Normalize response data and enforce strict enum values."""
-        try:
-            if request_id is None:
-                request_id = "unknown"
-
-            # 1. Handle UserProfile string to array conversions
-            if "UserProfile" in data and data["UserProfile"]:
-                user_profile = data["UserProfile"]
-                for field in ["JobTypePreferences", "RemotePreferences", "Roles"]:
-                    if field in user_profile and user_profile[field] is not None:
-                        if isinstance(user_profile[field], str):
-                            user_profile[field] = [user_profile[field].strip()]
-                        elif isinstance(user_profile[field], list):
-                            user_profile[field] = [item.strip() for item in user_profile[field] if item]
-
-            # 2. Ensure all array fields exist and are lists
-            array_fields = [
-                "Experience", "Education", "Skills", "ProjectsResearch",
-                "CertificationsLicenses", "AwardsAchievements", "VolunteerExtracurricular",
-                "Scoring", "Summaries", "KeyStrengths"
-            ]
-            for field in array_fields:
-                if field not in data or data[field] is None:
-                    data[field] = []
-
-            # 3. ENFORCE STRICT ENUM MAPPING
-            LEVEL_MAP = {
-                "Fluent": "Senior", "High": "Senior", "Proficient": "Senior",
-                "Advanced": "Senior", "Intermediate": "Mid", "Beginner": "Junior",
-                "Basic": "Junior", "Expert": "Expert", "Senior": "Senior",
-                "Mid": "Mid", "Junior": "Junior"
-            }
-            TYPE_MAP = {
-                "Positive": "Positives", "Negative": "Negatives",
-                "Positives": "Positives", "Negatives": "Negatives", "Overall": "Overall",
-                "Weakness": "Weaknesses", "Weaknesses": "Weaknesses"
-            }
-
-            for exp in data.get("Experience", []):
-                exp["StartDate"] = _normalize_date(exp.get("StartDate"))
-                exp["EndDate"] = _normalize_date(exp.get("EndDate"))
-
-            for edu in data.get("Education", []):
-                edu["StartDate"] = _normalize_date(edu.get("StartDate"))
-                edu["EndDate"] = _normalize_date(edu.get("EndDate"))
-
-            for cert in data.get("CertificationsLicenses", []):
-                cert["DateIssued"] = _normalize_date(cert.get("DateIssued"))
-                cert["ValidUntil"] = _normalize_date(cert.get("ValidUntil"))
-            
-            for award in data.get("AwardsAchievements", []):
-                year = award.get("Year")
-                if isinstance(year, str) and year.isdigit():
-                    award["Year"] = int(year)
-                elif isinstance(year, int):
-                    award["Year"] = year
-                else:
-                    award["Year"] = None
-            for vol in data.get("VolunteerExtracurricular", []):
-                vol["StartDate"] = _normalize_date(vol.get("StartDate"))
-                vol["EndDate"] = _normalize_date(vol.get("EndDate"))
-            
-            for skill in data.get("Skills", []):
-                years_exp = skill.get("YearsExperience")
-                if isinstance(years_exp, str):
-                    try:
-                        # Pydantic expects int; truncate floats safely (e.g. "3.5" -> 3)
-                        skill["YearsExperience"] = int(float(years_exp))
-                    except ValueError:
-                        skill["YearsExperience"] = None
-                elif isinstance(years_exp, (int, float)):
-                    skill["YearsExperience"] = int(years_exp)
-                else:
-                    skill["YearsExperience"] = None
-
-            # Normalize Scoring numeric fields + handle common key variants
-            if isinstance(data.get("Scoring"), list):
-                for item in data["Scoring"]:
-                    if not isinstance(item, dict):
-                        continue
-
-                    # Some models may emit YearsExperience instead of Years for scoring items
-                    if item.get("Years") is None and item.get("YearsExperience") is not None:
-                        item["Years"] = item.get("YearsExperience")
-
-                    for key in ("Score", "Years"):
-                        raw_val = item.get(key)
-                        if raw_val is None:
-                            continue
-                        try:
-                            if isinstance(raw_val, str):
-                                raw_val = raw_val.strip()
-                                if raw_val == "":
-                                    item[key] = None
-                                    continue
-                            item[key] = int(float(raw_val))
-                        except Exception:
-                            item[key] = None
-
-                    # Score must be 1-10, otherwise null
-                    score = item.get("Score")
-                    if isinstance(score, int) and (score < 1 or score > 10):
-                        item["Score"] = None
-
-            # Fix Scoring.Level
-            if isinstance(data.get("Scoring"), list):
-                for item in data["Scoring"]:
-                    if isinstance(item, dict) and "Level" in item:
-                        raw = str(item["Level"]).strip()
-                        item["Level"] = LEVEL_MAP.get(raw, "Junior")
-
-            # Fix Summaries.Type
-            if isinstance(data.get("Summaries"), list):
-                for item in data["Summaries"]:
-                    if isinstance(item, dict) and "Type" in item:
-                        raw = str(item["Type"]).strip()
-                        item["Type"] = TYPE_MAP.get(raw, "Overall")
-
-            logger.info(f"[{request_id}] Response data normalized successfully")
-            return data
-
-        except Exception as e:
-            logger.error(f"[{request_id}] Error normalizing response data: {e}")
-            return data  # Return original on failure (better than crashing)
+        return normalize_cv_response(data, request_id or "unknown")
 
 def get_openai_service() -> OpenAIService:
     """Get OpenAI service instance"""
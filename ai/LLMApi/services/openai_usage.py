@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+from threading import Lock
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _field(obj: Any, name: str) -> Any:
+    # SDK usage objects and raw Batch API JSON (dicts) carry the same fields
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def read_usage(usage: Any) -> tuple[int, int, int]:
+    """(prompt_tokens, cached_prompt_tokens, completion_tokens) for Chat Completions or Responses usage."""
+    prompt = _field(usage, "prompt_tokens")
+    if prompt is None:
+        prompt = _field(usage, "input_tokens")
+    completion = _field(usage, "completion_tokens")
+    if completion is None:
+        completion = _field(usage, "output_tokens")
+    details = _field(usage, "prompt_tokens_details") or _field(usage, "input_tokens_details")
+    cached = _field(details, "cached_tokens")
+    return int(prompt or 0), int(cached or 0), int(completion or 0)
+
+
+class OpenAIUsageTracker:
+    """
+    Per-operation token accounting, focused on provider-side prompt caching.
+
+    Prompts are laid out static-content-first (see services/cv_prompt_message_builder.py)
+    so consecutive requests share a cacheable prefix; `cached_tokens` from `response.usage`
+    shows how much of each prompt was billed at the cached rate, and latency is split by
+    cache hit/miss so the speed-up is visible too.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._ops: dict[str, dict[str, float]] = {}
+
+    def record(self, operation: str, usage: Any, *, latency_seconds: float | None = None, request_id: str = "unknown") -> None:
+        if usage is None:
+            return
+        prompt, cached, completion = read_usage(usage)
+        hit = cached > 0
+        with self._lock:
+            op = self._ops.setdefault(operation, {
+                "calls": 0, "cache_hits": 0, "prompt_tokens": 0, "cached_prompt_tokens": 0,
+                "completion_tokens": 0, "hit_latency_seconds": 0.0, "miss_latency_seconds": 0.0,
+                "timed_hits": 0, "timed_misses": 0,
+            })
+            op["calls"] += 1
+            op["cache_hits"] += int(hit)
+            op["prompt_tokens"] += prompt
+            op["cached_prompt_tokens"] += cached
+            op["completion_tokens"] += completion
+            if latency_seconds is not None:
+                op["hit_latency_seconds" if hit else "miss_latency_seconds"] += latency_seconds
+                op["timed_hits" if hit else "timed_misses"] += 1
+
+        cached_pct = round(100.0 * cached / prompt, 1) if prompt else 0.0
+        latency = f", latency={latency_seconds:.2f}s" if latency_seconds is not None else ""
+        logger.info(
+            f"[{request_id}] OpenAI {operation} usage: prompt={prompt} cached={cached} ({cached_pct}%) "
+            f"completion={completion}{latency}"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            ops = {name: dict(op) for name, op in self._ops.items()}
+        stats: dict[str, Any] = {}
+        for name, op in ops.items():
+            stats[name] = {
+                "calls": int(op["calls"]),
+                "cache_hits": int(op["cache_hits"]),
+                "prompt_tokens": int(op["prompt_tokens"]),
+                "cached_prompt_tokens": int(op["cached_prompt_tokens"]),
+                "completion_tokens": int(op["completion_tokens"]),
+                "cached_ratio": round(op["cached_prompt_tokens"] / op["prompt_tokens"], 4) if op["prompt_tokens"] else 0.0,
+                "avg_latency_hit_seconds": round(op["hit_latency_seconds"] / op["timed_hits"], 3) if op["timed_hits"] else None,
+                "avg_latency_miss_seconds": round(op["miss_latency_seconds"] / op["timed_misses"], 3) if op["timed_misses"] else None,
+            }
+        return stats
+
+
+# Singleton (per process)
+openai_usage_tracker = OpenAIUsageTracker()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Iterator
+
+import PyPDF2
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazily create one process pool per worker process (spawning per PDF costs more than it saves)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # spawn, not fork: the first caller may be a worker thread, and a forked child would
+            # inherit locks other threads hold at that moment (logging, SDK clients) and deadlock
+            _executor = ProcessPoolExecutor(
+                max_workers=max(1, settings.pdf_extraction_workers),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+class PdfPasswordProtectedError(ValueError):
+    """The PDF needs a user password to be read."""
+
+
+def _open_reader(file_content: bytes) -> PyPDF2.PdfReader:
+    """Reader for `file_content`; raises PdfReadError for a corrupt file and PdfPasswordProtectedError
+    for one that needs a password (PyPDF2 opens owner-password-only files itself)."""
+    reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    if reader.is_encrypted and not reader.decrypt(""):
+        raise PdfPasswordProtectedError("PDF is password protected")
+    return reader
+
+
+def _page_text(reader: PyPDF2.PdfReader, index: int) -> str:
+    # One damaged page costs its text, not the whole CV
+    try:
+        return reader.pages[index].extract_text() or ""
+    except Exception as e:
+        logger.warning(f"Could not extract text from PDF page {index + 1}: {e}")
+        return ""
+
+
+def _extract_page_range(file_content: bytes, start: int, stop: int) -> list[str]:
+    """Worker entry point: parse the PDF once and extract pages [start, stop)."""
+    reader = _open_reader(file_content)
+    return [_page_text(reader, i) for i in range(start, stop)]
+
+
+def _page_ranges(page_count: int, workers: int) -> list[tuple[int, int]]:
+    # ~2 chunks per worker keeps the pool busy while results stream back in order
+    chunk = max(4, -(-page_count // (workers * 2)))
+    return [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+
+
+def iter_pdf_page_text(
+    file_content: bytes,
+    *,
+    max_pages: int | None = None,
+    parallel_min_pages: int | None = None,
+    workers: int | None = None,
+) -> Iterator[str]:
+    """
+    Yield the text of each page in order.
+
+    Small documents are read serially in-process; documents with at least `parallel_min_pages`
+    pages are split into page ranges and fanned out to a process pool. If the pool fails, the
+    remaining pages are read serially.
+    """
+    max_pages = settings.pdf_max_pages if max_pages is None else max_pages
+    parallel_min_pages = settings.pdf_parallel_min_pages if parallel_min_pages is None else parallel_min_pages
+    workers = settings.pdf_extraction_workers if workers is None else workers
+
+    reader = _open_reader(file_content)
+    page_count = len(reader.pages)
+    if max_pages and page_count > max_pages:
+        logger.info(f"PDF has {page_count} pages; extracting first {max_pages}")
+        page_count = max_pages
+
+    if workers <= 1 or page_count < parallel_min_pages:
+        for i in range(page_count):
+            yield _page_text(reader, i)
+        return
+
+    ranges = _page_ranges(page_count, workers)
+    executor = _get_executor()
+    yielded = 0
+    futures = []
+    try:
+        for start, stop in ranges:
+            futures.append(executor.submit(_extract_page_range, file_content, start, stop))
+        for future in futures:
+            for page_text in future.result():
+                yielded += 1
+                yield page_text
+    except Exception as e:
+        logger.warning(f"PDF process pool failed after {yielded} pages, continuing serially: {e}")
+        for future in futures:
+            future.cancel()
+        if isinstance(e, BrokenProcessPool):
+            _reset_executor()
+        for i in range(yielded, page_count):
+            yield _page_text(reader, i)
+
+
+def extract_pdf_text(file_content: bytes, **kwargs) -> str:
+    """Extract the full document text, joined once at the end."""
+    return "".join(f"{page_text}\n" for page_text in iter_pdf_page_text(file_content, **kwargs)).strip()
@@ -8,6 +8,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from database import run_with_session
 from models.database import Prompt
 
 logger = logging.getLogger(__name__)
@@ -140,6 +141,23 @@ class PromptResolver:
         logger.warning(f"[{request_id}] Prompt not found; using default. (name={name}, category={category}, version={version})")
         return ResolvedPrompt(content=default_content, resolved_by="default", name=name, category=category, version=version)
 
+    async def resolve_async(
+        self,
+        prompt_ref: PromptRef,
+        *,
+        request_id: str,
+        default_content: str,
+        allow_latest: bool = True,
+    ) -> ResolvedPrompt:
+        """`resolve` with its own session on the DB executor (does not block the event loop)."""
+        return await run_with_session(
+            self.resolve,
+            prompt_ref,
+            request_id=request_id,
+            default_content=default_content,
+            allow_latest=allow_latest,
+        )
+
     def _get_latest(self, key: str) -> ResolvedPrompt | None:
         now = datetime.now(timezone.utc)
         with self._lock:
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from threading import Lock
+from typing import Any, Awaitable, Callable, TypeVar
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgeAttempt:
+    """
+    Handed to each factory() call. The factory calls `mark_sent()` when its request actually goes
+    out (after rate limiting), so queueing time neither feeds the latency window nor runs down
+    the hedge timer.
+    """
+
+    def __init__(self) -> None:
+        self.sent_at: float | None = None
+        self._sent = asyncio.Event()
+
+    def mark_sent(self) -> None:
+        if self.sent_at is None:
+            self.sent_at = time.perf_counter()
+            self._sent.set()
+
+    async def wait_sent(self) -> None:
+        await self._sent.wait()
+
+
+class RequestHedger:
+    """
+    Tail-latency hedging for idempotent calls.
+
+    If a call has not returned after the p-th percentile of recent latencies (tracked per
+    key, e.g. per extraction operation), an identical second call is started; the first
+    to succeed wins and the other is cancelled. Latencies and the hedge timer count from
+    the moment a call is sent (see HedgeAttempt). Hedges are capped per minute so a slow
+    dependency cannot double our spend.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        percentile: float,
+        min_samples: int,
+        window: int,
+        max_hedges_per_minute: int,
+    ) -> None:
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.max_hedges_per_minute = max_hedges_per_minute
+        self._lock = Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._hedge_times: deque[float] = deque()
+        self._stats = {"calls": 0, "fired": 0, "won": 0, "skipped_budget": 0}
+
+    # ---------- latency window ----------
+
+    def _record_latency(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def _record_sent_latency(self, key: str, attempt: HedgeAttempt) -> None:
+        # Factories that never mark their attempt sent contribute no samples (and are never hedged)
+        if attempt.sent_at is not None:
+            self._record_latency(key, time.perf_counter() - attempt.sent_at)
+
+    def hedge_delay(self, key: str) -> float | None:
+        """Seconds to wait before hedging, or None while there are too few samples."""
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(self.percentile / 100.0 * len(samples)) - 1))
+        return samples[index]
+
+    def _try_reserve_hedge(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            while self._hedge_times and now - self._hedge_times[0] >= 60.0:
+                self._hedge_times.popleft()
+            if len(self._hedge_times) >= self.max_hedges_per_minute:
+                self._stats["skipped_budget"] += 1
+                return False
+            self._hedge_times.append(now)
+            self._stats["fired"] += 1
+            return True
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    # ---------- public API ----------
+
+    async def run(self, key: str, factory: Callable[[HedgeAttempt], Awaitable[T]], request_id: str = "unknown") -> T:
+        """Await `factory(attempt)`, hedging with a second call when it runs past the percentile once sent."""
+        self._count("calls")
+        delay = self.hedge_delay(key) if self.enabled else None
+        primary_attempt = HedgeAttempt()
+        if delay is None:
+            result = await factory(primary_attempt)
+            self._record_sent_latency(key, primary_attempt)
+            return result
+
+        primary = asyncio.ensure_future(factory(primary_attempt))
+        tasks = [primary]
+        try:
+            # Nothing to hedge while the primary still waits for the rate limiter
+            sent = asyncio.ensure_future(primary_attempt.wait_sent())
+            tasks.append(sent)
+            await asyncio.wait({primary, sent}, return_when=asyncio.FIRST_COMPLETED)
+            sent.cancel()
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._try_reserve_hedge():
+                result = await primary
+                self._record_sent_latency(key, primary_attempt)
+                return result
+
+            logger.info(f"[{request_id}] {key} still running after p{self.percentile:g}={delay:.2f}s; sending hedged request")
+            hedge_attempt = HedgeAttempt()
+            hedge = asyncio.ensure_future(factory(hedge_attempt))
+            tasks.append(hedge)
+            pending = {primary, hedge}
+            last_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        continue
+                    if task is hedge:
+                        self._count("won")
+                        self._record_sent_latency(key, hedge_attempt)
+                        logger.info(f"[{request_id}] {key} hedged request won")
+                    else:
+                        self._record_sent_latency(key, primary_attempt)
+                    for other in pending:
+                        other.cancel()
+                    return task.result()
+            raise last_error  # both attempts failed
+        except BaseException:
+            # Failed or cancelled: neither request may keep running (and billing) on its own
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            keys = list(self._latencies)
+        stats["enabled"] = self.enabled
+        stats["hedge_after_seconds"] = {key: self.hedge_delay(key) for key in keys}
+        return stats
+
+
+# Singleton (per process) for CV extraction completions
+openai_request_hedger = RequestHedger(
+    enabled=settings.openai_hedging_enabled,
+    percentile=settings.openai_hedge_percentile,
+    min_samples=settings.openai_hedge_min_samples,
+    window=settings.openai_hedge_window,
+    max_hedges_per_minute=settings.openai_hedge_max_per_minute,
+)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+
+# Section key -> CVExtractionResponse list fields it is extracted into
+SECTION_FIELDS: dict[str, tuple[str, ...]] = {
+    "experience": ("Experience",),
+    "education": ("Education",),
+    "projects": ("ProjectsResearch",),
+}
+
+_MAX_HEADING_CHARS = 48
+_HEADING_PREFIX_RE = re.compile(r"^[\s#*\-–—•=_|:]+|[\s#*\-–—•=_|:]+$")
+# Order matters: the first matching pattern wins ("Research Experience" is a job history)
+_HEADING_PATTERNS: tuple[tuple[str | None, re.Pattern[str]], ...] = (
+    ("experience", re.compile(
+        r"^((professional|work|employment|relevant|industry|research|teaching|academic|career)\s+)?"
+        r"(experience|history|employment)$|^employment$|^career$|^appointments$|^positions( held)?$")),
+    ("education", re.compile(r"^(education(al)?( background| history)?|academic (background|history|qualifications)|qualifications|degrees)$")),
+    ("projects", re.compile(
+        r"^((selected|key|personal|academic|research)\s+)?(projects?|publications?|papers|research)$"
+        r"|^(conference|journal) (papers|publications)$|^publications and (talks|presentations)$")),
+    # Headings that close a tracked section; their text stays with the whole-CV extraction
+    (None, re.compile(
+        r"^((technical|core|key)\s+)?(skills|competencies)$|^certifications?( and licenses)?$|^licenses$"
+        r"|^(awards|honou?rs|achievements)( and (awards|honou?rs|achievements))?$|^volunteer(ing)?( experience| work)?$"
+        r"|^extracurricular( activities)?$|^languages$|^interests$|^hobbies$|^references$|^(professional )?summary$"
+        r"|^(personal )?profile$|^objective$|^contact( information| details)?$|^grants( and funding)?$")),
+)
+
+
+def _classify_heading(line: str) -> tuple[bool, str | None]:
+    """(is_heading, section key or None for a heading that ends the current section)."""
+    if not line or len(line) > _MAX_HEADING_CHARS:
+        return False, None
+    normalized = _HEADING_PREFIX_RE.sub("", line).replace("&", "and").lower()
+    normalized = re.sub(r"\s+", " ", normalized)
+    for key, pattern in _HEADING_PATTERNS:
+        if pattern.match(normalized):
+            return True, key
+    return False, None
+
+
+def split_resume_sections(text: str, *, min_section_chars: int = 0) -> dict[str, str]:
+    """
+    Split resume text into experience / education / projects sections by heading lines.
+    Returns section key -> text (several headings of one kind are concatenated); sections
+    shorter than `min_section_chars` are dropped and stay with the whole-CV call.
+    """
+    collected: dict[str, list[str]] = {}
+    current: str | None = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        is_heading, key = _classify_heading(line)
+        if is_heading:
+            current = key
+            continue
+        if current is not None:
+            collected.setdefault(current, []).append(raw)
+
+    sections: dict[str, str] = {}
+    for key, lines in collected.items():
+        body = "\n".join(lines).strip()
+        if body and len(body) >= min_section_chars:
+            sections[key] = body
+    return sections
+
+
+def count_section_headings(text: str) -> int:
+    """Number of recognised resume section headings (a cheap structure signal)."""
+    return sum(1 for raw in text.splitlines() if _classify_heading(raw.strip())[0])
+
+
+def has_section(text: str, key: str) -> bool:
+    return any(_classify_heading(raw.strip()) == (True, key) for raw in text.splitlines())
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Sequence
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Leading bullet glyphs PDF/DOCX exporters emit (•, ●, ▪, ■, ◦, ‣, ∙, ·, *, –, —, ►, ✓)
+_BULLET_RE = re.compile(r"^[•●▪■◦‣∙·*–—►✓]+\s*")
+_SPACE_RUN_RE = re.compile(r"[ \t  -​　]+")
+_DIGITS_RE = re.compile(r"\d+")
+# Email, phone number or profile URL: kept even when repeated in every page header
+_CONTACT_RE = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.-]+|\+?\d[\d\s().-]{6,}\d|https?://|www\.|linkedin\.com|github\.com",
+    re.IGNORECASE,
+)
+_HEADER_FOOTER_SCAN_LINES = 3
+_APPROX_CHARS_PER_TOKEN = 4
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+    truncated: bool
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.compacted_tokens
+
+
+@dataclass(frozen=True)
+class _Tokenizer:
+    count: Callable[[str], int]
+    truncate: Callable[[str, int], str]
+    name: str
+
+
+# Source files of the encodings tiktoken downloads; bundled under TIKTOKEN_CACHE_DIR by
+# scripts/fetch_tiktoken_encodings.py and stored under the SHA-1 of the URL (tiktoken's cache key)
+TIKTOKEN_ENCODING_URLS = {
+    "o200k_base": "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken",
+    "cl100k_base": "https://openaipublic.blob.core.windows.net/encodings/cl100k_base.tiktoken",
+}
+
+
+def bundled_encoding_path(encoding_name: str) -> str | None:
+    """Path tiktoken reads `encoding_name` from in the bundled cache (None for unknown encodings)."""
+    url = TIKTOKEN_ENCODING_URLS.get(encoding_name)
+    if url is None:
+        return None
+    return os.path.join(settings.tiktoken_cache_dir, hashlib.sha1(url.encode()).hexdigest())
+
+
+@lru_cache(maxsize=4)
+def get_tokenizer(encoding_name: str) -> _Tokenizer:
+    """
+    Local tokenizer (tiktoken) loaded from the bundled cache; falls back to a chars/4 estimate if
+    the encoding is unavailable. Never downloads: tiktoken fetches without a timeout, which would
+    stall a cold start without network access.
+    """
+    try:
+        path = bundled_encoding_path(encoding_name)
+        if path is not None and not os.path.exists(path):
+            raise FileNotFoundError(f"{path} missing (run scripts/fetch_tiktoken_encodings.py)")
+        os.environ["TIKTOKEN_CACHE_DIR"] = settings.tiktoken_cache_dir
+        import tiktoken
+
+        enc = tiktoken.get_encoding(encoding_name)
+        return _Tokenizer(
+            count=lambda text: len(enc.encode(text, disallowed_special=())),
+            truncate=lambda text, limit: enc.decode(enc.encode(text, disallowed_special=())[:limit]),
+            name=encoding_name,
+        )
+    except Exception as e:
+        logger.warning(f"Tokenizer '{encoding_name}' unavailable, estimating tokens from length: {e}")
+        return _Tokenizer(
+            count=lambda text: -(-len(text) // _APPROX_CHARS_PER_TOKEN),
+            truncate=lambda text, limit: text[: limit * _APPROX_CHARS_PER_TOKEN],
+            name="approx-chars/4",
+        )
+
+
+def _normalize_lines(page: str) -> list[str]:
+    lines = []
+    for raw in page.splitlines():
+        line = _SPACE_RUN_RE.sub(" ", raw).strip()
+        if line:
+            line = _BULLET_RE.sub("- ", line)
+        lines.append(line)
+    return lines
+
+
+def _edge_signature(line: str) -> str:
+    # Page numbers change per page ("Page 2 of 5"), so compare with digits masked
+    return _DIGITS_RE.sub("#", line.lower())
+
+
+def _repeated_edge_lines(pages: list[list[str]]) -> set[str]:
+    """Signatures of lines that recur in the first/last few lines of most pages."""
+    if len(pages) < 2:
+        return set()
+    counts: Counter[str] = Counter()
+    for lines in pages:
+        non_empty = [line for line in lines if line]
+        edges = non_empty[:_HEADER_FOOTER_SCAN_LINES] + non_empty[-_HEADER_FOOTER_SCAN_LINES:]
+        counts.update({_edge_signature(line) for line in edges})
+    threshold = max(2, -(-len(pages) * 6 // 10))  # seen on >= 60% of pages
+    return {sig for sig, n in counts.items() if n >= threshold}
+
+
+def _strip_edges(lines: list[str], repeated: set[str]) -> list[str]:
+    """Drop repeated header/footer lines from a page after the first; contact details always stay."""
+    if not repeated:
+        return lines
+    non_empty_idx = [i for i, line in enumerate(lines) if line]
+    edge_idx = set(non_empty_idx[:_HEADER_FOOTER_SCAN_LINES] + non_empty_idx[-_HEADER_FOOTER_SCAN_LINES:])
+    return [
+        line for i, line in enumerate(lines)
+        if not (i in edge_idx and _edge_signature(line) in repeated and not _CONTACT_RE.search(line))
+    ]
+
+
+def _join_lines(lines: list[str]) -> str:
+    # Collapse runs of blank lines to a single paragraph break
+    out: list[str] = []
+    for line in lines:
+        if not line and (not out or not out[-1]):
+            continue
+        out.append(line)
+    return "\n".join(out).strip()
+
+
+def compact_resume_text(
+    pages: Sequence[str],
+    *,
+    request_id: str = "unknown",
+    token_budget: int | None = None,
+    encoding_name: str | None = None,
+) -> CompactionResult:
+    """
+    Shrink extracted resume text before prompt building:
+    normalize whitespace and bullets, drop duplicate pages and headers/footers repeated on
+    later pages, then truncate to `token_budget` tokens (0 = no budget).
+    """
+    token_budget = settings.resume_token_budget if token_budget is None else token_budget
+    tokenizer = get_tokenizer(encoding_name or settings.resume_tokenizer_encoding)
+
+    original = "\n".join(pages).strip()
+    original_tokens = tokenizer.count(original)
+
+    normalized_pages: list[list[str]] = []
+    seen_pages: set[str] = set()
+    for page in pages:
+        lines = _normalize_lines(page)
+        key = "\n".join(line for line in lines if line)
+        if not key or key in seen_pages:
+            continue
+        seen_pages.add(key)
+        normalized_pages.append(lines)
+
+    repeated = _repeated_edge_lines(normalized_pages)
+    # The first page keeps its header: on a CV that is usually the candidate's name and contacts
+    text = "\n\n".join(
+        _join_lines(lines if n == 0 else _strip_edges(lines, repeated)) for n, lines in enumerate(normalized_pages)
+    ).strip()
+
+    compacted_tokens = tokenizer.count(text)
+    truncated = False
+    if token_budget and compacted_tokens > token_budget:
+        text = tokenizer.truncate(text, token_budget).rstrip()
+        compacted_tokens = tokenizer.count(text)
+        truncated = True
+
+    result = CompactionResult(
+        text=text,
+        original_tokens=original_tokens,
+        compacted_tokens=compacted_tokens,
+        truncated=truncated,
+    )
+    logger.info(
+        f"[{request_id}] Resume text compacted: {original_tokens} -> {compacted_tokens} tokens "
+        f"(saved {result.tokens_saved}, tokenizer={tokenizer.name}, truncated={truncated})"
+    )
+    return result
@@ -1,6 +1,7 @@
 from azure.servicebus.aio import ServiceBusClient
 from azure.servicebus import ServiceBusMessage
 from config import settings
+from core.resilience import servicebus_resilience
 import json
 import logging
 from typing import Dict, Any
@@ -15,15 +16,17 @@ class ServiceBusService:
     async def send_cv_processing_message(self, message_data: Dict[str, Any]) -> bool:
         """Send CV processing message to Service Bus queue"""
         try:
-            async with ServiceBusClient.from_connection_string(self.connection_string) as client:
-                sender = client.get_queue_sender(queue_name=self.queue_name)
-                async with sender:
-                    message = ServiceBusMessage(json.dumps(message_data))
-                    await sender.send_messages(message)
-                    logger.info(f"Message sent to queue: {message_data['fileId']}")
-                    return True
+            await servicebus_resilience.call_async(self._send, message_data)
+            logger.info(f"Message sent to queue: {message_data['fileId']}")
+            return True
         except Exception as e:
             logger.error(f"Error sending message to queue: {e}")
             return False
 
+    async def _send(self, message_data: Dict[str, Any]) -> None:
+        async with ServiceBusClient.from_connection_string(self.connection_string) as client:
+            sender = client.get_queue_sender(queue_name=self.queue_name)
+            async with sender:
+                await sender.send_messages(ServiceBusMessage(json.dumps(message_data)))
+
 service_bus = ServiceBusService()
@@ -0,0 +1,271 @@
+"""
+Compaction of soft-deleted extraction rows.
+
+Every CV run retires the profile's previous extraction (IsDeleted = 1), so the child tables
+keep growing. This job removes retired rows whose UpdatedAt (the time they were retired) is
+older than the retention window:
+- tables are walked in primary key order in small batches, each in its own transaction, so
+  locks stay row/page level (well below SQL Server's 5000-lock escalation threshold),
+- batches are separated by a pause and a run stops at its time budget,
+- progress (cutoff + last key per table) is checkpointed to a file after every batch, so the
+  next run continues the same pass. Without the checkpoint a run simply rescans from the start.
+In "archive" mode each batch is written to Blob Storage as JSON lines before it is deleted.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+import database
+from config import settings
+from core.resilience import sql_resilience
+from repositories.cv_extraction_repository import SOFT_DELETE_MODELS
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_FILE = "soft_delete_purge.checkpoint.json"
+
+
+@dataclass
+class PurgeReport:
+    cutoff: datetime
+    dry_run: bool = False
+    completed: bool = False
+    elapsed_seconds: float = 0.0
+    # table -> {"deleted", "archived", "batches"} (dry run: {"eligible"})
+    tables: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def rows_reclaimed(self) -> int:
+        return sum(counts.get("deleted", 0) for counts in self.tables.values())
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def blob_archiver(table_name: str, rows: List[Dict[str, Any]]) -> None:
+    """Write one batch to Blob Storage; raising keeps the batch from being deleted."""
+    from services.azure_storage import azure_storage
+
+    blob_path = (f"{settings.soft_delete_purge_archive_prefix}/{table_name}/"
+                 f"{datetime.utcnow():%Y/%m/%d}/{rows[0]['Id']}.jsonl")
+    content = "\n".join(json.dumps(dict(row), default=_json_default) for row in rows) + "\n"
+    if not azure_storage.upload_blob(blob_path, content.encode("utf-8")):
+        raise RuntimeError(f"Archiving {len(rows)} {table_name} rows to {blob_path} failed")
+
+
+class SoftDeletePurgeService:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        archiver: Callable[[str, List[Dict[str, Any]]], None] | None = None,
+        work_dir: str | None = None,
+        models=SOFT_DELETE_MODELS,
+    ) -> None:
+        self._session_factory = session_factory
+        self.archiver = archiver or blob_archiver
+        self.work_dir = work_dir or settings.soft_delete_purge_work_dir or os.path.join(tempfile.gettempdir(), "soft_delete_purge")
+        self.models = models
+        self._lock = Lock()
+        self._stats = {"runs": 0, "completed_passes": 0, "batches": 0, "rows_deleted": 0, "rows_archived": 0, "last_run": None}
+
+    def _session(self) -> Session:
+        return (self._session_factory or database.SessionLocal)()
+
+    # ---------- run ----------
+
+    def run(
+        self,
+        retention_days: int | None = None,
+        batch_size: int | None = None,
+        pause_seconds: float | None = None,
+        max_seconds: float | None = None,
+        archive: bool | None = None,
+        dry_run: bool = False,
+    ) -> PurgeReport:
+        """
+        Purge (or with dry_run, count) retired rows older than the retention window. Resumes the
+        checkpointed pass if there is one; a pass interrupted by `max_seconds` is continued by the next run.
+        """
+        retention_days = settings.soft_delete_purge_retention_days if retention_days is None else retention_days
+        batch_size = batch_size or settings.soft_delete_purge_batch_size
+        pause_seconds = settings.soft_delete_purge_pause_ms / 1000.0 if pause_seconds is None else pause_seconds
+        max_seconds = settings.soft_delete_purge_max_run_seconds if max_seconds is None else max_seconds
+        archive = settings.soft_delete_purge_mode == "archive" if archive is None else archive
+
+        started = time.monotonic()
+        if dry_run:
+            report = PurgeReport(cutoff=datetime.utcnow() - timedelta(days=retention_days), dry_run=True)
+            report.tables = self.count_eligible(report.cutoff)
+            report.completed = True
+            report.elapsed_seconds = round(time.monotonic() - started, 2)
+            return report
+
+        checkpoint = self._read_checkpoint()
+        if checkpoint is None:
+            checkpoint = {
+                "cutoff": (datetime.utcnow() - timedelta(days=retention_days)).isoformat(),
+                "tables": {model.__tablename__: {"after_id": None, "done": False} for model in self.models},
+            }
+        else:
+            logger.info(f"Resuming soft-delete purge pass (cutoff {checkpoint['cutoff']})")
+        report = PurgeReport(cutoff=datetime.fromisoformat(checkpoint["cutoff"]))
+
+        deadline = started + max_seconds if max_seconds else None
+        out_of_time = False
+        for model in self.models:
+            name = model.__tablename__
+            progress = checkpoint["tables"].setdefault(name, {"after_id": None, "done": False})
+            counts = report.tables.setdefault(name, {"deleted": 0, "archived": 0, "batches": 0})
+            while not progress["done"]:
+                if deadline is not None and time.monotonic() >= deadline:
+                    out_of_time = True
+                    break
+                after_id = uuid.UUID(progress["after_id"]) if progress["after_id"] else None
+                deleted, archived, last_id = sql_resilience.call(
+                    self._purge_batch, model, report.cutoff, after_id, batch_size, archive, request_id=f"purge:{name}"
+                )
+                if last_id is None:
+                    progress["done"] = True
+                else:
+                    progress["after_id"] = str(last_id)
+                    counts["deleted"] += deleted
+                    counts["archived"] += archived
+                    counts["batches"] += 1
+                self._write_checkpoint(checkpoint)
+                if last_id is not None and pause_seconds:
+                    time.sleep(pause_seconds)
+            if out_of_time:
+                break
+
+        report.completed = all(progress["done"] for progress in checkpoint["tables"].values())
+        if report.completed:
+            self._clear_checkpoint()
+        report.elapsed_seconds = round(time.monotonic() - started, 2)
+        self._record(report)
+        logger.info(
+            f"Soft-delete purge {'finished pass' if report.completed else 'paused'} in {report.elapsed_seconds}s: "
+            f"{report.rows_reclaimed} rows reclaimed "
+            + ", ".join(f"{name}={counts['deleted']}" for name, counts in report.tables.items() if counts["deleted"])
+        )
+        return report
+
+    def _purge_batch(self, model, cutoff: datetime, after_id: Optional[uuid.UUID], batch_size: int,
+                     archive: bool, request_id: str = "-") -> tuple[int, int, Optional[uuid.UUID]]:
+        """One keyed batch in its own transaction. Returns (deleted, archived, last key scanned)."""
+        table = model.__table__
+        query = (
+            select(*(table.columns if archive else (table.c.Id,)))
+            .where(table.c.IsDeleted == True, table.c.UpdatedAt < cutoff)
+            .order_by(table.c.Id)
+            .limit(batch_size)
+        )
+        if after_id is not None:
+            query = query.where(table.c.Id > after_id)
+
+        db = self._session()
+        try:
+            rows = db.execute(query).mappings().all()
+            if not rows:
+                return 0, 0, None
+            ids = [row["Id"] for row in rows]
+            archived = 0
+            if archive:
+                self.archiver(table.name, rows)
+                archived = len(rows)
+            deleted = db.execute(
+                delete(table)
+                .where(table.c.Id.in_(ids), table.c.IsDeleted == True)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            return max(deleted or 0, 0), archived, ids[-1]
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def count_eligible(self, cutoff: datetime) -> Dict[str, Dict[str, int]]:
+        db = self._session()
+        try:
+            return {
+                model.__tablename__: {"eligible": db.execute(
+                    select(func.count()).select_from(model.__table__)
+                    .where(model.IsDeleted == True, model.UpdatedAt < cutoff)
+                ).scalar_one()}
+                for model in self.models
+            }
+        finally:
+            db.close()
+
+    # ---------- checkpoint ----------
+
+    def _checkpoint_path(self) -> str:
+        return os.path.join(self.work_dir, _CHECKPOINT_FILE)
+
+    def _read_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._checkpoint_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable purge checkpoint: {e}")
+            return None
+
+    def _write_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        os.makedirs(self.work_dir, exist_ok=True)
+        path = self._checkpoint_path()
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(path + ".tmp", path)
+
+    def _clear_checkpoint(self) -> None:
+        try:
+            os.remove(self._checkpoint_path())
+        except FileNotFoundError:
+            pass
+
+    def reset(self) -> None:
+        """Drop the checkpoint so the next run starts a new pass with a fresh cutoff."""
+        self._clear_checkpoint()
+
+    # ---------- stats ----------
+
+    def _record(self, report: PurgeReport) -> None:
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["completed_passes"] += int(report.completed)
+            self._stats["batches"] += sum(counts["batches"] for counts in report.tables.values())
+            self._stats["rows_deleted"] += report.rows_reclaimed
+            self._stats["rows_archived"] += sum(counts["archived"] for counts in report.tables.values())
+            self._stats["last_run"] = {
+                "cutoff": report.cutoff.isoformat(),
+                "completed": report.completed,
+                "elapsed_seconds": report.elapsed_seconds,
+                "deleted": {name: counts["deleted"] for name, counts in report.tables.items()},
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats)
+
+
+soft_delete_purge = SoftDeletePurgeService()
@@ -15,6 +15,8 @@ if not exist ".venv\Scripts\activate.bat" (
     call .venv\Scripts\activate.bat
     python -m pip install --upgrade pip
     python -m pip install -r requirements.txt
+    echo Bundling tokenizer encodings...
+    python -m scripts.fetch_tiktoken_encodings
 ) else (
     REM Verify venv Python version matches .python-version
     for /f "tokens=*" %%i in ('.venv\Scripts\python.exe --version') do set VENV_VERSION=%%i
@@ -15,6 +15,8 @@ if (-not (Test-Path ".venv\Scripts\Activate.ps1")) {
     . .venv\Scripts\Activate.ps1
     python -m pip install --upgrade pip
     python -m pip install -r requirements.txt
+    Write-Host "Bundling tokenizer encodings..." -ForegroundColor Yellow
+    python -m scripts.fetch_tiktoken_encodings
 } else {
     # Verify venv Python version
     $venvVersion = .venv\Scripts\python.exe --version
@@ -0,0 +1,30 @@
+"""
+Shared fixtures. Database tests run on the SQLite double (scripts/sqlite_double.py), so no
+ODBC driver, SQL Server or Azure credentials are needed.
+
+Run from ai/LLMApi:
+    python -m pytest -q
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy.orm import Session
+
+from models.database import Prompt
+from scripts.sqlite_double import CV_TABLES, create_sqlite_engine
+
+
+@pytest.fixture
+def engine():
+    engine = create_sqlite_engine(tables=[*CV_TABLES, Prompt.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
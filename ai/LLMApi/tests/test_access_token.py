@@ -0,0 +1,144 @@
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from core.access_token import AccessTokenProvider, odbc_token_struct
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Credential:
+    """Issues token-1, token-2, ... valid for `lifetime` seconds; scripted exceptions are raised instead."""
+
+    def __init__(self, clock: _Clock, lifetime: float = 3600.0, delay: float = 0.0):
+        self.clock = clock
+        self.lifetime = lifetime
+        self.delay = delay
+        self.failures: list[Exception] = []
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_token(self, scope):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+            failure = self.failures.pop(0) if self.failures else None
+        time.sleep(self.delay)
+        if failure is not None:
+            raise failure
+        return SimpleNamespace(token=f"token-{call}", expires_on=self.clock() + self.lifetime)
+
+
+def _provider(clock: _Clock, credential: _Credential) -> AccessTokenProvider:
+    return AccessTokenProvider(
+        "scope", credential=credential, refresh_margin_seconds=300, min_validity_seconds=60, clock=clock,
+    )
+
+
+def _wait_for_refresh(provider: AccessTokenProvider) -> None:
+    deadline = time.monotonic() + 2.0
+    while provider._refreshing:
+        assert time.monotonic() < deadline, "background refresh did not finish"
+        time.sleep(0.005)
+
+
+def test_token_is_cached_until_the_refresh_window():
+    clock = _Clock()
+    credential = _Credential(clock)
+    provider = _provider(clock, credential)
+
+    assert provider.get_token() == "token-1"
+    clock.now += 3000  # 600 s left: outside the 300 s refresh margin
+    assert provider.get_token() == "token-1"
+
+    assert credential.calls == 1
+    stats = provider.get_stats()
+    assert (stats["requests"], stats["cache_hits"], stats["fetches"]) == (2, 1, 1)
+    assert stats["expires_in_seconds"] == 600
+
+
+def test_token_is_refreshed_in_the_background_before_it_expires():
+    clock = _Clock()
+    credential = _Credential(clock, delay=0.05)
+    provider = _provider(clock, credential)
+    provider.get_token()
+
+    clock.now += 3400  # 200 s left: inside the refresh margin, still usable
+    assert provider.get_token() == "token-1"  # served from cache while the refresh runs
+    _wait_for_refresh(provider)
+
+    assert provider.get_token() == "token-2"
+    assert credential.calls == 2
+    assert provider.get_stats()["background_refreshes"] == 1
+
+
+def test_nearly_expired_token_is_fetched_synchronously():
+    clock = _Clock()
+    credential = _Credential(clock)
+    provider = _provider(clock, credential)
+    provider.get_token()
+
+    clock.now += 3570  # 30 s left: below the minimum validity
+    assert provider.get_token() == "token-2"
+    assert provider.get_stats()["background_refreshes"] == 0
+
+
+def test_failed_refresh_keeps_the_cached_token_and_is_retried():
+    clock = _Clock()
+    credential = _Credential(clock)
+    provider = _provider(clock, credential)
+    provider.get_token()
+
+    credential.failures.append(RuntimeError("IMDS unavailable"))
+    clock.now += 3400
+    assert provider.get_token() == "token-1"
+    _wait_for_refresh(provider)
+    assert provider.get_token() == "token-1"  # still valid; this call starts the next refresh
+    _wait_for_refresh(provider)
+
+    assert provider.get_token() == "token-3"
+    assert provider.get_stats()["fetch_failures"] == 1
+
+
+def test_fetch_failure_without_a_usable_token_is_raised():
+    clock = _Clock()
+    credential = _Credential(clock)
+    credential.failures.append(RuntimeError("IMDS unavailable"))
+    provider = _provider(clock, credential)
+
+    with pytest.raises(RuntimeError):
+        provider.get_token()
+    assert provider.get_token() == "token-2"
+
+
+def test_concurrent_callers_share_a_single_fetch():
+    clock = _Clock()
+    credential = _Credential(clock, delay=0.05)
+    provider = _provider(clock, credential)
+    start = threading.Barrier(8)
+
+    def get_token():
+        start.wait()
+        return provider.get_token()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(lambda _: get_token(), range(8)))
+
+    assert tokens == ["token-1"] * 8
+    assert credential.calls == 1
+
+
+def test_odbc_token_struct_is_length_prefixed_utf16():
+    packed = odbc_token_struct("abc")
+    assert struct.unpack("=i", packed[:4]) == (6,)
+    assert packed[4:].decode("utf-16-le") == "abc"
@@ -0,0 +1,107 @@
+import uuid
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.sql.dml import Insert, Update
+
+from database import audit_columns, audit_context, bulk_insert
+from models.database import Prompt, Skill
+
+
+def _skill(db, name: str) -> Skill:
+    skill = Skill(Id=uuid.uuid4(), UserProfileId=uuid.uuid4(), SkillName=name)
+    db.add(skill)
+    db.commit()
+    return skill
+
+
+def test_audit_columns_are_resolved_per_mapper_and_table():
+    assert audit_columns(Skill) == (("CreatedBy", "UpdatedBy"), ("UpdatedBy",))
+    assert audit_columns(Skill.__table__) == audit_columns(Skill)
+    assert audit_columns(Prompt) == ((), ())
+
+
+def test_orm_inserts_and_updates_are_stamped(db):
+    with audit_context("creator"):
+        skill = _skill(db, "Python")
+    assert (skill.CreatedBy, skill.UpdatedBy) == ("creator", "creator")
+
+    with audit_context("editor"):
+        skill.Proficiency = "Expert"
+        db.commit()
+    assert (skill.CreatedBy, skill.UpdatedBy) == ("creator", "editor")
+
+
+def test_bulk_insert_is_stamped_and_keeps_explicit_values(db):
+    user_id = uuid.uuid4()
+    with audit_context("importer"):
+        bulk_insert(db, Skill, [
+            {"UserProfileId": user_id, "SkillName": "Python"},
+            {"UserProfileId": user_id, "SkillName": "SQL", "CreatedBy": "migration"},
+        ])
+        db.commit()
+
+    rows = db.execute(select(Skill.SkillName, Skill.CreatedBy, Skill.UpdatedBy).order_by(Skill.SkillName)).all()
+    assert rows == [("Python", "importer", "importer"), ("SQL", "migration", "importer")]
+
+
+def test_core_updates_are_stamped(db):
+    python, sql = _skill(db, "Python"), _skill(db, "SQL")
+
+    with audit_context("entity-update"):
+        db.execute(update(Skill).where(Skill.Id == python.Id).values(Proficiency="Expert"))
+    with audit_context("table-update"):
+        db.execute(update(Skill.__table__).where(Skill.__table__.c.Id == sql.Id).values(Proficiency="Mid"))
+    with audit_context("ignored"):
+        db.execute(update(Skill).where(Skill.Id == sql.Id).values(Category="Data", UpdatedBy="explicit"))
+    db.commit()
+
+    rows = dict(db.execute(select(Skill.SkillName, Skill.UpdatedBy)).all())
+    assert rows == {"Python": "entity-update", "SQL": "explicit"}
+
+
+def test_core_insert_keeps_values_set_on_the_statement(db):
+    with audit_context("importer"):
+        db.execute(insert(Skill).values(UserProfileId=uuid.uuid4(), SkillName="Go", CreatedBy="migration"))
+        db.commit()
+
+    assert db.execute(select(Skill.CreatedBy, Skill.UpdatedBy)).one() == ("migration", "importer")
+
+
+def test_statements_without_audit_columns_are_left_alone(db):
+    with audit_context("editor"):
+        db.add(Prompt(Name="cv_extraction", Version=1, Category="cv_extraction", Content="Extract the CV"))
+        db.commit()
+        db.execute(update(Prompt).where(Prompt.Name == "cv_extraction").values(Content="Extract"))
+        db.commit()
+
+    assert db.execute(select(Prompt.Content)).scalar_one() == "Extract"
+
+
+def test_values_set_by_ordered_or_multi_row_values_are_kept(db):
+    skill = _skill(db, "Python")
+    with audit_context("importer"):
+        db.execute(insert(Skill).values([
+            {"UserProfileId": uuid.uuid4(), "SkillName": name, "CreatedBy": "migration", "UpdatedBy": "migration"}
+            for name in ("Go", "Rust")
+        ]))
+        db.execute(update(Skill).where(Skill.Id == skill.Id).ordered_values((Skill.UpdatedBy, "explicit")))
+        db.commit()
+
+    rows = db.execute(select(Skill.SkillName, Skill.CreatedBy, Skill.UpdatedBy).order_by(Skill.SkillName)).all()
+    assert rows == [
+        ("Go", "migration", "migration"), ("Python", "system", "explicit"), ("Rust", "migration", "migration"),
+    ]
+
+
+def test_stamping_does_not_compile_the_statement(db, monkeypatch):
+    def compile(*args, **kwargs):
+        raise AssertionError("statement compiled outside the execution cache")
+
+    monkeypatch.setattr(Insert, "compile", compile)
+    monkeypatch.setattr(Update, "compile", compile)
+    with audit_context("editor"):
+        db.execute(insert(Skill).values(UserProfileId=uuid.uuid4(), SkillName="Go"))
+        db.execute(update(Skill).where(Skill.SkillName == "Go").values(Proficiency="Mid"))
+        db.commit()
+
+    assert db.execute(select(Skill.CreatedBy, Skill.UpdatedBy)).one() == ("editor", "editor")
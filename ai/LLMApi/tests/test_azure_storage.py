@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+
+from azure.core.exceptions import ServiceRequestError
+
+from core.resilience import CircuitBreaker, ResilientDependency, RetryBudget, RetryPolicy
+from core.startup import LazyComponent
+from services import azure_storage as azure_storage_module
+from services.azure_storage import azure_storage
+
+
+class _FakeBlobClient:
+    def __init__(self, service):
+        self.service = service
+
+    def download_blob(self):
+        self.service.calls.append(threading.get_ident())
+        time.sleep(0.05)  # blocking SDK I/O
+        if self.service.failures:
+            self.service.failures -= 1
+            raise ServiceRequestError("connection reset")
+        return self
+
+    def readall(self):
+        return b"%PDF"
+
+    def upload_blob(self, content, overwrite=False):
+        self.service.calls.append(threading.get_ident())
+        self.service.uploaded.append(content)
+
+
+class _FakeBlobService:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+        self.uploaded = []
+
+    def get_blob_client(self, container, blob):
+        return _FakeBlobClient(self)
+
+
+def _use(monkeypatch, service):
+    monkeypatch.setattr(azure_storage, "_client", LazyComponent("blob_storage", lambda: service))
+    monkeypatch.setattr(azure_storage_module, "blob_resilience", ResilientDependency(
+        "blob_storage",
+        RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.02),
+        CircuitBreaker(5, 60.0),
+        RetryBudget(ratio=1.0, min_per_minute=100),
+    ))
+
+
+def test_async_download_retries_off_the_event_loop(monkeypatch):
+    service = _FakeBlobService(failures=1)
+    _use(monkeypatch, service)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        content = await azure_storage.download_file_async("users/u/f.pdf")
+        ticking.cancel()
+        return content, ticks, threading.get_ident()
+
+    content, ticks, loop_thread = asyncio.run(main())
+    assert content == b"%PDF"
+    assert len(service.calls) == 2
+    assert loop_thread not in service.calls
+    assert ticks >= 10  # the loop kept running through both 50 ms calls and the backoff
+
+
+def test_async_json_upload_returns_the_generated_path(monkeypatch):
+    service = _FakeBlobService()
+    _use(monkeypatch, service)
+
+    folder_path, file_name, success = asyncio.run(
+        azure_storage.upload_json_response_async({"name": "Ada"}, "user-1", "file-1")
+    )
+    assert success
+    assert file_name.endswith(".json")
+    assert b'"name": "Ada"' in service.uploaded[0]
@@ -0,0 +1,101 @@
+import uuid
+
+from sqlalchemy import event, func, select
+
+from azure_functions.cv_processor import CVProcessor
+from config import settings
+from database import bulk_insert, column_keys, insertable_columns, normalize_row
+from models.database import Education, Experience, Scoring, Skill
+from models.pydantic_models import CVExtractionResponse
+
+
+def _count_statements(engine) -> list[tuple[str, bool]]:
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement.split()[0].upper(), executemany))
+
+    return statements
+
+
+def test_column_keys_lists_mapped_columns_only():
+    keys = column_keys(Skill)
+
+    assert {"Id", "UserProfileId", "SkillName", "Category", "IsDeleted"} <= keys
+    assert "UserProfile" not in keys  # relationship
+
+
+def test_insertable_columns_leave_out_server_defaults_and_audit_fields():
+    columns = insertable_columns(Skill)
+
+    assert {"UserProfileId", "SkillName", "Category", "Proficiency", "YearsExperience"} <= set(columns)
+    assert not {"Id", "CreatedAt", "UpdatedAt", "CreatedBy", "UpdatedBy", "IsDeleted"} & set(columns)
+    assert normalize_row(Skill, {"SkillName": "Go", "Bogus": 1}) == {
+        column: ("Go" if column == "SkillName" else None) for column in columns
+    }
+
+
+def test_bulk_insert_sends_one_batch_per_key_set(engine, db):
+    user_id = uuid.uuid4()
+    statements = _count_statements(engine)
+
+    inserted = bulk_insert(db, Skill, [
+        {"UserProfileId": user_id, "SkillName": name, "Category": "Technical"} for name in ("Python", "SQL", "Go")
+    ])
+    db.commit()
+
+    assert inserted == 3
+    assert statements == [("INSERT", True)]
+    rows = db.execute(select(Skill.SkillName, Skill.IsDeleted).order_by(Skill.SkillName)).all()
+    assert rows == [("Go", False), ("Python", False), ("SQL", False)]
+
+
+def test_bulk_insert_without_rows_executes_nothing(engine, db):
+    statements = _count_statements(engine)
+
+    assert bulk_insert(db, Skill, []) == 0
+    assert statements == []
+
+
+def test_save_extracted_data_inserts_each_table_in_one_batch(engine, db, monkeypatch):
+    monkeypatch.setattr(settings, "cv_persistence_mode", "replace")
+    user_id, evaluation_id = uuid.uuid4(), uuid.uuid4()
+    # Items fill different optional fields: the rows must still share one key set per table
+    cv = CVExtractionResponse.model_validate({
+        "UserProfile": {},
+        "Candidate": {},
+        "Experience": [
+            {"Title": "Engineer", "Organization": "Acme", "Location": "Berlin"},
+            {"Title": "Intern", "Organization": "Initech", "StartDate": "2019-06-01"},
+            {"Title": "Contractor"},
+        ],
+        "Education": [{"Degree": "BSc", "Institution": "Example University"}],
+        "Skills": [
+            {"SkillName": "Python", "Proficiency": "Expert"},
+            {"SkillName": "SQL", "YearsExperience": 3},
+            {"SkillName": "Go", "Category": "Technical", "Unit": "years"},
+            {},
+        ],
+        "Scoring": [
+            {"Category": "Python", "FixedCategory": "Technical", "Score": 8},
+            {"Category": "Teamwork", "FixedCategory": "Soft"},
+        ],
+    })
+    statements = _count_statements(engine)
+
+    CVProcessor()._save_extracted_data(db, str(user_id), cv, str(evaluation_id), "test")
+    db.commit()
+
+    inserts = [(verb, executemany) for verb, executemany in statements if verb == "INSERT"]
+    # Experience, Education, Skills, Scorings; empty items are skipped, empty tables send nothing
+    assert inserts == [("INSERT", True), ("INSERT", False), ("INSERT", True), ("INSERT", True)]
+    assert db.scalar(select(func.count()).select_from(Experience)) == 3
+    assert db.scalar(select(func.count()).select_from(Education)) == 1
+    skills = db.execute(select(Skill.SkillName, Skill.Proficiency, Skill.YearsExperience, Skill.IsDeleted)
+                        .order_by(Skill.SkillName)).all()
+    assert skills == [("Go", None, None, False), ("Python", "Expert", None, False), ("SQL", None, 3, False)]
+    # UserProfileId is not a Scoring column: rows are linked through the evaluation instead
+    assert db.execute(select(Scoring.CvEvaluationId, Scoring.Score).order_by(Scoring.Category)).all() == [
+        (evaluation_id, 8), (evaluation_id, None),
+    ]
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import uuid
+
+from sqlalchemy import select
+
+from azure_functions.cv_processor import CVProcessor
+from config import settings
+from models.database import Candidate, CvEvaluation, File, Skill
+from services import cv_batch_service
+from services.cv_batch_service import CvBatchService, InMemoryBatchClient
+
+
+def _seed_candidate(db, name: str) -> tuple[uuid.UUID, uuid.UUID]:
+    user_id, file_id = uuid.uuid4(), uuid.uuid4()
+    db.add(File(Id=file_id, Container="cvfiles", FolderPath=f"users/{user_id}", FilePath=f"{name}.txt",
+                Extension="txt", MbSize=0))
+    db.add(Candidate(CandidateId=name, UserId=user_id, CvFileId=file_id))
+    db.commit()
+    return user_id, file_id
+
+
+def _completion(skill: str) -> str:
+    return json.dumps({
+        "UserProfile": {"Name": "Ada Lovelace"},
+        "Candidate": {},
+        "Skills": [{"SkillName": skill, "Category": "Technical"}],
+        "Summaries": [{"Type": "Overall", "Text": "Strong analytical background"}],
+    })
+
+
+def test_submit_poll_ingest(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "resume_compaction_enabled", False)
+    downloads = []
+
+    async def download_file_async(blob_path):
+        downloads.append(blob_path)
+        return b"Ada Lovelace\nSkills\nPython, analysis"
+
+    monkeypatch.setattr(cv_batch_service.azure_storage, "download_file_async", download_file_async)
+
+    _, ok_file = _seed_candidate(db, "ok")
+    _, failed_file = _seed_candidate(db, "failed")
+
+    def responder(custom_id, body):
+        assert body["model"] == settings.openai_model
+        if custom_id == str(failed_file):
+            raise RuntimeError("model unavailable")
+        return _completion("Python")
+
+    client = InMemoryBatchClient(responder, polls_until_complete=2)
+    service = CvBatchService(CVProcessor(), client=client, work_dir=str(tmp_path))
+
+    async def run():
+        jobs = await asyncio.to_thread(service.find_pending_jobs, db, 10)
+        assert {job["fileId"] for job in jobs} == {str(ok_file), str(failed_file)}
+        batch = await service.submit(db, jobs)
+        completed = await service.wait(batch.id, poll_interval_seconds=0.01)
+        assert completed.status == "completed"
+        return await service.ingest(db, completed)
+
+    report = asyncio.run(run())
+
+    assert (report.succeeded, report.failed) == (1, 1)
+    assert "model unavailable" in report.errors[str(failed_file)]
+    # Each CV is downloaded once, to build the request; ingestion reuses the manifest
+    assert len(downloads) == 2
+
+    evaluation = db.execute(select(CvEvaluation).where(CvEvaluation.FileId == ok_file)).scalar_one()
+    assert evaluation.ModelUsed == settings.openai_model
+    assert evaluation.PromptCategory == "cv_extraction"
+    assert db.execute(select(Skill.SkillName).where(Skill.IsDeleted == False)).scalars().all() == ["Python"]
+    # The processed CV is no longer pending; the failed one still is
+    assert [job["fileId"] for job in service.find_pending_jobs(db, 10)] == [str(failed_file)]
@@ -0,0 +1,131 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from database import audit_context, bulk_insert, normalize_row
+from models.database import Education, Scoring, Skill
+from repositories.cv_extraction_repository import CvExtractionRepository
+
+
+def _seed(db, user_id, evaluation_id):
+    bulk_insert(db, Skill, [{"UserProfileId": user_id, "SkillName": name} for name in ("Python", "SQL")])
+    bulk_insert(db, Education, [{"UserProfileId": user_id, "Degree": "BSc", "Institution": "Example University"}])
+    bulk_insert(db, Scoring, [{"CvEvaluationId": evaluation_id, "Category": "Python", "FixedCategory": "Technical"}])
+    db.commit()
+
+
+def test_retire_soft_deletes_the_profile_rows_and_clears_scorings(db):
+    user_id, other_user, evaluation_id, other_evaluation = (uuid.uuid4() for _ in range(4))
+    _seed(db, user_id, evaluation_id)
+    _seed(db, other_user, other_evaluation)
+    repository = CvExtractionRepository()
+
+    with audit_context("cv-worker"):
+        counts = repository.retire_previous_extraction(db, str(user_id), str(evaluation_id))
+    db.commit()
+
+    assert counts["Skills"] == 2
+    assert counts["Educations"] == 1
+    assert counts["Experiences"] == 0
+    assert counts["Scorings"] == 1
+    skills = db.execute(select(Skill.UserProfileId, Skill.IsDeleted, Skill.UpdatedBy)).all()
+    assert {(uid, deleted) for uid, deleted, _ in skills} == {(user_id, True), (other_user, False)}
+    assert {updated_by for uid, _, updated_by in skills if uid == user_id} == {"cv-worker"}
+    assert db.execute(select(Scoring.CvEvaluationId)).scalars().all() == [other_evaluation]
+
+
+def test_retire_skips_rows_that_are_already_deleted(db):
+    user_id, evaluation_id = uuid.uuid4(), uuid.uuid4()
+    _seed(db, user_id, evaluation_id)
+    repository = CvExtractionRepository()
+
+    repository.retire_previous_extraction(db, str(user_id), str(evaluation_id))
+    counts = repository.retire_previous_extraction(db, str(user_id), str(evaluation_id))
+
+    assert sum(counts.values()) == 0
+    stats = repository.get_stats()["retire_previous_extraction"]
+    assert (stats["calls"], stats["rows"]) == (2, 4)
+
+
+def test_reconcile_applies_only_the_differences(db):
+    user_id, evaluation_id = uuid.uuid4(), uuid.uuid4()
+    with audit_context("first-run"):
+        bulk_insert(db, Skill, [
+            {"UserProfileId": user_id, "SkillName": "Python", "Proficiency": "Expert"},
+            {"UserProfileId": user_id, "SkillName": "SQL", "Proficiency": "Mid"},
+            {"UserProfileId": user_id, "SkillName": "Perl", "Proficiency": "Junior"},
+        ])
+        bulk_insert(db, Scoring, [{"CvEvaluationId": evaluation_id, "Category": "Old", "FixedCategory": "Technical"}])
+        db.commit()
+    ids_before = dict(db.execute(select(Skill.SkillName, Skill.Id)).all())
+    repository = CvExtractionRepository()
+
+    with audit_context("second-run"):
+        report = repository.reconcile_extraction(db, str(user_id), str(evaluation_id), {
+            Skill: [
+                normalize_row(Skill, {"UserProfileId": user_id, "SkillName": "Python", "Proficiency": "Expert"}),
+                # Natural key match ignores case and whitespace
+                normalize_row(Skill, {"UserProfileId": user_id, "SkillName": " sql ", "Proficiency": "Senior"}),
+                normalize_row(Skill, {"UserProfileId": user_id, "SkillName": "Go", "Proficiency": "Mid"}),
+            ],
+            Scoring: [normalize_row(Scoring, {"CvEvaluationId": evaluation_id, "Category": "New", "FixedCategory": "Technical"})],
+        })
+    db.commit()
+
+    assert report["Skills"] == {"inserted": 1, "updated": 1, "retired": 1, "unchanged": 1}
+    assert report["Scorings"] == {"inserted": 1, "updated": 0, "retired": 1, "unchanged": 0}
+    skills = {row.Id: row for row in db.execute(select(Skill)).scalars()}
+    python, sql, perl = (skills[ids_before[name]] for name in ("Python", "SQL", "Perl"))
+    # Unchanged row keeps its audit fields; matched rows keep their Id
+    assert (python.Proficiency, python.UpdatedBy) == ("Expert", "first-run")
+    assert (sql.SkillName, sql.Proficiency, sql.UpdatedBy) == (" sql ", "Senior", "second-run")
+    assert perl.IsDeleted is True
+    (go,) = (row for row in skills.values() if row.Id not in ids_before.values())
+    assert (go.SkillName, go.IsDeleted, go.CreatedBy) == ("Go", False, "second-run")
+    assert db.execute(select(Scoring.Category)).scalars().all() == ["New"]
+
+    stats = repository.get_stats()["reconcile_extraction"]
+    assert (stats["calls"], stats["inserted"], stats["updated"], stats["retired"], stats["unchanged"]) == (1, 2, 1, 2, 1)
+
+
+def test_reconcile_clears_values_that_are_now_empty(db):
+    user_id = uuid.uuid4()
+    bulk_insert(db, Education, [{
+        "UserProfileId": user_id, "Degree": "BSc", "Institution": "Example University", "FieldOfStudy": "Physics",
+    }])
+    db.commit()
+
+    report = CvExtractionRepository().reconcile_extraction(db, str(user_id), str(uuid.uuid4()), {
+        # FieldOfStudy was not extracted this time: normalize_row sets it to None
+        Education: [normalize_row(Education, {"UserProfileId": user_id, "Degree": "BSc", "Institution": "Example University"})],
+    })
+    db.commit()
+
+    assert report["Educations"]["updated"] == 1
+    assert db.execute(select(Education.FieldOfStudy, Education.IsDeleted)).all() == [(None, False)]
+
+
+def test_reconcile_keeps_duplicate_items(db):
+    user_id = uuid.uuid4()
+    bulk_insert(db, Skill, [{"UserProfileId": user_id, "SkillName": "Python"}])
+    db.commit()
+
+    report = CvExtractionRepository().reconcile_extraction(db, str(user_id), str(uuid.uuid4()), {
+        Skill: [normalize_row(Skill, {"UserProfileId": user_id, "SkillName": name}) for name in ("Python", "python")],
+    })
+
+    assert report["Skills"] == {"inserted": 1, "updated": 0, "retired": 0, "unchanged": 1}
+
+
+def test_reconcile_rejects_rows_without_the_full_column_set(db):
+    user_id = uuid.uuid4()
+    bulk_insert(db, Skill, [{"UserProfileId": user_id, "SkillName": "Python", "Proficiency": "Expert"}])
+    db.commit()
+
+    # A missing column is ambiguous (not extracted vs. not compared), so it is refused instead of cleared
+    with pytest.raises(ValueError, match="normalize_row"):
+        CvExtractionRepository().reconcile_extraction(db, str(user_id), str(uuid.uuid4()), {
+            Skill: [{"UserProfileId": user_id, "SkillName": "Python"}],
+        })
+    assert db.execute(select(Skill.Proficiency)).scalars().all() == ["Expert"]
@@ -0,0 +1,135 @@
+import os
+import stat
+
+import pytest
+
+from config import settings
+from services import extraction_cache as cache_module
+from services.extraction_cache import CacheStats, ExtractionCache, FileSystemCacheBackend
+from services.prompt_resolver import ResolvedPrompt
+
+SYSTEM = ResolvedPrompt(content="Extract the CV", resolved_by="db:name+version", name="cv_extraction", version=3)
+SCORING = ResolvedPrompt(content="Score the CV", resolved_by="default", name="cv_scoring")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+def _backend(directory, **limits) -> FileSystemCacheBackend:
+    options = dict(max_entries=100, max_bytes=1024 * 1024, ttl_seconds=0, stats=CacheStats())
+    options.update(limits)
+    return FileSystemCacheBackend(str(directory), **options)
+
+
+def test_key_covers_file_prompts_model_and_pipeline():
+    cache = ExtractionCache(None, enabled=False)
+    base = cache.build_key(b"cv", SYSTEM, SCORING, "gpt-4o", pipeline="v=1")
+    bumped = ResolvedPrompt(content="Extract the CV", resolved_by="db:name+version", name="cv_extraction", version=4)
+    edited_default = ResolvedPrompt(content="Score the CV strictly", resolved_by="default", name="cv_scoring")
+
+    variants = [
+        cache.build_key(b"other cv", SYSTEM, SCORING, "gpt-4o", pipeline="v=1"),
+        cache.build_key(b"cv", bumped, SCORING, "gpt-4o", pipeline="v=1"),
+        cache.build_key(b"cv", SYSTEM, edited_default, "gpt-4o", pipeline="v=1"),
+        cache.build_key(b"cv", SYSTEM, SCORING, "gpt-4o-mini", pipeline="v=1"),
+        cache.build_key(b"cv", SYSTEM, SCORING, "gpt-4o", pipeline="v=2"),
+    ]
+
+    assert cache.build_key(b"cv", SYSTEM, SCORING, "gpt-4o", pipeline="v=1") == base
+    assert len({base, *variants}) == 6
+
+
+def test_default_pipeline_fingerprint_follows_the_settings(monkeypatch):
+    cache = ExtractionCache(None, enabled=False)
+    before = cache.build_key(b"cv", SYSTEM, SCORING, "gpt-4o")
+
+    monkeypatch.setattr(settings, "resume_compaction_enabled", not settings.resume_compaction_enabled)
+
+    assert cache.build_key(b"cv", SYSTEM, SCORING, "gpt-4o") != before
+
+
+def test_round_trip_and_stats(tmp_path):
+    stats = CacheStats()
+    cache = ExtractionCache(_backend(tmp_path, stats=stats), stats=stats)
+
+    assert cache.get("k1") is None
+    cache.put("k1", {"UserProfile": {"Name": "Ada"}})
+
+    assert cache.get("k1") == {"UserProfile": {"Name": "Ada"}}
+    assert cache.get_stats() == {
+        "enabled": True, "hits": 1, "misses": 1, "hit_rate": 0.5, "stores": 1, "evictions": 0, "expirations": 0,
+    }
+
+
+def test_directory_is_private(tmp_path):
+    directory = tmp_path / "cache"
+    backend = _backend(directory)
+
+    backend.put("k1", {"a": 1})
+
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+
+def test_least_recently_used_entries_are_evicted_by_count(tmp_path, clock):
+    backend = _backend(tmp_path, max_entries=2)
+    backend.put("a", {"n": 1})
+    backend.put("b", {"n": 2})
+    backend.get("a")
+
+    backend.put("c", {"n": 3})
+
+    assert backend.get("b") is None
+    assert backend.get("a") == {"n": 1} and backend.get("c") == {"n": 3}
+    assert not os.path.exists(tmp_path / "b.json")
+    assert backend._stats.evictions == 1
+
+
+def test_entries_are_evicted_by_size(tmp_path, clock):
+    backend = _backend(tmp_path, max_bytes=250)
+    for key in ("a", "b", "c"):
+        backend.put(key, {"text": "x" * 100})
+
+    assert backend.get("a") is None
+    assert backend.get("b") is not None and backend.get("c") is not None
+
+
+def test_expired_entries_are_misses(tmp_path, clock):
+    backend = _backend(tmp_path, ttl_seconds=60)
+    backend.put("a", {"n": 1})
+
+    assert backend.get("a") == {"n": 1}
+    clock.now += 120
+    assert backend.get("a") is None
+    assert backend._stats.expirations == 1
+    assert not os.path.exists(tmp_path / "a.json")
+
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    _backend(tmp_path).put("a", {"n": 1})
+
+    assert _backend(tmp_path).get("a") == {"n": 1}
+
+
+def test_enabled_without_a_directory_disables_the_cache(monkeypatch):
+    monkeypatch.setattr(settings, "extraction_cache_enabled", True)
+    monkeypatch.setattr(settings, "extraction_cache_dir", "")
+
+    cache = cache_module._build_default_cache()
+
+    assert not cache.enabled
+    assert cache.get("k1") is None
+    cache.put("k1", {"n": 1})
+    assert cache.get_stats()["stores"] == 0
@@ -0,0 +1,137 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, insert, select, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.types import Uuid
+
+from models.database import Interview
+from repositories import interview_repository as interview_repository_module
+from repositories.interview_repository import InterviewRepository
+
+_BASE_URL = "https://recruiter.example.com/api/candidate/ai-interview/conversations/conv_"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def interviews(engine, monkeypatch):
+    """Interviews table on the SQLite double (ConversationId computed by the T-SQL shims).
+
+    JobApplicationSteps is not mapped here, so the table is copied next to a stub FK target and
+    written through Core; the repository reads it through the Interview model as usual.
+    """
+    metadata = MetaData()
+    Table("JobApplicationSteps", metadata, Column("Id", Uuid, primary_key=True))
+    table = Interview.__table__.to_metadata(metadata)
+    table.create(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(interview_repository_module, "SessionLocal", factory)
+
+    def add(transcript_url, created_at=None, deleted=False) -> uuid.UUID:
+        interview_id = uuid.uuid4()
+        with engine.begin() as connection:
+            connection.execute(insert(table).values(
+                Id=interview_id, JobApplicationStepId=uuid.uuid4(), TranscriptUrl=transcript_url,
+                InterviewConfigurationName="default", InterviewConfigurationVersion="1",
+                InstructionPromptName="instructions", InstructionPromptVersion="1",
+                PersonalityPromptName="personality", PersonalityPromptVersion="1",
+                QuestionsPromptName="questions", QuestionsPromptVersion="1",
+                CreatedAt=created_at or datetime(2026, 1, 1), IsDeleted=deleted,
+            ))
+        return interview_id
+
+    def delete(interview_id) -> None:
+        with engine.begin() as connection:
+            connection.execute(update(table).where(table.c.Id == interview_id).values(IsDeleted=True))
+
+    add.session, add.delete = factory, delete
+    return add
+
+
+@pytest.mark.parametrize("transcript_url, conversation_id", [
+    (_BASE_URL + "abc123", "abc123"),
+    (_BASE_URL + "abc123/transcript", "abc123"),
+    (_BASE_URL + "abc123?download=1", "abc123"),
+    (_BASE_URL + "abc123#summary", "abc123"),
+    ("https://recruiter.example.com/api/candidate/ai-interview/other", None),
+    (None, None),
+])
+def test_conversation_id_is_cut_at_the_next_path_or_query_delimiter(interviews, transcript_url, conversation_id):
+    interview_id = interviews(transcript_url)
+    with interviews.session() as db:
+        assert db.execute(select(Interview.ConversationId).where(Interview.Id == interview_id)).scalar() == conversation_id
+
+
+def test_lookup_skips_deleted_interviews_and_picks_the_newest(interviews):
+    interviews(_BASE_URL + "abc", created_at=datetime(2026, 1, 1))
+    newest = interviews(_BASE_URL + "abc/transcript", created_at=datetime(2026, 2, 1))
+    interviews(_BASE_URL + "abc", created_at=datetime(2026, 3, 1), deleted=True)
+
+    repository = InterviewRepository(cache_size=10)
+    assert repository.get_id_by_conv_id("abc") == newest
+    assert repository.get_id_by_conv_id("unknown") is None
+
+
+def test_cache_hits_misses_and_evictions(monkeypatch):
+    ids = {conv_id: uuid.uuid4() for conv_id in ("a", "b", "c")}
+    queried = []
+
+    def lookup(conv_id):
+        queried.append(conv_id)
+        return ids.get(conv_id)
+
+    repository = InterviewRepository(cache_size=2, ttl_seconds=60)
+    monkeypatch.setattr(repository, "_get_id_by_conv_id", lookup)
+
+    assert repository.get_id_by_conv_id("a") == ids["a"]
+    assert repository.get_id_by_conv_id("b") == ids["b"]
+    assert repository.get_id_by_conv_id("a") == ids["a"]  # hit, "a" becomes most recent
+    assert repository.get_id_by_conv_id("c") == ids["c"]  # evicts "b"
+    assert asyncio.run(repository.get_id_by_conv_id_async("b")) == ids["b"]
+    assert repository.get_id_by_conv_id("missing") is None
+    assert repository.get_id_by_conv_id("missing") is None  # misses are not cached
+
+    assert queried == ["a", "b", "c", "b", "missing", "missing"]
+    stats = repository.get_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 6, 2, 2)
+
+
+def test_cached_ids_expire_and_can_be_invalidated(monkeypatch):
+    clock = _Clock()
+    queried = []
+    repository = InterviewRepository(cache_size=10, ttl_seconds=60, clock=clock)
+    monkeypatch.setattr(repository, "_get_id_by_conv_id", lambda conv_id: queried.append(conv_id) or uuid.uuid4())
+
+    first = repository.get_id_by_conv_id("a")
+    clock.now = 59
+    assert repository.get_id_by_conv_id("a") == first
+    clock.now = 60
+    assert repository.get_id_by_conv_id("a") != first
+    repository.invalidate("a")
+    repository.get_id_by_conv_id("a")
+
+    assert len(queried) == 3
+    stats = repository.get_stats()
+    assert (stats["hits"], stats["expired"], stats["invalidations"]) == (1, 1, 1)
+
+
+def test_deleted_interview_is_dropped_from_the_cache(interviews):
+    original = interviews(_BASE_URL + "abc")
+    repository = InterviewRepository(cache_size=10, ttl_seconds=3600)
+    assert repository.get_by_conv_id("abc").Id == original
+
+    interviews.delete(original)
+    replacement = interviews(_BASE_URL + "abc", created_at=datetime(2026, 1, 1) + timedelta(days=1))
+
+    assert repository.get_by_conv_id("abc").Id == replacement
+    assert asyncio.run(repository.get_by_conv_id_async("abc")).Id == replacement
+    assert repository.get_stats()["invalidations"] == 1
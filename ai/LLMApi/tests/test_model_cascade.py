@@ -0,0 +1,105 @@
+from services.model_cascade import ModelCascade
+
+SIMPLE_RESUME = """Jane Doe
+jane@example.com
+
+Experience
+Backend Engineer, Acme (2019 - 2024)
+
+Education
+BSc Computer Science, Example University
+"""
+
+
+def _cascade(**overrides) -> ModelCascade:
+    options = dict(enabled=True, cascade_model="gpt-4o-mini", main_model="gpt-4o", max_chars=8000, min_headings=2)
+    options.update(overrides)
+    return ModelCascade(**options)
+
+
+def _result(**overrides) -> dict:
+    result = {
+        "UserProfile": {"Name": "Jane Doe"},
+        "Candidate": {},
+        "Experience": [{"Title": "Backend Engineer", "Organization": "Acme"}],
+        "Education": [{"Degree": "BSc", "Institution": "Example University"}],
+        "Scoring": [{"Category": "Python", "Score": 8}],
+        "Summaries": [{"Type": "Overall", "Text": "Solid backend engineer"}],
+        "KeyStrengths": [{"StrengthName": "APIs"}],
+    }
+    result.update(overrides)
+    return result
+
+
+def test_simple_resume_goes_to_the_cascade_model():
+    cascade = _cascade()
+
+    assert cascade.route(SIMPLE_RESUME) == "gpt-4o-mini"
+    assert cascade.get_stats()["routed_cascade"] == 1
+
+
+def test_long_or_unstructured_resumes_go_to_the_main_model():
+    cascade = _cascade(max_chars=50)
+
+    assert cascade.route(SIMPLE_RESUME) == "gpt-4o"
+    assert _cascade().route("Jane Doe, backend engineer at Acme since 2019.") == "gpt-4o"
+
+
+def test_disabled_cascade_always_uses_the_main_model():
+    for cascade in (_cascade(enabled=False), _cascade(cascade_model="gpt-4o"), _cascade(cascade_model="")):
+        assert not cascade.enabled
+        assert cascade.route(SIMPLE_RESUME) == "gpt-4o"
+        assert cascade.cache_model_key == "gpt-4o"
+
+
+def test_cache_model_key_covers_the_routing_setup():
+    keys = {
+        _cascade().cache_model_key,
+        _cascade(max_chars=4000).cache_model_key,
+        _cascade(min_headings=3).cache_model_key,
+        _cascade(cascade_model="gpt-4.1-mini").cache_model_key,
+    }
+
+    assert len(keys) == 4
+    assert "gpt-4o" not in keys
+
+
+def test_complete_result_has_no_quality_issues():
+    assert _cascade().quality_issues(_result(), SIMPLE_RESUME) == []
+
+
+def test_quality_issues_flag_missing_content():
+    issues = _cascade().quality_issues(
+        _result(UserProfile={"Name": " "}, Experience=[], Education=[], Summaries=[], Scoring=[{"Category": "Python"}]),
+        SIMPLE_RESUME,
+    )
+
+    assert set(issues) == {
+        "no candidate name",
+        "no Summaries",
+        "Experience section present but nothing extracted",
+        "Education section present but nothing extracted",
+        "Scoring entries without Score",
+    }
+
+
+def test_empty_sections_are_fine_when_the_resume_has_none():
+    text = "Jane Doe\n\nSkills\nPython\n\nLanguages\nEnglish\n"
+
+    assert _cascade().quality_issues(_result(Experience=[], Education=[]), text) == []
+
+
+def test_invalid_result_fails_validation():
+    issues = _cascade().quality_issues(_result(Scoring=[{"Score": 42}]), SIMPLE_RESUME)
+
+    assert len(issues) == 1 and issues[0].startswith("validation failed")
+
+
+def test_outcomes_are_counted():
+    cascade = _cascade()
+    cascade.record_outcome(True)
+    cascade.record_outcome(False)
+    cascade.record_outcome(False)
+
+    stats = cascade.get_stats()
+    assert (stats["accepted"], stats["escalated"]) == (1, 2)
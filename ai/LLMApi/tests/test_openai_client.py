@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from config import settings
+from services import openai_client
+from services.openai_client import aclose_async_openai_client, close_async_openai_clients, get_async_openai_client
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+
+
+def test_one_client_per_loop_closed_when_the_loop_shuts_down():
+    async def main():
+        client = get_async_openai_client()
+        assert get_async_openai_client() is client
+        return client
+
+    first = asyncio.run(main())
+    second = asyncio.run(main())
+
+    assert first is not second
+    assert first._client.is_closed and second._client.is_closed
+    assert len(openai_client._clients) == 0
+
+
+def test_aclose_closes_the_running_loops_client():
+    async def main():
+        client = get_async_openai_client()
+        await aclose_async_openai_client()
+        assert client._client.is_closed
+        # A later call opens a fresh client
+        replacement = get_async_openai_client()
+        assert replacement is not client and not replacement._client.is_closed
+
+    asyncio.run(main())
+
+
+def test_clients_of_idle_loops_are_closed_at_exit():
+    async def get_client():
+        return get_async_openai_client()
+
+    # A worker-thread loop that is kept open between messages
+    loop = asyncio.new_event_loop()
+    try:
+        client = loop.run_until_complete(get_client())
+        close_async_openai_clients()
+
+        assert client._client.is_closed
+        assert len(openai_client._clients) == 0
+    finally:
+        loop.close()
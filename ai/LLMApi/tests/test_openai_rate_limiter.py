@@ -0,0 +1,164 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from services import openai_client
+from services.openai_rate_limiter import (
+    OpenAIRateLimiter,
+    RequestPriority,
+    current_priority,
+    parse_reset_duration,
+    request_priority,
+)
+
+
+def _limiter(rpm: int = 100, tpm: int = 10_000) -> OpenAIRateLimiter:
+    return OpenAIRateLimiter(requests_per_minute=rpm, tokens_per_minute=tpm, default_model="gpt-4o")
+
+
+def _tpm_available(limiter: OpenAIRateLimiter, model: str = "gpt-4o") -> float:
+    return limiter.get_stats()["models"][model]["tpm_available"]
+
+
+@pytest.mark.parametrize("value, seconds", [("1s", 1.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m", 3720.0), ("2.5", 2.5)])
+def test_parse_reset_duration(value, seconds):
+    assert parse_reset_duration(value) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize("value", [None, "", "soon"])
+def test_parse_reset_duration_without_a_duration(value):
+    assert parse_reset_duration(value) is None
+
+
+def test_usage_reconciles_the_reservation():
+    limiter = _limiter()
+
+    async def call():
+        async with limiter.limit(3000) as permit:
+            permit.record_usage(SimpleNamespace(total_tokens=1000))
+
+    asyncio.run(call())
+    assert _tpm_available(limiter) == pytest.approx(9000, abs=5)
+
+
+def test_reservation_is_refunded_when_the_call_fails():
+    limiter = _limiter()
+
+    async def call():
+        async with limiter.limit(3000):
+            raise RuntimeError("HTTP 500")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(call())
+    stats = limiter.get_stats()["models"]["gpt-4o"]
+    assert stats["tpm_available"] == pytest.approx(10_000, abs=5)
+    # The request itself still counts
+    assert stats["rpm_available"] == pytest.approx(99, abs=0.1)
+
+
+def test_reservation_is_refunded_when_the_call_is_cancelled():
+    limiter = _limiter()
+
+    async def main():
+        async def call():
+            async with limiter.limit(3000):
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0.01)
+        assert _tpm_available(limiter) == pytest.approx(7000, abs=5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert _tpm_available(limiter) == pytest.approx(10_000, abs=5)
+
+
+def test_interactive_waiters_are_served_before_background_ones():
+    limiter = _limiter(rpm=6000, tpm=6000)  # 100 tokens per second
+    order = []
+
+    async def main():
+        await limiter.acquire(6000)  # drain the bucket
+
+        async def call(name, priority):
+            async with limiter.limit(50, priority) as permit:
+                permit.record_usage(SimpleNamespace(total_tokens=50))
+                order.append(name)
+
+        background = [asyncio.create_task(call(f"background-{i}", RequestPriority.BACKGROUND)) for i in range(2)]
+        await asyncio.sleep(0.05)
+        interactive = asyncio.create_task(call("interactive", RequestPriority.INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+
+    asyncio.run(main())
+    assert order[0] == "interactive"
+
+
+def test_header_limits_are_tracked_per_model():
+    limiter = _limiter(tpm=10_000)
+    limiter.update_from_headers({"x-ratelimit-limit-tokens": "2000000", "x-ratelimit-remaining-tokens": "1999000"},
+                                200, model="gpt-4o-mini")
+    limiter.update_from_headers({"x-ratelimit-limit-tokens": "30000", "x-ratelimit-remaining-tokens": "4000"}, 200)
+
+    models = limiter.get_stats()["models"]
+    assert models["gpt-4o-mini"]["tpm_limit"] == 2_000_000
+    assert models["gpt-4o"]["tpm_limit"] == 30_000
+    assert models["gpt-4o"]["tpm_available"] == pytest.approx(4000, abs=5)
+
+
+def test_429_pauses_only_that_model():
+    limiter = _limiter()
+    limiter.update_from_headers({"retry-after": "5"}, 429, model="gpt-4o")
+
+    async def main():
+        await asyncio.wait_for(limiter.acquire(10, model="gpt-4o-mini"), timeout=1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(10, model="gpt-4o"), timeout=0.1)
+
+    asyncio.run(main())
+    stats = limiter.get_stats()
+    assert stats["throttled_responses"] == 1
+    assert stats["models"]["gpt-4o"]["paused_for_seconds"] > 4
+    assert stats["queue_depth"] == 0
+
+
+def test_responses_are_attributed_to_the_model_of_the_enclosing_limit(monkeypatch):
+    limiter = _limiter()
+    monkeypatch.setattr(openai_client, "openai_rate_limiter", limiter)
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    async def call():
+        async with limiter.limit(10, model="gpt-4o-mini"):
+            await openai_client._observe_rate_limits(
+                httpx.Response(200, headers={"x-ratelimit-limit-tokens": "5000"}, request=request)
+            )
+        # e.g. a Batch API file upload, made outside the limiter
+        await openai_client._observe_rate_limits(
+            httpx.Response(200, headers={"x-ratelimit-limit-tokens": "7000"}, request=request)
+        )
+
+    asyncio.run(call())
+    models = limiter.get_stats()["models"]
+    assert models["gpt-4o-mini"]["tpm_limit"] == 5000
+    assert models["gpt-4o"]["tpm_limit"] == 7000
+
+
+def test_request_priority_applies_to_tasks_spawned_in_the_block():
+    async def call():
+        with request_priority(RequestPriority.INTERACTIVE):
+            inside = await asyncio.ensure_future(asyncio.sleep(0, current_priority()))
+        return inside, current_priority()
+
+    assert asyncio.run(call()) == (RequestPriority.INTERACTIVE, RequestPriority.BACKGROUND)
+
+
+@pytest.mark.parametrize(
+    "value, priority",
+    [("interactive", RequestPriority.INTERACTIVE), ("BACKGROUND", RequestPriority.BACKGROUND), (None, RequestPriority.BACKGROUND), ("urgent", RequestPriority.BACKGROUND)],
+)
+def test_priority_is_parsed_from_queue_messages(value, priority):
+    assert RequestPriority.parse(value) == priority
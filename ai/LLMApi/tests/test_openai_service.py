@@ -0,0 +1,151 @@
+import asyncio
+import json
+import time
+
+import httpx
+import openai
+import pytest
+
+from config import settings
+from core.resilience import CircuitBreaker, ResilientDependency, RetryBudget, RetryPolicy
+from services import openai_service as openai_service_module
+from services.openai_service import CV_EXTRACTION_RESPONSE_FORMAT, OpenAIService, _partial_response_format
+
+
+def _objects(schema):
+    if isinstance(schema, dict):
+        if schema.get("type") == "object":
+            yield schema
+        for value in schema.values():
+            yield from _objects(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from _objects(item)
+
+
+def _keys(schema):
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            yield key
+            if key not in ("properties", "$defs"):
+                yield from _keys(value)
+            else:
+                for sub in value.values():
+                    yield from _keys(sub)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from _keys(item)
+
+
+def test_cv_extraction_response_format_is_strict():
+    assert CV_EXTRACTION_RESPONSE_FORMAT["type"] == "json_schema"
+    json_schema = CV_EXTRACTION_RESPONSE_FORMAT["json_schema"]
+    assert json_schema["strict"] is True
+    schema = json_schema["schema"]
+    assert "UserProfileData" in schema["$defs"]
+
+    objects = list(_objects(schema))
+    assert len(objects) > 10
+    for obj in objects:
+        assert obj["additionalProperties"] is False
+        assert obj["required"] == list(obj["properties"])
+    # Optional fields stay nullable but carry no default (strict mode rejects them)
+    assert "default" not in set(_keys(schema))
+    assert {"type": "null"} in schema["$defs"]["UserProfileData"]["properties"]["Name"]["anyOf"]
+
+
+def test_partial_response_format_covers_only_requested_fields():
+    response_format = _partial_response_format("CVSectionExperience", ("Experience",))
+    schema = response_format["json_schema"]["schema"]
+    assert response_format["json_schema"]["name"] == "CVSectionExperience"
+    assert schema["required"] == ["Experience"]
+    assert schema["additionalProperties"] is False
+
+
+# ---------- sectioned extraction ----------
+
+_RESUME = "\n".join([
+    "Ada Lovelace",
+    "Experience",
+    *(f"Analyst {i} at Analytical Engines Ltd, 18{i:02d}-18{i + 1:02d}" for i in range(20)),
+    "Education",
+    *(f"Private tutoring in mathematics, module {i}" for i in range(20)),
+])
+
+
+def _status_error(status: int) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return openai.APIStatusError("error", response=httpx.Response(status, request=request), body=None)
+
+
+@pytest.fixture
+def sectioned(monkeypatch):
+    monkeypatch.setattr(settings, "cv_sectioned_extraction_min_chars", 100)
+    monkeypatch.setattr(settings, "cv_section_min_chars", 10)
+    monkeypatch.setattr(openai_service_module, "openai_resilience", ResilientDependency(
+        "openai-test",
+        RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.002),
+        CircuitBreaker(failure_threshold=10, recovery_seconds=60),
+        RetryBudget(ratio=1.0, min_per_minute=100),
+    ))
+    return OpenAIService()
+
+
+def _fake_completions(service, monkeypatch, behaviour):
+    """Replace the HTTP call: `behaviour[name]` is a list of results/exceptions, one per attempt."""
+    calls, cancelled = {}, []
+
+    async def complete_once(messages, request_id, response_format, operation, model, attempt=None):
+        if attempt is not None:
+            attempt.mark_sent()
+        name = response_format["json_schema"]["name"]
+        attempt = calls[name] = calls.get(name, 0) + 1
+        outcome = behaviour[name][min(attempt, len(behaviour[name])) - 1]
+        try:
+            if isinstance(outcome, float):
+                await asyncio.sleep(outcome)
+                outcome = {}
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return json.dumps(outcome)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    monkeypatch.setattr(service, "_complete_once", complete_once)
+    return calls, cancelled
+
+
+_CORE = {
+    "UserProfile": {"Name": "Ada Lovelace"}, "Candidate": {}, "Skills": [], "CertificationsLicenses": [],
+    "AwardsAchievements": [], "VolunteerExtracurricular": [], "Scoring": [], "Summaries": [], "KeyStrengths": [],
+}
+
+
+def test_sectioned_extraction_retries_only_the_failed_call(sectioned, monkeypatch):
+    calls, _ = _fake_completions(sectioned, monkeypatch, {
+        "CVExtractionCore": [_CORE],
+        "CVSectionExperience": [_status_error(503), {"Experience": [{"Title": "Analyst"}]}],
+        "CVSectionEducation": [{"Education": [{"Institution": "Home"}]}],
+    })
+    result = asyncio.run(sectioned.extract_cv_data_from_text(_RESUME, None, None, request_id="t"))
+
+    assert calls == {"CVExtractionCore": 1, "CVSectionExperience": 2, "CVSectionEducation": 1}
+    assert result["Experience"][0]["Title"] == "Analyst"
+    assert result["Education"][0]["Institution"] == "Home"
+    assert result["UserProfile"]["Name"] == "Ada Lovelace"
+
+
+def test_sectioned_extraction_cancels_sibling_calls_on_failure(sectioned, monkeypatch):
+    calls, cancelled = _fake_completions(sectioned, monkeypatch, {
+        "CVExtractionCore": [10.0],
+        "CVSectionExperience": [10.0],
+        "CVSectionEducation": [_status_error(400)],
+    })
+    started = time.perf_counter()
+    with pytest.raises(openai.APIStatusError):
+        asyncio.run(sectioned.extract_cv_data_from_text(_RESUME, None, None, request_id="t"))
+
+    assert time.perf_counter() - started < 5
+    assert sorted(cancelled) == ["CVExtractionCore", "CVSectionExperience"]
+    assert calls["CVSectionEducation"] == 1
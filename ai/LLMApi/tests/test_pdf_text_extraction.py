@@ -0,0 +1,118 @@
+import io
+from concurrent.futures import Future
+
+import pytest
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.errors import PdfReadError
+
+from scripts.benchmark_pdf_extraction import build_pdf
+from services import pdf_text_extraction
+from services.pdf_text_extraction import PdfPasswordProtectedError, extract_pdf_text, iter_pdf_page_text
+
+
+@pytest.fixture
+def pool():
+    yield
+    pdf_text_extraction._reset_executor()
+
+
+def _first_lines(pages):
+    return [page.splitlines()[0] for page in pages]
+
+
+def _encrypted(raw: bytes, user_password: str) -> bytes:
+    writer = PdfWriter()
+    for page in PdfReader(io.BytesIO(raw)).pages:
+        writer.add_page(page)
+    writer.encrypt(user_password=user_password, owner_password="owner")
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class FailingExecutor:
+    """Pool stand-in: the first range succeeds, the next one fails in the worker."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        if self.submitted:
+            future.set_exception(self.error)
+        else:
+            future.set_result(fn(*args))
+        self.submitted.append(future)
+        return future
+
+
+def test_serial_pages_in_order():
+    pages = list(iter_pdf_page_text(build_pdf(5, lines_per_page=2), workers=1))
+
+    assert _first_lines(pages) == [f"Page {n} line 1: Senior engineer, Python, SQL, Azure, distributed systems"
+                                   for n in range(1, 6)]
+
+
+def test_process_pool_streams_pages_in_order(pool):
+    pages = list(iter_pdf_page_text(build_pdf(12, lines_per_page=2), workers=2, parallel_min_pages=1))
+
+    assert [line.split(":")[0] for line in _first_lines(pages)] == [f"Page {n} line 1" for n in range(1, 13)]
+
+
+def test_page_limit(pool):
+    raw = build_pdf(10, lines_per_page=1)
+
+    assert len(list(iter_pdf_page_text(raw, max_pages=3, workers=1))) == 3
+    assert len(list(iter_pdf_page_text(raw, max_pages=6, workers=2, parallel_min_pages=1))) == 6
+    assert len(list(iter_pdf_page_text(raw, max_pages=0, workers=1))) == 10
+
+
+def test_pool_failure_continues_serially(monkeypatch):
+    executor = FailingExecutor(RuntimeError("worker died"))
+    monkeypatch.setattr(pdf_text_extraction, "_get_executor", lambda: executor)
+
+    pages = list(iter_pdf_page_text(build_pdf(12, lines_per_page=1), workers=2, parallel_min_pages=1))
+
+    assert [line.split(":")[0] for line in _first_lines(pages)] == [f"Page {n} line 1" for n in range(1, 13)]
+    assert len(executor.submitted) > 2
+    assert all(future.done() for future in executor.submitted)
+
+
+def test_corrupt_pdf_raises():
+    raw = build_pdf(2)
+
+    for content in (b"not a pdf", raw[: len(raw) // 2]):
+        with pytest.raises(PdfReadError):
+            extract_pdf_text(content)
+
+
+def test_owner_password_only_pdf_is_read():
+    text = extract_pdf_text(_encrypted(build_pdf(2, lines_per_page=1), user_password=""))
+
+    assert text.startswith("Page 1 line 1")
+
+
+def test_password_protected_pdf_is_rejected_before_the_pool(monkeypatch):
+    monkeypatch.setattr(pdf_text_extraction, "_get_executor", lambda: pytest.fail("pool used"))
+
+    with pytest.raises(PdfPasswordProtectedError):
+        extract_pdf_text(_encrypted(build_pdf(20, lines_per_page=1), user_password="secret"), parallel_min_pages=1)
+
+
+def test_unreadable_page_yields_empty_text(monkeypatch):
+    original = pdf_text_extraction._open_reader
+
+    def broken_page():
+        raise ValueError("bad content stream")
+
+    def open_reader(content):
+        reader = original(content)
+        reader.pages[1].extract_text = broken_page
+        return reader
+
+    monkeypatch.setattr(pdf_text_extraction, "_open_reader", open_reader)
+
+    pages = list(iter_pdf_page_text(build_pdf(3, lines_per_page=1), workers=1))
+
+    assert pages[1] == "" and pages[0].startswith("Page 1") and pages[2].startswith("Page 3")
@@ -0,0 +1,149 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from config import settings
+from core import startup
+from database import ReadReplicaRouter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Replica:
+    """Initializer of a replica whose connections fail while `down` is set."""
+
+    def __init__(self):
+        self.down = False
+        self.initializations = 0
+        self.engine = create_engine("sqlite://", creator=self._connect, poolclass=NullPool)
+
+    def _connect(self):
+        if self.down:
+            raise sqlite3.OperationalError("replica unreachable")
+        return sqlite3.connect(":memory:")
+
+    def __call__(self) -> sessionmaker:
+        self.initializations += 1
+        if self.down:
+            raise sqlite3.OperationalError("replica unreachable")
+        return sessionmaker(bind=self.engine)
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    monkeypatch.setattr(settings, "db_read_replica_retry_seconds", 30.0)
+    monkeypatch.setattr(settings, "db_read_replica_max_lag_seconds", 10.0)
+    monkeypatch.setattr(settings, "db_read_replica_lag_check_seconds", 15.0)
+    # Keep the test routers out of the process-wide warm-up registry
+    monkeypatch.setattr(startup, "_components", {})
+
+
+@pytest.fixture
+def router_parts(engine):
+    clock, replica, lag = _Clock(), _Replica(), {"seconds": 0.0}
+
+    def lag_probe():
+        if isinstance(lag["seconds"], Exception):
+            raise lag["seconds"]
+        return lag["seconds"]
+
+    router = ReadReplicaRouter(
+        initializer=replica, lag_probe=lag_probe, primary=lambda: Session(engine), enabled=True,
+        name="test_read_replica", clock=clock,
+    )
+    return router, clock, replica, lag
+
+
+def _on_replica(router: ReadReplicaRouter) -> bool:
+    db = router.session()
+    try:
+        return bool(db.info.get("read_replica"))
+    finally:
+        db.close()
+
+
+def test_reads_go_to_the_replica_when_it_is_healthy(router_parts):
+    router, _, replica, _ = router_parts
+
+    assert _on_replica(router)
+    assert _on_replica(router)
+    assert replica.initializations == 1
+    stats = router.get_stats()
+    assert (stats["replica_sessions"], stats["primary_sessions"], stats["available"]) == (2, 0, True)
+
+
+def test_unreachable_replica_falls_back_to_the_primary_until_the_retry_interval(router_parts):
+    router, clock, replica, _ = router_parts
+    assert _on_replica(router)
+
+    replica.down = True
+    assert not _on_replica(router)  # connection check failed: this request already reads from the primary
+    replica.down = False
+    clock.now += 29
+    assert not _on_replica(router)  # still inside the retry interval, the replica is not tried
+    clock.now += 1
+    assert _on_replica(router)
+
+    stats = router.get_stats()
+    assert (stats["connect_failures"], stats["primary_sessions"], stats["replica_sessions"]) == (1, 2, 2)
+    assert "replica unreachable" in stats["last_error"]
+
+
+def test_replica_that_fails_to_initialize_is_retried_after_the_interval(router_parts):
+    router, clock, replica, _ = router_parts
+    replica.down = True
+
+    assert not _on_replica(router)
+    assert not _on_replica(router)
+    assert replica.initializations == 1  # not retried inside the interval
+    assert router.get_stats()["available"] is False
+
+    replica.down = False
+    clock.now += 30
+    assert _on_replica(router)
+    assert replica.initializations == 2
+
+
+def test_lagging_replica_is_skipped_until_a_later_probe_sees_it_caught_up(router_parts):
+    router, clock, _, lag = router_parts
+    lag["seconds"] = 45.0
+
+    assert not _on_replica(router)
+    lag["seconds"] = 1.0
+    clock.now += 14
+    assert not _on_replica(router)  # lag is re-measured at most every 15 s
+    clock.now += 1
+    assert _on_replica(router)
+
+    stats = router.get_stats()
+    assert (stats["lag_checks"], stats["lag_fallbacks"], stats["lag_seconds"]) == (2, 2, 1.0)
+
+
+def test_failed_lag_probe_does_not_block_the_replica(router_parts):
+    router, _, _, lag = router_parts
+    lag["seconds"] = RuntimeError("DMV not readable")
+
+    assert _on_replica(router)
+    stats = router.get_stats()
+    assert (stats["lag_check_failures"], stats["lag_seconds"]) == (1, None)
+
+
+def test_disabled_router_always_uses_the_primary(engine):
+    replica = _Replica()
+    router = ReadReplicaRouter(
+        initializer=replica, lag_probe=lambda: 0.0, primary=lambda: Session(engine), enabled=False,
+        name="test_read_replica", clock=_Clock(),
+    )
+
+    assert not _on_replica(router)
+    assert replica.initializations == 0
+    assert router.get_stats()["primary_sessions"] == 1
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from services.request_hedging import RequestHedger
+
+
+def _hedger(**overrides) -> RequestHedger:
+    options = dict(enabled=True, percentile=90, min_samples=5, window=20, max_hedges_per_minute=5)
+    options.update(overrides)
+    return RequestHedger(**options)
+
+
+def _warm(hedger: RequestHedger, key: str, seconds: float, samples: int = 10) -> None:
+    for _ in range(samples):
+        hedger._record_latency(key, seconds)
+
+
+class _Calls:
+    """
+    factory() returning coroutines that wait `queued` seconds (the rate limiter), mark the
+    attempt sent and then sleep for the next scripted duration (or raise it).
+    """
+
+    def __init__(self, *outcomes, queued: float = 0.0):
+        self.outcomes = list(outcomes)
+        self.queued = queued
+        self.started = 0
+        self.cancelled = 0
+
+    def __call__(self, attempt):
+        outcome = self.outcomes[self.started]
+        self.started += 1
+
+        async def call():
+            try:
+                await asyncio.sleep(self.queued)
+                attempt.mark_sent()
+                if isinstance(outcome, BaseException):
+                    await asyncio.sleep(0.01)
+                    raise outcome
+                await asyncio.sleep(outcome)
+                return outcome
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return call()
+
+
+def test_hedge_delay_is_the_latency_percentile():
+    hedger = _hedger(min_samples=3)
+    assert hedger.hedge_delay("k") is None
+    for seconds in (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0):
+        hedger._record_latency("k", seconds)
+    assert hedger.hedge_delay("k") == pytest.approx(0.9)
+    assert hedger.hedge_delay("other") is None
+
+
+def test_latency_window_keeps_recent_samples_only():
+    hedger = _hedger(window=3, min_samples=1, percentile=100)
+    for seconds in (5.0, 0.1, 0.2, 0.3):
+        hedger._record_latency("k", seconds)
+    assert hedger.hedge_delay("k") == pytest.approx(0.3)
+
+
+def test_no_hedge_until_enough_samples():
+    hedger = _hedger()
+    calls = _Calls(0.05)
+    assert asyncio.run(hedger.run("k", calls)) == 0.05
+    assert calls.started == 1
+    assert hedger.get_stats()["fired"] == 0
+
+
+def test_slow_call_is_hedged_and_the_loser_cancelled():
+    hedger = _hedger()
+    _warm(hedger, "k", 0.02)
+    calls = _Calls(5.0, 0.01)
+    assert asyncio.run(hedger.run("k", calls)) == 0.01
+    assert calls.started == 2
+    assert calls.cancelled == 1
+    stats = hedger.get_stats()
+    assert (stats["fired"], stats["won"]) == (1, 1)
+
+
+def test_rate_limiter_queue_time_is_not_a_latency_sample():
+    hedger = _hedger(min_samples=1, percentile=100)
+    asyncio.run(hedger.run("k", _Calls(0.01, queued=0.2)))
+    assert hedger.hedge_delay("k") < 0.1
+
+
+def test_no_hedge_while_the_primary_waits_for_the_rate_limiter():
+    hedger = _hedger()
+    _warm(hedger, "k", 0.02)
+    calls = _Calls(0.01, 0.01, queued=0.2)
+    assert asyncio.run(hedger.run("k", calls)) == 0.01
+    assert calls.started == 1
+    assert hedger.get_stats()["fired"] == 0
+
+
+def test_hedges_are_capped_per_minute():
+    hedger = _hedger(max_hedges_per_minute=1)
+    _warm(hedger, "k", 0.01)
+    asyncio.run(hedger.run("k", _Calls(0.05, 0.04)))
+    calls = _Calls(0.05, 0.04)
+    asyncio.run(hedger.run("k", calls))
+    assert calls.started == 1
+    assert hedger.get_stats()["skipped_budget"] == 1
+
+
+def test_error_is_raised_when_both_requests_fail():
+    hedger = _hedger()
+    _warm(hedger, "k", 0.001)
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedger.run("k", _Calls(RuntimeError("first"), RuntimeError("second"))))
+
+
+def test_cancelling_the_caller_cancels_both_requests():
+    hedger = _hedger()
+    _warm(hedger, "k", 0.01)
+    calls = _Calls(5.0, 5.0)
+
+    async def main():
+        task = asyncio.create_task(hedger.run("k", calls))
+        await asyncio.sleep(0.1)
+        assert calls.started == 2
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.01)
+        # Checked while the loop is still running (asyncio.run cancels leftovers on exit)
+        assert calls.cancelled == 2
+
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import time
+
+import httpx
+import openai
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from core.resilience import (
+    CircuitBreaker, CircuitOpenError, PermanentError, ResilientDependency, RetryBudget, RetryPolicy, classify_error,
+)
+
+
+def _status_error(status: int, headers: dict | None = None) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return openai.APIStatusError("error", response=response, body=None)
+
+
+def _validation_error() -> ValidationError:
+    class Model(BaseModel):
+        value: int
+
+    try:
+        Model.model_validate({"value": "not a number"})
+    except ValidationError as e:
+        return e
+
+
+def _dependency(max_attempts: int = 3, failure_threshold: int = 2, recovery_seconds: float = 60.0) -> ResilientDependency:
+    return ResilientDependency(
+        "test",
+        RetryPolicy(max_attempts=max_attempts, base_delay=0.001, max_delay=0.002),
+        CircuitBreaker(failure_threshold, recovery_seconds),
+        RetryBudget(ratio=1.0, min_per_minute=100),
+    )
+
+
+class _Failing:
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.mark.parametrize("exc, retryable", [
+    (_status_error(429), True),
+    (_status_error(503), True),
+    (_status_error(400), False),
+    (openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com")), True),
+    (TimeoutError(), True),
+    (PermanentError("bad file"), False),
+    (json.JSONDecodeError("Expecting value", "", 0), False),
+    (_validation_error(), False),
+    (ValueError("No parsed output"), False),
+])
+def test_classify_error(exc, retryable):
+    assert classify_error(exc).retryable is retryable
+
+
+def test_retry_after_header_is_honoured():
+    assert classify_error(_status_error(429, {"retry-after": "7"})).retry_after == 7.0
+    assert classify_error(_status_error(429, {"retry-after-ms": "250"})).retry_after == 0.25
+
+
+def test_transient_errors_are_retried():
+    dependency = _dependency(failure_threshold=5)
+    fn = _Failing(_status_error(503), TimeoutError())
+    assert dependency.call(fn) == "ok"
+    assert fn.calls == 3
+    assert dependency.get_stats()["retries"] == 2
+    assert dependency.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_content_errors_are_neither_retried_nor_counted_by_the_breaker():
+    dependency = _dependency(failure_threshold=1)
+    for exc in (json.JSONDecodeError("Expecting value", "", 0), _validation_error()):
+        fn = _Failing(exc)
+        with pytest.raises(type(exc)):
+            dependency.call(fn)
+        assert fn.calls == 1
+    assert dependency.breaker.state == CircuitBreaker.CLOSED
+    assert dependency.get_stats()["retries"] == 0
+
+
+def test_circuit_opens_fails_fast_and_recovers_through_a_probe():
+    dependency = _dependency(max_attempts=1, failure_threshold=2, recovery_seconds=0.05)
+    for _ in range(2):
+        with pytest.raises(openai.APIStatusError):
+            dependency.call(_Failing(_status_error(500)))
+    assert dependency.breaker.state == CircuitBreaker.OPEN
+
+    fn = _Failing()
+    with pytest.raises(CircuitOpenError):
+        dependency.call(fn)
+    assert fn.calls == 0
+
+    time.sleep(0.06)
+    assert dependency.breaker.state == CircuitBreaker.HALF_OPEN
+    assert dependency.call(fn) == "ok"
+    assert dependency.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0.0)
+    breaker.record_failure()
+    assert breaker.allow()  # the probe
+    assert not breaker.allow()  # only one at a time
+    breaker.record_failure()
+    assert breaker._state == CircuitBreaker.OPEN
+
+
+def test_cancelled_probe_does_not_wedge_the_circuit():
+    dependency = _dependency(max_attempts=1, failure_threshold=1, recovery_seconds=0.0)
+    with pytest.raises(openai.APIStatusError):
+        dependency.call(_Failing(_status_error(500)))
+
+    async def main():
+        async def slow_probe():
+            await asyncio.sleep(10)
+
+        probe = asyncio.create_task(dependency.call_async(slow_probe))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        async def ok():
+            return "ok"
+
+        return await dependency.call_async(ok)
+
+    assert asyncio.run(main()) == "ok"
+    assert dependency.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.0, min_per_minute=2)
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_throttling_is_retried_but_does_not_open_the_circuit():
+    dependency = _dependency(max_attempts=1, failure_threshold=1)
+    for exc in (_status_error(429), _status_error(503, {"retry-after": "0"})):
+        assert classify_error(exc).retryable
+        with pytest.raises(openai.APIStatusError):
+            dependency.call(_Failing(exc))
+        assert dependency.breaker.state == CircuitBreaker.CLOSED
+
+    with pytest.raises(openai.APIStatusError):
+        dependency.call(_Failing(_status_error(503)))
+    assert dependency.breaker.state == CircuitBreaker.OPEN
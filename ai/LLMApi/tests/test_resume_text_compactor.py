@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from config import settings
+from services.resume_text_compactor import bundled_encoding_path, compact_resume_text, get_tokenizer
+
+HEADER = "Jane Doe | jane@x.com | +1 555 0100"
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokenizers():
+    get_tokenizer.cache_clear()
+    yield
+    get_tokenizer.cache_clear()
+
+
+def _page(n: int, total: int, body: str) -> str:
+    return f"{HEADER}\nSenior Backend Engineer\n{body}\nConfidential resume\nPage {n} of {total}"
+
+
+def test_first_page_keeps_its_header_and_later_pages_lose_repeats():
+    pages = [_page(1, 3, "Experience\nAcme 2019-2024"), _page(2, 3, "Education\nBSc"), _page(3, 3, "Skills\nPython")]
+
+    text = compact_resume_text(pages, token_budget=0).text
+
+    first, second, third = text.split("\n\n")
+    assert first.splitlines()[:2] == [HEADER, "Senior Backend Engineer"]
+    assert "Page 1 of 3" in first
+    for page in (second, third):
+        assert "Senior Backend Engineer" not in page
+        assert "Confidential resume" not in page
+        assert "Page" not in page
+    assert "Education\nBSc" in second and "Skills\nPython" in third
+
+
+def test_contact_lines_are_never_stripped():
+    pages = [
+        f"jane@x.com\nhttps://linkedin.com/in/janedoe\n+44 20 7946 0958\nBody {n}\nPage {n}" for n in range(1, 4)
+    ]
+
+    text = compact_resume_text(pages, token_budget=0).text
+
+    assert text.count("jane@x.com") == 3
+    assert text.count("linkedin.com/in/janedoe") == 3
+    assert text.count("+44 20 7946 0958") == 3
+    assert text.count("Page") == 1
+
+
+def test_single_page_is_left_alone():
+    text = compact_resume_text([_page(1, 1, "Experience")], token_budget=0).text
+
+    assert text.splitlines() == [HEADER, "Senior Backend Engineer", "Experience", "Confidential resume", "Page 1 of 1"]
+
+
+def test_whitespace_bullets_and_duplicate_pages_are_compacted():
+    page = "Experience\n\n\n●   Built   APIs\n•\tLed a team"
+
+    result = compact_resume_text([page, page], token_budget=0)
+
+    assert result.text == "Experience\n\n- Built APIs\n- Led a team"
+    assert result.tokens_saved > 0
+
+
+def test_budget_truncates_to_the_token_budget():
+    pages = [" ".join(f"word{i}" for i in range(2000))]
+
+    result = compact_resume_text(pages, token_budget=50)
+
+    assert result.truncated
+    assert result.compacted_tokens <= 50
+    assert pages[0].startswith(result.text)
+
+
+def test_text_within_budget_is_not_truncated():
+    result = compact_resume_text(["Short resume"], token_budget=1000)
+
+    assert not result.truncated and result.text == "Short resume"
+
+
+def test_missing_bundled_encoding_falls_back_without_downloading(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "tiktoken_cache_dir", str(tmp_path))
+    import tiktoken.load
+
+    monkeypatch.setattr(tiktoken.load, "read_file", lambda blobpath: pytest.fail(f"downloaded {blobpath}"))
+
+    tokenizer = get_tokenizer("o200k_base")
+
+    assert tokenizer.name == "approx-chars/4"
+    assert tokenizer.count("x" * 40) == 10
+    assert bundled_encoding_path("o200k_base") == os.path.join(
+        str(tmp_path), "fb374d419588a4632f3f557e76b4b70aebbca790"
+    )
+    assert bundled_encoding_path("unknown") is None
@@ -0,0 +1,132 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from database import bulk_insert
+from models.database import Education, Skill
+from services import soft_delete_purge as purge_module
+from services.soft_delete_purge import SoftDeletePurgeService
+
+OLD = datetime.utcnow() - timedelta(days=120)
+RECENT = datetime.utcnow() - timedelta(days=5)
+
+
+class FakeClock:
+    """time stand-in: every monotonic() call advances one second, sleep() is free."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        self.now += 1.0
+        return self.now
+
+    def sleep(self, seconds):
+        pass
+
+
+@pytest.fixture
+def seeded(db):
+    user_id = uuid.uuid4()
+
+    def skills(count, deleted, updated_at):
+        return [{"UserProfileId": user_id, "SkillName": f"Skill {n}", "IsDeleted": deleted, "UpdatedAt": updated_at}
+                for n in range(count)]
+
+    bulk_insert(db, Skill, skills(5, True, OLD) + skills(1, True, RECENT) + skills(2, False, OLD))
+    bulk_insert(db, Education, [
+        {"UserProfileId": user_id, "Degree": f"Degree {n}", "IsDeleted": True, "UpdatedAt": OLD} for n in range(3)
+    ])
+    db.commit()
+    return db
+
+
+def _service(engine, tmp_path, **kwargs) -> SoftDeletePurgeService:
+    return SoftDeletePurgeService(
+        session_factory=lambda: Session(engine), work_dir=str(tmp_path), models=(Skill, Education), **kwargs
+    )
+
+
+def _count(db, model, **filters) -> int:
+    query = select(func.count()).select_from(model)
+    for name, value in filters.items():
+        query = query.where(getattr(model, name) == value)
+    return db.scalar(query)
+
+
+def test_dry_run_counts_without_deleting(engine, seeded, tmp_path):
+    report = _service(engine, tmp_path).run(retention_days=90, dry_run=True)
+
+    assert report.tables == {"Skills": {"eligible": 5}, "Educations": {"eligible": 3}}
+    assert _count(seeded, Skill) == 8
+    assert not os.listdir(tmp_path)
+
+
+def test_purges_old_retired_rows_in_batches(engine, seeded, tmp_path):
+    service = _service(engine, tmp_path)
+
+    report = service.run(retention_days=90, batch_size=2, pause_seconds=0, max_seconds=0, archive=False)
+
+    assert report.completed
+    assert report.tables["Skills"] == {"deleted": 5, "archived": 0, "batches": 3}
+    assert report.tables["Educations"] == {"deleted": 3, "archived": 0, "batches": 2}
+    # Live rows and rows retired inside the retention window stay
+    assert _count(seeded, Skill, IsDeleted=False) == 2
+    assert _count(seeded, Skill, IsDeleted=True) == 1
+    assert _count(seeded, Education) == 0
+    assert service.get_stats()["rows_deleted"] == 8
+    assert not os.path.exists(os.path.join(tmp_path, purge_module._CHECKPOINT_FILE))
+
+
+def test_time_budget_pauses_and_the_next_run_resumes(engine, seeded, tmp_path, monkeypatch):
+    monkeypatch.setattr(purge_module, "time", FakeClock())
+    service = _service(engine, tmp_path)
+
+    # Clock reads: start = 1 (deadline 3.5), then one check per batch at 2, 3, 4 -> two batches run
+    first = service.run(retention_days=90, batch_size=2, pause_seconds=0, max_seconds=2.5, archive=False)
+
+    assert not first.completed
+    assert first.tables["Skills"]["deleted"] == 4
+    assert os.path.exists(os.path.join(tmp_path, purge_module._CHECKPOINT_FILE))
+
+    second = service.run(retention_days=1, batch_size=2, pause_seconds=0, max_seconds=0, archive=False)
+
+    assert second.completed
+    # The checkpointed pass keeps its cutoff: RECENT rows are not swept in by the shorter retention
+    assert second.cutoff == first.cutoff
+    assert (second.tables["Skills"]["deleted"], second.tables["Educations"]["deleted"]) == (1, 3)
+    assert _count(seeded, Skill, IsDeleted=True) == 1
+    stats = service.get_stats()
+    assert (stats["runs"], stats["completed_passes"], stats["rows_deleted"]) == (2, 1, 8)
+
+
+def test_archive_mode_archives_before_deleting(engine, seeded, tmp_path):
+    archived = []
+
+    def archiver(table_name, rows):
+        archived.append((table_name, [row["SkillName"] if table_name == "Skills" else row["Degree"] for row in rows]))
+
+    report = _service(engine, tmp_path, archiver=archiver).run(
+        retention_days=90, batch_size=10, pause_seconds=0, max_seconds=0, archive=True
+    )
+
+    assert report.tables["Skills"] == {"deleted": 5, "archived": 5, "batches": 1}
+    assert [(name, len(rows)) for name, rows in archived] == [("Skills", 5), ("Educations", 3)]
+    assert sorted(archived[0][1]) == [f"Skill {n}" for n in range(5)]
+
+
+def test_failed_archive_keeps_the_batch(engine, seeded, tmp_path):
+    def archiver(table_name, rows):
+        raise RuntimeError("blob storage unavailable")
+
+    with pytest.raises(RuntimeError):
+        _service(engine, tmp_path, archiver=archiver).run(
+            retention_days=90, batch_size=10, pause_seconds=0, max_seconds=0, archive=True
+        )
+
+    assert _count(seeded, Skill) == 8
+    assert _count(seeded, Education) == 3
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from core.startup import LazyComponent
+
+
+def test_get_stats_does_not_wait_for_a_slow_initializer():
+    release = threading.Event()
+    component = LazyComponent("slow", lambda: release.wait(5) and "value")
+    worker = threading.Thread(target=component.get)
+    worker.start()
+    try:
+        while component.get_stats()["attempts"] == 0:
+            pass
+        stats_seen = []
+        reader = threading.Thread(target=lambda: stats_seen.append(component.get_stats()))
+        reader.start()
+        reader.join(timeout=1)
+
+        assert not reader.is_alive()
+        assert stats_seen[0]["state"] == "initializing"
+    finally:
+        release.set()
+        worker.join()
+
+    assert component.get() == "value"
+    assert component.get_stats()["state"] == "ready"
+
+
+def test_failed_initialization_is_retried():
+    outcomes = iter([RuntimeError("unreachable"), "value"])
+
+    def initializer():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    component = LazyComponent("flaky", initializer)
+    with pytest.raises(RuntimeError):
+        component.get()
+    assert component.get_stats()["state"] == "failed"
+    assert component.get_stats()["error"] == "unreachable"
+
+    assert component.get() == "value"
+    stats = component.get_stats()
+    assert (stats["state"], stats["attempts"], stats["error"]) == ("ready", 2, None)